@@ -0,0 +1,194 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from alu.arithmetic_gate import *
+
+
+class Adder(ABC):
+    """
+    덧셈기 구조의 공통 interface
+
+    add 는 MSB 부터의 같은 길이의 비트 List 두 개와 carry_in 을 받아 (합, carry_out) 을 return
+    비트는 Bit 뿐만 아니라 Gate 에 전달할 수 있는 모든 비트 객체 ( BitSlice, Node 등 ) 를 사용할 수 있음
+    모든 구조는 logic_gate, arithmetic_gate 의 Gate 만으로 구성
+    """
+    name = 'adder'
+
+    @abstractmethod
+    def add(self, a: List[Bit], b: List[Bit], carry_in: Bit = Bit()) -> (List[Bit], Bit):
+        """
+        MSB 부터의 같은 길이의 비트 List a, b 와 carry_in 의 덧셈
+        :return: 합 비트 List, carry_out
+        """
+
+    def stats(self, length: int = 32):
+        """
+        length bit 덧셈 한 번의 Gate 실행 횟수와 결과 비트의 논리 깊이
+        :param length: 더할 값의 비트 길이
+        :return: GateReport (gates: Gate 종류별 실행 횟수, depth: 합의 비트별 논리 깊이 + carry_out 의 논리 깊이)
+        """
+        from alu.profiler import measure
+
+        return measure(lambda a, b, c: self.add(a, b, c[0]), length, length, 1)
+
+    @staticmethod
+    def _generate_propagate(a: List[Bit], b: List[Bit]) -> (List[Bit], List[Bit]):
+        """
+        LSB 부터의 generate ( a & b ), propagate ( a ^ b ) 비트
+        """
+        g = [and_gate(a[i], b[i]) for i in range(len(a) - 1, -1, -1)]
+        p = [xor_gate(a[i], b[i]) for i in range(len(a) - 1, -1, -1)]
+        return g, p
+
+    @staticmethod
+    def _sum(p: List[Bit], carries: List[Bit]) -> List[Bit]:
+        """
+        LSB 부터의 propagate 비트와 각 비트에 들어오는 carry 로 MSB 부터의 합을 계산
+        """
+        return [xor_gate(p[i], carries[i]) for i in range(len(p) - 1, -1, -1)]
+
+    def __repr__(self) -> str:
+        return '{}()'.format(self.__class__.__name__)
+
+
+class RippleCarryAdder(Adder):
+    """
+    Ripple-carry 덧셈기
+    LSB 부터 전가산기의 carry 를 다음 전가산기에 전달, 깊이가 길이에 비례
+    """
+    name = 'ripple-carry'
+
+    def add(self, a: List[Bit], b: List[Bit], carry_in: Bit = Bit()) -> (List[Bit], Bit):
+        res = [None] * len(a)
+        c = carry_in
+        for i in range(len(a) - 1, -1, -1):
+            res[i], c = full_adder_gate(a[i], b[i], c)
+        return res, c
+
+
+class CarryLookaheadAdder(Adder):
+    """
+    Carry-lookahead 덧셈기
+    block bit 마다 generate, propagate 로 block 내부의 모든 carry 를 동시에 계산하고
+    block 사이에는 carry 를 ripple 로 전달
+    """
+    name = 'carry-lookahead'
+
+    def __init__(self, block: int = 4):
+        self.block = block
+
+    def add(self, a: List[Bit], b: List[Bit], carry_in: Bit = Bit()) -> (List[Bit], Bit):
+        g, p = self._generate_propagate(a, b)
+        carries = []
+        c = carry_in
+        for start in range(0, len(g), self.block):
+            stop = min(start + self.block, len(g))
+            block_carries = [c]
+            for i in range(start, stop):
+                # c(i+1) = g(i) | p(i) & g(i-1) | ... | p(i) & ... & p(start) & c(start)
+                term = g[i]
+                for j in range(i - 1, start - 1, -1):
+                    chain = g[j]
+                    for k in range(j + 1, i + 1):
+                        chain = and_gate(chain, p[k])
+                    term = or_gate(term, chain)
+                chain = c
+                for k in range(start, i + 1):
+                    chain = and_gate(chain, p[k])
+                block_carries.append(or_gate(term, chain))
+            carries.extend(block_carries[:-1])
+            c = block_carries[-1]
+        return self._sum(p, carries), c
+
+    def __repr__(self) -> str:
+        return '{}(block={})'.format(self.__class__.__name__, self.block)
+
+
+class KoggeStoneAdder(Adder):
+    """
+    Kogge-Stone parallel-prefix 덧셈기
+    log2(길이) 단계마다 모든 비트의 (generate, propagate) 를 거리 2^k 의 비트와 결합
+    깊이는 log2(길이) 에 비례하고 Gate 수가 가장 많음
+    """
+    name = 'kogge-stone'
+
+    def add(self, a: List[Bit], b: List[Bit], carry_in: Bit = Bit()) -> (List[Bit], Bit):
+        g, p = self._generate_propagate(a, b)
+        length = len(g)
+        # carry_in 을 0번 비트의 generate 에 포함
+        big_g = [or_gate(g[0], and_gate(p[0], carry_in))] + g[1:]
+        big_p = p[:]
+        distance = 1
+        while distance < length:
+            next_g, next_p = big_g[:], big_p[:]
+            for i in range(distance, length):
+                next_g[i] = or_gate(big_g[i], and_gate(big_p[i], big_g[i - distance]))
+                next_p[i] = and_gate(big_p[i], big_p[i - distance])
+            big_g, big_p = next_g, next_p
+            distance <<= 1
+        return self._sum(p, [carry_in] + big_g[:-1]), big_g[-1]
+
+
+class BrentKungAdder(Adder):
+    """
+    Brent-Kung parallel-prefix 덧셈기
+    up-sweep 으로 2^k 단위의 prefix 를 만든 뒤 down-sweep 으로 나머지 prefix 를 채움
+    깊이는 약 2 * log2(길이), Gate 수는 길이에 비례
+    """
+    name = 'brent-kung'
+
+    def add(self, a: List[Bit], b: List[Bit], carry_in: Bit = Bit()) -> (List[Bit], Bit):
+        g, p = self._generate_propagate(a, b)
+        length = len(g)
+        big_g = [or_gate(g[0], and_gate(p[0], carry_in))] + g[1:]
+        big_p = p[:]
+
+        distance = 1
+        while distance < length:
+            for i in range(2 * distance - 1, length, 2 * distance):
+                big_g[i] = or_gate(big_g[i], and_gate(big_p[i], big_g[i - distance]))
+                big_p[i] = and_gate(big_p[i], big_p[i - distance])
+            distance <<= 1
+
+        distance >>= 1
+        while distance >= 1:
+            for i in range(3 * distance - 1, length, 2 * distance):
+                big_g[i] = or_gate(big_g[i], and_gate(big_p[i], big_g[i - distance]))
+                big_p[i] = and_gate(big_p[i], big_p[i - distance])
+            distance >>= 1
+        return self._sum(p, [carry_in] + big_g[:-1]), big_g[-1]
+
+
+class CarrySelectAdder(Adder):
+    """
+    Carry-select 덧셈기
+    block bit 마다 carry_in 이 0인 경우와 1인 경우를 모두 ripple-carry 로 미리 계산하고
+    하위 block 의 carry 가 결정되면 multiplexer 로 결과를 선택
+    """
+    name = 'carry-select'
+
+    def __init__(self, block: int = 8):
+        self.block = block
+        self.ripple = RippleCarryAdder()
+
+    def add(self, a: List[Bit], b: List[Bit], carry_in: Bit = Bit()) -> (List[Bit], Bit):
+        length = len(a)
+        res = [None] * length
+        c = carry_in
+        for stop in range(length, 0, -self.block):
+            start = max(stop - self.block, 0)
+            if stop == length:
+                res[start:stop], c = self.ripple.add(a[start:stop], b[start:stop], c)
+                continue
+            sum0, carry0 = self.ripple.add(a[start:stop], b[start:stop], Bit())
+            sum1, carry1 = self.ripple.add(a[start:stop], b[start:stop], Bit(True))
+            res[start:stop] = [mux_gate(sum0[i], sum1[i], c) for i in range(stop - start)]
+            c = mux_gate(carry0, carry1, c)
+        return res, c
+
+    def __repr__(self) -> str:
+        return '{}(block={})'.format(self.__class__.__name__, self.block)
+
+
+adders = {adder.name: adder for adder in (RippleCarryAdder(), CarryLookaheadAdder(), KoggeStoneAdder(),
+                                          BrentKungAdder(), CarrySelectAdder())}
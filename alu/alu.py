@@ -1,32 +1,239 @@
-from typing import Dict, Callable
+from array import array
+from typing import Dict, Callable, List
 
+from alu.adder import Adder
+from alu.bit_slice import np, pack_lanes, unpack_lanes, pack_word, unpack_word, pack_planes, unpack_planes
+from alu.compiler import GateCompiler
 from alu.control_signal import ControlSignal
+from alu.flags import Flags
 from alu.arithmetic_unit import *
 from alu.logic_unit import *
+from alu.mul_div_unit import *
+from alu.bit_count_unit import *
+from word.word_array import WordArray
+
+
+_BITS = (Bit.ZERO, Bit.ONE)
+
+
+def _values(values) -> List[int]:
+    return values.tolist() if hasattr(values, 'tolist') else [int(value) for value in values]
 
 
 class ALU:
     """
     Arithmetic Logic Unit
+
+    compiled 가 True 일 경우 Gate 네트워크를 컴파일한 Kernel 로 연산 ( packed Word, bit-slicing )
+    Kernel 의 결과는 Gate 를 통한 연산 결과와 비트 단위로 같음
+    cell 이 1보다 클 경우 덧셈, 뺄셈, 증가 연산은 cell bit 덧셈 진리표를 통해 cell bit 씩 연산
+    adder 가 주어질 경우 덧셈, 뺄셈, 증가 연산과 곱셈, 나눗셈의 덧셈은 해당 덧셈기 구조 ( alu.adder ) 로 연산
+    flags 는 마지막 func 연산 결과의 상태 flag ( alu.flags.Flags )
+    recorder 가 주어질 경우 func, func_batch 의 연산을 모두 기록 ( alu.trace.TraceWriter )
     """
 
-    def __init__(self):
+    def __init__(self, compiled: bool = False, cell: int = 1, adder: Adder = None):
+        self.compiled = compiled
+        self.cell = cell
+        self.adder = adder
         self.op: Dict[ControlSignal, Callable] = {
-            ControlSignal.NOT: lambda x, y: invert_32bit(x),
-            ControlSignal.AND: lambda x, y: and_32bit(x, y),
-            ControlSignal.NAND: lambda x, y: nand_32bit(x, y),
-            ControlSignal.OR: lambda x, y: or_32bit(x, y),
-            ControlSignal.NOR: lambda x, y: nor_32bit(x, y),
-            ControlSignal.XOR: lambda x, y: xor_32bit(x, y),
-            ControlSignal.XNOR: lambda x, y: xnor_32bit(x, y),
-            ControlSignal.INC: lambda x, y: incrementer_32bit(x),
-            ControlSignal.DEC: lambda x, y: decrementer_32bit(x),
-            ControlSignal.MINUS: lambda x, y: complementer_32bit(x),
-            ControlSignal.ADD: lambda x, y: adder_32bit(x, y),
-            ControlSignal.SUB: lambda x, y: subtract_32bit(x, y),
-            ControlSignal.LSHIFT: lambda x, y: logical_lshift_32bit(x),
-            ControlSignal.RSHIFT: lambda x, y: logical_rshift_32bit(x),
+            ControlSignal.NOT: lambda x, y, f: invert_32bit(x),
+            ControlSignal.AND: lambda x, y, f: and_32bit(x, y),
+            ControlSignal.NAND: lambda x, y, f: nand_32bit(x, y),
+            ControlSignal.OR: lambda x, y, f: or_32bit(x, y),
+            ControlSignal.NOR: lambda x, y, f: nor_32bit(x, y),
+            ControlSignal.XOR: lambda x, y, f: xor_32bit(x, y),
+            ControlSignal.XNOR: lambda x, y, f: xnor_32bit(x, y),
+            ControlSignal.INC: lambda x, y, f: incrementer_32bit(x, self.cell, self.adder, f),
+            ControlSignal.DEC: lambda x, y, f: decrementer_32bit(x, f),
+            ControlSignal.MINUS: lambda x, y, f: complementer_32bit(x, f),
+            ControlSignal.ADD: lambda x, y, f: adder_32bit(x, y, self.cell, self.adder, f),
+            ControlSignal.SUB: lambda x, y, f: subtract_32bit(x, y, self.cell, self.adder, f),
+            ControlSignal.LSHIFT: lambda x, y, f: logical_lshift_32bit(x, flags=f),
+            ControlSignal.RSHIFT: lambda x, y, f: logical_rshift_32bit(x, flags=f),
+            ControlSignal.SLL: lambda x, y, f: logical_lshift_32bit(x, y, f),
+            ControlSignal.SRL: lambda x, y, f: logical_rshift_32bit(x, y, f),
+            ControlSignal.SRA: lambda x, y, f: arithmetic_rshift_32bit(x, y, f),
+            ControlSignal.ROL: lambda x, y, f: rotate_left_32bit(x, y, f),
+            ControlSignal.ROR: lambda x, y, f: rotate_right_32bit(x, y, f),
+            ControlSignal.MUL: lambda x, y, f: multiplier_32bit(x, y, self.adder),
+            ControlSignal.MULH: lambda x, y, f: multiplier_high_32bit(x, y, self.adder),
+            ControlSignal.DIV: lambda x, y, f: divider_32bit(x, y, self.adder),
+            ControlSignal.REM: lambda x, y, f: remainder_32bit(x, y, self.adder),
+            ControlSignal.CLZ: lambda x, y, f: clz_32bit(x),
+            ControlSignal.CTZ: lambda x, y, f: ctz_32bit(x),
+            ControlSignal.POPCNT: lambda x, y, f: popcount_32bit(x),
+            ControlSignal.PARITY: lambda x, y, f: parity_32bit(x),
         }
+        self.compiler = GateCompiler(self.op)
+        self.flags = Flags()
+        self.numpy_threshold = 128
+        self.recorder = None
+
+    def func(self, x: Word, y: Word, control: ControlSignal, out: Word = None):
+        """
+        control 신호에 해당하는 연산 수행
+        Word 가 BitSlice 로 이루어진 경우 모든 lane 의 연산을 한 번에 수행
+        연산 결과의 상태 flag ( zero, negative, carry, overflow ) 는 같은 연산 중에 flags 에 저장
+        :param x: 연산할 Word 1
+        :param y: 연산할 Word 2
+        :param control: 수행할 연산의 ControlSignal
+        :param out: 결과를 저장할 Word ( WordArray 의 WordView 등 ), 없을 경우 새로운 Word 로 return
+        :return: 연산 결과 Word
+        """
+        flags = self.flags
+        if self.compiled and x.packed and y.packed:
+            value = self.compiler.compile(control, x.length).scalar(x.value, y.value)
+            res = x.new(value)
+            flags.carry = _BITS[value >> x.length & 1]
+            flags.overflow = _BITS[value >> (x.length + 1)]
+        else:
+            flags.clear()
+            res = self.op[control](x, y, flags)
+        flags.set_result(res)
+        if self.recorder is not None and x.packed and y.packed:
+            self.recorder(control, x, y, res)
+        if out is None:
+            return res
+        out.value = res.value
+        return out
+
+    def func_sliced(self, xs: List[int], ys: List[int], control: ControlSignal,
+                    length: int = Word.length) -> List[int]:
+        """
+        여러 개의 독립적인 연산을 bit-slicing 을 통해 한 번에 수행
+        xs[i], ys[i] 의 i 번째 비트들을 BitSlice 로 모아 Gate 를 한 번만 통과시킴
+        결과는 각 연산을 func 로 따로 수행한 결과와 같음
+        :param xs: 연산할 int 값들 1
+        :param ys: 연산할 int 값들 2 (사용하지 않는 연산의 경우 빈 List 가능)
+        :param control: 수행할 연산의 ControlSignal
+        :param length: 연산할 값의 비트 길이
+        :return: 연산 결과 int 값들
+        """
+        return self._sliced(xs, ys, control, length, self.compiled)
+
+    def _sliced(self, xs: List[int], ys: List[int], control: ControlSignal, length: int, compiled: bool) -> List[int]:
+        count = len(xs)
+        ys = list(ys) + [0] * (count - len(ys))
+        if compiled:
+            kernel = self.compiler.compile(control, length)
+            lanes = kernel.lanes(pack_lanes(xs, length), pack_lanes(ys, length), (1 << count) - 1)
+            return unpack_lanes(lanes[2:], count)
+        res = self.func(pack_word(xs, length), pack_word(ys, length), control)
+        return unpack_word(res, count)
+
+    def func_array(self, xs: WordArray, ys: WordArray or None, control: ControlSignal, out: WordArray,
+                   chunk: int = 4096) -> WordArray:
+        """
+        WordArray 에 저장된 값들의 연산을 수행하고 결과를 out 에 저장
+        chunk 개씩 buffer 에서 읽어 func_sliced 로 연산하므로 배열의 크기와 관계 없이 일정한 메모리만 사용
+        :param xs: 연산할 WordArray 1
+        :param ys: 연산할 WordArray 2 (사용하지 않는 연산의 경우 None)
+        :param control: 수행할 연산의 ControlSignal
+        :param out: 결과를 저장할 WordArray
+        :param chunk: 한 번에 연산할 값의 개수
+        :return: out
+        """
+        for start in range(0, len(xs), chunk):
+            stop = min(start + chunk, len(xs))
+            x_vals = xs.items[start:stop].tolist()
+            y_vals = ys.items[start:stop].tolist() if ys is not None else []
+            res = self.func_sliced(x_vals, y_vals, control, xs.length)
+            out.items[start:stop] = array(out.items.format, res)
+        return out
+
+    def _backend(self, count: int, length: int) -> str:
+        if np is not None and count >= self.numpy_threshold and length in WordArray.formats:
+            return 'numpy'
+        return 'lanes'
+
+    def func_batch(self, xs, ys, control: ControlSignal, length: int = Word.length, backend: str = None,
+                   chunk: int = 1 << 16):
+        """
+        배열에 저장된 값들에 대해 같은 연산을 한 번에 수행
+        값마다 func 를 호출하지 않고 컴파일된 Kernel 을 bit-slicing 으로 chunk 개씩 한 번에 실행
+
+        backend
+        - 'numpy': 값들을 numpy bit plane ( pack_planes ) 으로 변환하여 Kernel 을 배열 연산으로 실행
+        - 'lanes': 값들을 int lane ( pack_lanes ) 으로 변환하여 Kernel 을 실행
+        - 'gates': Kernel 대신 Gate 를 통해 연산 ( func_sliced, compiled 무시 )
+        None 일 경우 numpy 가 설치되어 있고 값이 numpy_threshold 개 이상이면 'numpy', 아니면 'lanes'
+
+        :param xs: 연산할 값들 1 (numpy 배열, array, list 등)
+        :param ys: 연산할 값들 2 (사용하지 않는 연산의 경우 None 가능)
+        :param control: 수행할 연산의 ControlSignal
+        :param length: 연산할 값의 비트 길이
+        :param backend: 사용할 backend
+        :param chunk: 한 번에 연산할 값의 개수
+        :return: 연산 결과, xs 가 numpy 배열일 경우 uint{length} numpy 배열, 아니면 array
+        """
+        count = len(xs)
+        if ys is None:
+            ys = [0] * count
+        res = self._batch(xs, ys, control, length, backend or self._backend(count, length), chunk)
+        if self.recorder is not None:
+            self.recorder.write_batch(control, xs, ys, res)
+        return res
+
+    def _batch(self, xs, ys, control: ControlSignal, length: int, backend: str, chunk: int):
+        count = len(xs)
+        as_numpy = np is not None and isinstance(xs, np.ndarray)
+
+        if backend == 'numpy':
+            kernel = self.compiler.compile(control, length)
+            xs, ys = np.asarray(xs), np.asarray(ys)
+            res = np.empty(count, dtype='u{}'.format(length // 8))
+            m = np.uint8(0xff)
+            for start in range(0, count, chunk):
+                stop = min(start + chunk, count)
+                planes = kernel.lanes(pack_planes(xs[start:stop], length), pack_planes(ys[start:stop], length), m)
+                res[start:stop] = unpack_planes(planes[2:], stop - start, length)
+            return res if as_numpy else array(WordArray.formats[length], res.tobytes())
+
+        res = array(WordArray.formats[length]) if length in WordArray.formats else []
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            res.extend(self._sliced(_values(xs[start:stop]), _values(ys[start:stop]), control, length,
+                                    backend == 'lanes'))
+        if as_numpy:
+            return np.asarray(res, dtype='u{}'.format(length // 8))
+        return res
+
+    def execute_batch(self, opcodes, xs, ys, length: int = Word.length, backend: str = None):
+        """
+        서로 다른 연산들을 한 번에 수행
+        같은 연산끼리 모아 연산마다 func_batch 를 한 번씩 실행하고 결과를 원래 순서대로 저장
+
+        :param opcodes: 수행할 연산들의 ControlSignal 또는 opcode ( ControlSignal.code )
+        :param xs: 연산할 값들 1
+        :param ys: 연산할 값들 2
+        :param length: 연산할 값의 비트 길이
+        :param backend: func_batch 에 사용할 backend
+        :return: 연산 결과, xs 가 numpy 배열일 경우 uint{length} numpy 배열, 아니면 array
+        """
+        if np is not None and isinstance(opcodes, np.ndarray):
+            codes = opcodes
+        else:
+            codes = [op.code if isinstance(op, ControlSignal) else int(op) for op in opcodes]
+
+        if np is not None and isinstance(xs, np.ndarray):
+            codes = np.asarray(codes)
+            xs, ys = np.asarray(xs), np.asarray(ys)
+            res = np.zeros(len(xs), dtype='u{}'.format(length // 8))
+            for code in np.unique(codes):
+                index = np.nonzero(codes == code)[0]
+                res[index] = self.func_batch(xs[index], ys[index], ControlSignal.from_code(int(code)),
+                                             length, backend)
+            return res
 
-    def func(self, x: Word, y: Word, control: ControlSignal):
-        return self.op[control](x, y)
+        groups: Dict[int, List[int]] = {}
+        for i, code in enumerate(codes):
+            groups.setdefault(int(code), []).append(i)
+        res = array(WordArray.formats[length], bytes(len(xs) * length // 8)) \
+            if length in WordArray.formats else [0] * len(xs)
+        for code, index in groups.items():
+            values = self.func_batch([xs[i] for i in index], [ys[i] for i in index], ControlSignal.from_code(code),
+                                     length, backend)
+            for i, value in zip(index, values):
+                res[i] = value
+        return res
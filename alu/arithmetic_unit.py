@@ -1,77 +1,108 @@
 from alu.logic_unit import *
 from alu.arithmetic_gate import *
+from alu.adder import Adder
+from alu.flags import Flags
+from alu.truth_table import cell_add
 
 
-def incrementer_32bit(a: Word) -> Word:
+def _add(a: Word, b: Word, carry_in: Bit, cell: int, adder: Adder or None, flags: Flags or None) -> Word:
+    """
+    a + b + carry_in 의 Word, flags 가 주어질 경우 최상위 비트의 carry 로 carry, overflow 를 설정
+    """
+    if cell > 1 and a.packed and b.packed:
+        res, c = cell_add(a.value, b.value, carry_in.val, a.length, cell)
+        word, c = a.new(res), Bit(bool(c))
+    elif adder is not None:
+        res, c = adder.add(list(a.bit_list), list(b.bit_list), carry_in)
+        word = a.new(res)
+    else:
+        word = a.new()
+        c = carry_in
+        for i in range(a.length-1, -1, -1):
+            word[i], c = full_adder_gate(a[i], b[i], c)
+    if flags is not None:
+        flags.set_add(a.msb(), b.msb(), word.msb(), c)
+    return word
+
+
+def incrementer_32bit(a: Word, cell: int = 1, adder: Adder = None, flags: Flags = None) -> Word:
     """
     1을 더하는 연산
 
     :param a: 1을 더할 값 Word
+    :param cell: 1보다 클 경우 packed Word 는 cell bit 덧셈 진리표를 통해 cell bit 씩 연산
+    :param adder: 덧셈기 구조 ( alu.adder ), 없을 경우 ripple-carry
+    :param flags: 주어질 경우 덧셈의 carry, overflow 를 설정
     :return: 1을 더한 값 Word
     """
-    c = Bit(True)
-    word = Word()
-    for i in range(a.length-1, -1, -1):
-        word[i], c = full_adder_gate(a[i], Bit(), c)
-    return word
+    return _add(a, a.new(), Bit(True), cell, adder, flags)
 
 
-def adder_32bit(a: Word, b: Word) -> Word:
+def adder_32bit(a: Word, b: Word, cell: int = 1, adder: Adder = None, flags: Flags = None) -> Word:
     """
-    32 bit 단위의 덧셈 연산
+    Word 단위의 덧셈 연산
     LSB (최하위 비트)에 대해서는 반가산기를 이용한 덧셈 연산을 수행하고
     상위 비트들에 대해서는 전가산기를 통해 하위 비트의 carry 비트 값을 고려해 덧셈 연산
 
     :param a: 덧셈 연산을 수행할 Word 1
     :param b: 덧셈 연산을 수행할 Word 2
+    :param cell: 1보다 클 경우 packed Word 는 cell bit 덧셈 진리표를 통해 cell bit 씩 연산
+    :param adder: 덧셈기 구조 ( alu.adder ), 없을 경우 ripple-carry
+    :param flags: 주어질 경우 덧셈의 carry, overflow 를 설정
     :return: 덧셈 연산 수행 결과 Word
     """
-    word = Word()
+    if (cell > 1 and a.packed and b.packed) or adder is not None:
+        return _add(a, b, Bit(), cell, adder, flags)
+    word = a.new()
     word[-1], c = half_adder_gate(a.lsb(), b.lsb())
     for i in range(a.length-2, -1, -1):
         word[i], c = full_adder_gate(a[i], b[i], c)
+    if flags is not None:
+        flags.set_add(a.msb(), b.msb(), word.msb(), c)
     return word
 
 
-def complementer_32bit(a: Word) -> Word:
+def complementer_32bit(a: Word, flags: Flags = None) -> Word:
     """
-    32 bit 단위의 2의 보수 연산
+    Word 단위의 2의 보수 연산
     뺄셈 연산을 위한 Gate 대신 보수를 취하여 뺄셈을 구현 가능
 
     1의 보수는 0이 +0과 -0의 두 값이 생기기 때문에 모호할 수 있고
     2의 보수는 1 비트를 더 사용할 수 있어 최소값이 1비트 더 큰 수를 가질 수 있음
 
     :param a: 2의 보수 연산을 수행할 Word
+    :param flags: 주어질 경우 0 - a 의 carry, overflow 를 설정
     :return: 2의 보수 연산 수행 결과 Word
     """
     word = invert_32bit(a)
-    one = incrementer_32bit(Word())
-    res = adder_32bit(word, one)
+    one = incrementer_32bit(a.new())
+    res = adder_32bit(word, one, flags=flags)
     return res
 
 
-def decrementer_32bit(a: Word) -> Word:
+def decrementer_32bit(a: Word, flags: Flags = None) -> Word:
     """
     1을 빼는 연산
 
     :param a: 1을 뺄 값 Word
+    :param flags: 주어질 경우 덧셈의 carry, overflow 를 설정
     :return: 1을 뺀 값 Word
     """
-    minus_one = Word([Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True),
-                      Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True),
-                      Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True),
-                      Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True), Bit(True)])
-    return adder_32bit(a, minus_one)
+    minus_one = a.new([Bit(True) for _ in range(a.length)])
+    return adder_32bit(a, minus_one, flags=flags)
 
 
-def subtract_32bit(a: Word, b: Word) -> Word:
+def subtract_32bit(a: Word, b: Word, cell: int = 1, adder: Adder = None, flags: Flags = None) -> Word:
     """
-    32 bit 단위의 뺄셈 연산
+    Word 단위의 뺄셈 연산
     빼는 값에 2의 보수를 취하여 덧셈 연산을 수행
+    2의 보수의 +1 은 LSB 의 carry 로 더하여 a + ~b + 1 을 한 번의 덧셈으로 연산
 
     :param a: 뺄셈 연산을 수행할 Word 1
     :param b: 뺄셈 연산을 수행할 Word 2
+    :param cell: 1보다 클 경우 packed Word 는 a + ~b + 1 을 cell bit 덧셈 진리표를 통해 cell bit 씩 연산
+    :param adder: 덧셈기 구조 ( alu.adder ), 없을 경우 ripple-carry
+    :param flags: 주어질 경우 a + ~b + 1 의 carry (borrow 가 없을 경우 1), overflow 를 설정
     :return: 뺄셈 연산 수행 결과 Word
     """
-    complement = complementer_32bit(b)
-    return adder_32bit(a, complement)
+    return _add(a, invert_32bit(b), Bit(True), cell, adder, flags)
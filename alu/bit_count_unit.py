@@ -0,0 +1,105 @@
+from typing import List
+
+from alu.arithmetic_gate import *
+from word.word import Word
+
+
+def _add_counts(a: List[Bit], b: List[Bit]) -> List[Bit]:
+    """
+    LSB 부터의 같은 길이의 두 개수 a, b 를 더한 길이 + 1 비트의 개수
+    """
+    res = []
+    c = None
+    for x, y in zip(a, b):
+        s, c = half_adder_gate(x, y) if c is None else full_adder_gate(x, y, c)
+        res.append(s)
+    res.append(c)
+    return res
+
+
+def popcount_tree(bits: List[Bit]) -> List[Bit]:
+    """
+    비트들 중 1의 개수를 세는 덧셈기 tree
+    각 비트를 1 비트 개수로 보고 이웃한 개수끼리 더하는 것을 반복하여 log2(길이) 단계로 셈
+    :param bits: 1의 개수를 셀 비트들
+    :return: LSB 부터의 개수 비트들 ( log2(길이) + 1 비트 )
+    """
+    counts = [[bit] for bit in bits]
+    while len(counts) > 1:
+        merged = [_add_counts(counts[i], counts[i + 1]) for i in range(0, len(counts) - 1, 2)]
+        if len(counts) % 2:
+            merged.append(counts[-1] + [Bit()])
+        counts = merged
+    return counts[0]
+
+
+def _count_word(a: Word, count: List[Bit]) -> Word:
+    """
+    LSB 부터의 개수 비트들을 a 와 같은 길이의 Word 로 만듦
+    """
+    count = count[:a.length]
+    return a.new([Bit() for _ in range(a.length - len(count))] + count[::-1])
+
+
+def _prefix_or(bits: List[Bit]) -> List[Bit]:
+    """
+    i 번째 결과가 bits[0] ~ bits[i] 의 OR 인 비트들
+    거리를 2배씩 늘려가며 OR 하므로 log2(길이) 단계
+    """
+    distance = 1
+    while distance < len(bits):
+        bits = [or_gate(bits[i], bits[i - distance]) if i >= distance else bits[i] for i in range(len(bits))]
+        distance <<= 1
+    return bits
+
+
+def popcount_32bit(a: Word) -> Word:
+    """
+    Word 의 1인 비트의 개수 ( population count )
+    :param a: 1의 개수를 셀 Word
+    :return: 1의 개수 Word
+    """
+    if a.packed:
+        return a.new(bin(a.value).count('1'))
+    return _count_word(a, popcount_tree([a[i] for i in range(a.length)]))
+
+
+def clz_32bit(a: Word) -> Word:
+    """
+    Word 의 MSB 부터 연속된 0의 개수 ( count leading zeros ), 0의 경우 길이
+    MSB 부터의 prefix OR 가 0인 자리의 개수를 popcount tree 로 셈
+    :param a: 0의 개수를 셀 Word
+    :return: 0의 개수 Word
+    """
+    if a.packed:
+        return a.new(a.length - a.value.bit_length())
+    seen = _prefix_or([a[i] for i in range(a.length)])
+    return _count_word(a, popcount_tree([not_gate(bit) for bit in seen]))
+
+
+def ctz_32bit(a: Word) -> Word:
+    """
+    Word 의 LSB 부터 연속된 0의 개수 ( count trailing zeros ), 0의 경우 길이
+    LSB 부터의 prefix OR 가 0인 자리의 개수를 popcount tree 로 셈
+    :param a: 0의 개수를 셀 Word
+    :return: 0의 개수 Word
+    """
+    if a.packed:
+        return a.new((a.value & -a.value).bit_length() - 1 if a.value else a.length)
+    seen = _prefix_or([a[i] for i in range(a.length - 1, -1, -1)])
+    return _count_word(a, popcount_tree([not_gate(bit) for bit in seen]))
+
+
+def parity_32bit(a: Word) -> Word:
+    """
+    Word 의 1인 비트의 개수가 홀수인 경우 1 ( LSB ), 아니면 0
+    popcount tree 의 LSB 와 같은 XOR tree 로 계산
+    :param a: parity 를 계산할 Word
+    :return: parity Word
+    """
+    if a.packed:
+        return a.new(bin(a.value).count('1') & 1)
+    bits = [a[i] for i in range(a.length)]
+    while len(bits) > 1:
+        bits = [xor_gate(bits[i], bits[i + 1]) if i + 1 < len(bits) else bits[i] for i in range(0, len(bits), 2)]
+    return _count_word(a, bits)
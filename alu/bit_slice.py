@@ -0,0 +1,163 @@
+from typing import List
+
+from bit.bit import Bit
+from word.word import Word, BitWord
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BitSlice:
+    """
+    여러 개의 독립적인 연산의 같은 위치 비트를 하나의 int 값 (lane) 에 모은 비트
+
+    lane 의 i 번째 비트는 i 번째 연산의 비트 값
+    Gate 들은 Bit 대신 BitSlice 를 받으면 &, |, ~ 연산자를 통해 모든 lane 을 한 번에 계산하므로
+    logic_gate, arithmetic_gate 의 Gate 와 *_32bit 연산을 그대로 사용하여 여러 연산을 동시에 수행 (bit-slicing)
+    """
+    __slots__ = ('val', 'mask')
+
+    def __init__(self, val: int, mask: int):
+        self.val: int = val
+        self.mask: int = mask
+
+    def _lane(self, other: "BitSlice" or Bit) -> int:
+        """
+        상대 비트의 lane 값
+        Bit 는 모든 lane 이 같은 값인 상수로 취급
+        """
+        if other.__class__ is BitSlice:
+            return other.val
+        if other.val:
+            return self.mask
+        return 0
+
+    def __invert__(self) -> "BitSlice":
+        return BitSlice(self.val ^ self.mask, self.mask)
+
+    def __and__(self, other: "BitSlice" or Bit) -> "BitSlice":
+        return BitSlice(self.val & self._lane(other), self.mask)
+
+    def __or__(self, other: "BitSlice" or Bit) -> "BitSlice":
+        return BitSlice(self.val | self._lane(other), self.mask)
+
+    def __xor__(self, other: "BitSlice" or Bit) -> "BitSlice":
+        return BitSlice(self.val ^ self._lane(other), self.mask)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __repr__(self) -> str:
+        return 'BitSlice({})'.format(bin(self.val))
+
+
+def pack_lanes(values: List[int], length: int = Word.length) -> List[int]:
+    """
+    int 값들을 length 개의 lane 값으로 변환 (전치)
+    결과의 index 0 이 MSB 이며 각 lane 의 j 번째 비트가 values[j] 의 비트
+    비트마다 반복하지 않도록 2진수 문자열을 zip 으로 전치
+
+    :param values: 동시에 연산할 int 값들
+    :param length: 값의 비트 길이
+    :return: MSB 부터 LSB 까지 length 개의 lane 값
+    """
+    if not values:
+        return [0] * length
+    value_mask = (1 << length) - 1
+    form = '0{}b'.format(length)
+    rows = [format(value & value_mask, form) for value in values]
+    return [int(''.join(column)[::-1], 2) for column in zip(*rows)]
+
+
+def unpack_lanes(lanes: List[int], count: int) -> List[int]:
+    """
+    lane 값들을 count 개의 int 값으로 변환 (pack_lanes 의 역변환)
+
+    :param lanes: MSB 부터 LSB 까지의 lane 값
+    :param count: lane 의 개수 (연산의 개수)
+    :return: count 개의 int 값
+    """
+    if not count:
+        return []
+    mask = (1 << count) - 1
+    form = '0{}b'.format(count)
+    columns = [format(lane & mask, form)[::-1] for lane in lanes]
+    return [int(''.join(row), 2) for row in zip(*columns)]
+
+
+def pack_bit_slices(values: List[int], length: int = Word.length) -> List[BitSlice]:
+    """
+    int 값들을 length 개의 BitSlice 로 변환
+    :param values: 동시에 연산할 int 값들
+    :param length: 값의 비트 길이
+    :return: MSB 부터 LSB 까지 length 개의 BitSlice
+    """
+    mask = (1 << len(values)) - 1
+    return [BitSlice(lane, mask) for lane in pack_lanes(values, length)]
+
+
+def unpack_bit_slices(bits: List[BitSlice or Bit], count: int) -> List[int]:
+    """
+    BitSlice 들을 count 개의 int 값으로 변환 (pack_bit_slices 의 역변환)
+    상수 Bit 는 모든 lane 이 같은 값인 BitSlice 로 취급
+
+    :param bits: MSB 부터 LSB 까지의 BitSlice 또는 Bit
+    :param count: lane 의 개수 (연산의 개수)
+    :return: count 개의 int 값
+    """
+    mask = (1 << count) - 1
+    lanes = [bit.val if bit.__class__ is BitSlice else (mask if bit.val else 0) for bit in bits]
+    return unpack_lanes(lanes, count)
+
+
+def pack_word(values: List[int], length: int = Word.length) -> BitWord:
+    """
+    int 값들을 BitSlice 로 이루어진 BitWord 로 변환
+    ALU.func 에 그대로 전달하여 모든 값에 대한 연산을 한 번에 수행
+    """
+    return BitWord(pack_bit_slices(values, length), length)
+
+
+def unpack_word(word: Word, count: int) -> List[int]:
+    """
+    BitSlice 로 이루어진 Word 를 count 개의 int 값으로 변환
+    """
+    return unpack_bit_slices(word.bit_list, count)
+
+
+def pack_planes(values, length: int = Word.length) -> "np.ndarray":
+    """
+    numpy 정수 배열을 length 개의 bit plane 으로 변환 (전치)
+    결과의 행 i 는 MSB 부터 i 번째 비트들을 np.packbits 로 8개씩 묶은 uint8 배열이며
+    lane 값 대신 컴파일된 Kernel 의 lanes 에 그대로 전달할 수 있음
+
+    :param values: 동시에 연산할 정수 값들 (numpy 배열 또는 buffer)
+    :param length: 값의 비트 길이 (8, 16, 32, 64)
+    :return: (length, ceil(N / 8)) 모양의 uint8 배열
+    """
+    if np is None:
+        raise ImportError('bit plane 을 사용하기 위해서는 numpy 가 필요함')
+    data = np.asarray(values).astype('>u{}'.format(length // 8))
+    bits = np.unpackbits(data.view(np.uint8).reshape(len(data), length // 8), axis=1)
+    return np.packbits(bits.T, axis=1)
+
+
+def unpack_planes(planes: list, count: int, length: int = Word.length) -> "np.ndarray":
+    """
+    bit plane 들을 count 개의 정수 값으로 변환 (pack_planes 의 역변환)
+    상수 0 과 255 ( Kernel 의 상수 출력 ) 는 모든 lane 이 같은 값인 plane 으로 취급
+
+    :param planes: MSB 부터 LSB 까지의 bit plane 또는 상수
+    :param count: 값의 개수
+    :param length: 값의 비트 길이 (8, 16, 32, 64)
+    :return: count 개의 값을 가지는 uint{length} 배열
+    """
+    rows = np.empty((length, (count + 7) // 8), dtype=np.uint8)
+    for i, plane in enumerate(planes):
+        rows[i] = plane
+    bits = np.unpackbits(rows, axis=1, count=count)
+    data = np.ascontiguousarray(np.packbits(bits.T, axis=1))
+    return data.view('>u{}'.format(length // 8)).reshape(count).astype('u{}'.format(length // 8))
@@ -0,0 +1,231 @@
+from typing import Callable, Dict, List, Tuple
+
+from alu.flags import Flags
+from bit.bit import Bit
+from word.word import Word, BitWord
+
+
+class Node:
+    """
+    Gate 네트워크 (DAG) 의 한 정점
+
+    Bit 대신 Gate 에 전달되어 ~, &, |, ^ 연산이 호출될 때마다 계산하지 않고 Graph 에 Gate 를 기록
+    op 는 'x', 'y' (입력 비트), 'not', 'and', 'or', 'xor' 중 하나
+    """
+    __slots__ = ('graph', 'op', 'args', 'index')
+
+    def __init__(self, graph: "Graph", op: str, args: tuple, index: int):
+        self.graph = graph
+        self.op = op
+        self.args = args
+        self.index = index
+
+    def __invert__(self) -> "Node" or Bit:
+        return self.graph.gate('not', self)
+
+    def __and__(self, other: "Node" or Bit) -> "Node" or Bit:
+        return self.graph.gate('and', self, other)
+
+    def __or__(self, other: "Node" or Bit) -> "Node" or Bit:
+        return self.graph.gate('or', self, other)
+
+    def __xor__(self, other: "Node" or Bit) -> "Node" or Bit:
+        return self.graph.gate('xor', self, other)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __repr__(self) -> str:
+        return 'Node({}, {})'.format(self.op, self.index)
+
+
+class Graph:
+    """
+    Gate 함수를 Node 로 실행 (trace) 하여 만든 Gate 네트워크
+
+    Gate 를 추가할 때
+    - 상수 Bit 와의 연산은 상수 또는 입력 Node 로 접고 (constant folding)
+    - x & x, x & ~x, ~~x 등 자명한 Gate 는 단순화하고
+    - 같은 입력의 같은 Gate 는 기존 Node 를 재사용 (common subexpression elimination)
+    """
+    commutative = ('and', 'or', 'xor')
+
+    def __init__(self):
+        self.nodes: List[Node] = []
+        self.table: Dict[tuple, Node] = {}
+
+    def _node(self, op: str, args: tuple, key: tuple) -> Node:
+        node = self.table.get(key)
+        if node is None:
+            node = Node(self, op, args, len(self.nodes))
+            self.nodes.append(node)
+            self.table[key] = node
+        return node
+
+    def input(self, name: str, i: int) -> Node:
+        """
+        입력 Word 의 i 번째 비트에 해당하는 Node
+        :param name: 입력 Word 의 이름 ('x' 또는 'y')
+        :param i: 비트의 index (0 이 MSB)
+        """
+        return self._node(name, (i,), (name, i))
+
+    def gate(self, op: str, a: Node, b: Node or Bit = None) -> Node or Bit:
+        """
+        Gate 를 Graph 에 추가
+        a 는 항상 Node 이고 b 는 Node 또는 상수 Bit
+        :return: Gate 의 결과 Node, 결과가 상수인 경우 Bit
+        """
+        if op == 'not':
+            if a.op == 'not':
+                return a.args[0]
+            return self._node(op, (a,), (op, a.index))
+
+        if b.__class__ is Bit:
+            if op == 'and':
+                return a if b.val else Bit.ZERO
+            if op == 'or':
+                return Bit.ONE if b.val else a
+            return self.gate('not', a) if b.val else a
+
+        if a is b:
+            return Bit.ZERO if op == 'xor' else a
+        if (a.op == 'not' and a.args[0] is b) or (b.op == 'not' and b.args[0] is a):
+            return Bit.ZERO if op == 'and' else Bit.ONE
+
+        if b.index < a.index:
+            a, b = b, a
+        return self._node(op, (a, b), (op, a.index, b.index))
+
+    def live(self, outputs: list) -> List[Node]:
+        """
+        출력에 영향을 주는 Node 만 생성 순서 (위상 정렬 순서) 대로 return
+        출력과 연결되지 않은 Gate 는 제거 (dead gate elimination)
+        """
+        alive = set()
+        stack = [bit for bit in outputs if bit.__class__ is Node]
+        while stack:
+            node = stack.pop()
+            if node.index in alive:
+                continue
+            alive.add(node.index)
+            if node.op not in ('x', 'y'):
+                stack.extend(node.args)
+        return [node for node in self.nodes if node.index in alive]
+
+
+class Kernel:
+    """
+    하나의 ControlSignal, 하나의 Word 길이에 대해 컴파일된 연산
+
+    scalar(x, y) 는 Word 의 int 값 두 개를 받아 결과 int 값을 return
+    ( 결과 위에 carry, overflow 비트가 붙은 값, overflow << (length + 1) | carry << length | 결과 )
+    lanes(x, y, m) 는 BitSlice lane 값 List 두 개와 lane mask 를 받아 overflow, carry, 결과 비트 순서의 lane 값 List 를 return
+    gates 는 최적화 후 남은 Gate 의 종류별 개수
+    """
+
+    def __init__(self, scalar: Callable, lanes: Callable, source: str, gates: Dict[str, int]):
+        self.scalar = scalar
+        self.lanes = lanes
+        self.source = source
+        self.gates = gates
+
+    def gate_count(self) -> int:
+        return sum(self.gates.values())
+
+
+class GateCompiler:
+    """
+    ALU 의 Gate 네트워크를 straight-line python 코드로 컴파일
+
+    ALU 의 연산 ( *_32bit ) 을 입력 비트마다 Node 를 가진 BitWord 로 실행하여 Graph 를 만들고
+    최적화된 Graph 의 Gate 마다 한 줄의 int 비트 연산을 생성하여 함수 호출과 Bit 객체 없이 계산
+    컴파일 결과는 ControlSignal, Word 길이마다 cache
+    """
+
+    def __init__(self, op: Dict):
+        self.op = op
+        self.kernels: Dict[Tuple, Kernel] = {}
+
+    def trace(self, control, length: int = Word.length) -> (Graph, list):
+        """
+        control 에 해당하는 연산의 Gate 네트워크를 생성
+        :param control: Graph 를 만들 ControlSignal
+        :param length: Word 의 비트 길이
+        :return: Graph, overflow, carry 와 MSB 부터의 결과 비트 (Node 또는 상수 Bit)
+        """
+        graph = Graph()
+        x = BitWord([graph.input('x', i) for i in range(length)])
+        y = BitWord([graph.input('y', i) for i in range(length)])
+        flags = Flags()
+        res = self.op[control](x, y, flags)
+        return graph, [flags.overflow, flags.carry] + list(res.bit_list)
+
+    def compile(self, control, length: int = Word.length) -> Kernel:
+        """
+        control 에 해당하는 연산의 Kernel
+        처음 호출할 때 trace 후 python 코드를 생성하여 컴파일하고 이후에는 cache 된 Kernel 을 return
+        """
+        key = (control, length)
+        kernel = self.kernels.get(key)
+        if kernel is None:
+            kernel = self._build(control, length)
+            self.kernels[key] = kernel
+        return kernel
+
+    def _build(self, control, length: int) -> Kernel:
+        graph, outputs = self.trace(control, length)
+        nodes = graph.live(outputs)
+
+        names = {}
+        inputs, body, gates = [], [], {}
+        for node in nodes:
+            if node.op in ('x', 'y'):
+                names[node.index] = '{}{}'.format(node.op, node.args[0])
+                inputs.append(node)
+                continue
+            name = 't{}'.format(node.index)
+            names[node.index] = name
+            gates[node.op] = gates.get(node.op, 0) + 1
+            args = [names[arg.index] for arg in node.args]
+            if node.op == 'not':
+                body.append('    {} = {} ^ m'.format(name, args[0]))
+            else:
+                symbol = {'and': '&', 'or': '|', 'xor': '^'}[node.op]
+                body.append('    {} = {} {} {}'.format(name, args[0], symbol, args[1]))
+
+        def lane_expr(bit):
+            if bit.__class__ is Node:
+                return names[bit.index]
+            return 'm' if bit.val else '0'
+
+        scalar_terms = []
+        constant = 0
+        for i, bit in enumerate(outputs):
+            shift = len(outputs) - 1 - i
+            if bit.__class__ is Node:
+                scalar_terms.append('{} << {}'.format(names[bit.index], shift) if shift else names[bit.index])
+            elif bit.val:
+                constant |= 1 << shift
+        if constant or not scalar_terms:
+            scalar_terms.append(str(constant))
+
+        lanes_source = '\n'.join(
+            ['def lanes(x, y, m):'] +
+            ['    {} = {}[{}]'.format(names[node.index], node.op, node.args[0]) for node in inputs] +
+            body +
+            ['    return [{}]'.format(', '.join(lane_expr(bit) for bit in outputs))]
+        )
+        scalar_source = '\n'.join(
+            ['def scalar(x, y):', '    m = 1'] +
+            ['    {} = {} >> {} & 1'.format(names[node.index], node.op, length - 1 - node.args[0])
+             for node in inputs] +
+            body +
+            ['    return {}'.format(' | '.join(scalar_terms))]
+        )
+        source = scalar_source + '\n\n\n' + lanes_source + '\n'
+        namespace = {}
+        exec(compile(source, '<alu kernel {} {}bit>'.format(getattr(control, 'name', control), length), 'exec'),
+             namespace)
+        return Kernel(namespace['scalar'], namespace['lanes'], source, gates)
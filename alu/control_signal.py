@@ -3,17 +3,52 @@ from bit.bit import Bit
 
 
 class ControlSignal(enum.Enum):
-    NOT = [Bit(), Bit(), Bit(), Bit()]                 # 0
-    AND = [Bit(), Bit(), Bit(), Bit(True)]             # 1
-    NAND = [Bit(), Bit(), Bit(True), Bit()]            # 2
-    OR = [Bit(), Bit(), Bit(True), Bit(True)]          # 3
-    NOR = [Bit(), Bit(True), Bit(), Bit()]             # 4
-    XOR = [Bit(), Bit(True), Bit(), Bit(True)]         # 5
-    XNOR = [Bit(), Bit(True), Bit(True), Bit()]        # 6
-    INC = [Bit(), Bit(True), Bit(True), Bit(True)]     # 7
-    DEC = [Bit(True), Bit(), Bit(), Bit()]             # 8
-    MINUS = [Bit(True), Bit(), Bit(), Bit(True)]       # 9
-    ADD = [Bit(True), Bit(), Bit(True), Bit()]         # 10
-    SUB = [Bit(True), Bit(), Bit(True), Bit(True)]     # 11
-    LSHIFT = [Bit(True), Bit(True), Bit(), Bit()]      # 12
-    RSHIFT = [Bit(True), Bit(True), Bit(), Bit(True)]  # 13
+    NOT = [Bit(), Bit(), Bit(), Bit(), Bit()]                   # 0
+    AND = [Bit(), Bit(), Bit(), Bit(), Bit(True)]               # 1
+    NAND = [Bit(), Bit(), Bit(), Bit(True), Bit()]              # 2
+    OR = [Bit(), Bit(), Bit(), Bit(True), Bit(True)]            # 3
+    NOR = [Bit(), Bit(), Bit(True), Bit(), Bit()]               # 4
+    XOR = [Bit(), Bit(), Bit(True), Bit(), Bit(True)]           # 5
+    XNOR = [Bit(), Bit(), Bit(True), Bit(True), Bit()]          # 6
+    INC = [Bit(), Bit(), Bit(True), Bit(True), Bit(True)]       # 7
+    DEC = [Bit(), Bit(True), Bit(), Bit(), Bit()]               # 8
+    MINUS = [Bit(), Bit(True), Bit(), Bit(), Bit(True)]         # 9
+    ADD = [Bit(), Bit(True), Bit(), Bit(True), Bit()]           # 10
+    SUB = [Bit(), Bit(True), Bit(), Bit(True), Bit(True)]       # 11
+    LSHIFT = [Bit(), Bit(True), Bit(True), Bit(), Bit()]        # 12
+    RSHIFT = [Bit(), Bit(True), Bit(True), Bit(), Bit(True)]    # 13
+    MUL = [Bit(), Bit(True), Bit(True), Bit(True), Bit()]       # 14
+    MULH = [Bit(), Bit(True), Bit(True), Bit(True), Bit(True)]  # 15
+    DIV = [Bit(True), Bit(), Bit(), Bit(), Bit()]               # 16
+    REM = [Bit(True), Bit(), Bit(), Bit(), Bit(True)]           # 17
+    SLL = [Bit(True), Bit(), Bit(), Bit(True), Bit()]           # 18
+    SRL = [Bit(True), Bit(), Bit(), Bit(True), Bit(True)]       # 19
+    SRA = [Bit(True), Bit(), Bit(True), Bit(), Bit()]           # 20
+    ROL = [Bit(True), Bit(), Bit(True), Bit(), Bit(True)]       # 21
+    ROR = [Bit(True), Bit(), Bit(True), Bit(True), Bit()]       # 22
+    CLZ = [Bit(True), Bit(), Bit(True), Bit(True), Bit(True)]   # 23
+    CTZ = [Bit(True), Bit(True), Bit(), Bit(), Bit()]           # 24
+    POPCNT = [Bit(True), Bit(True), Bit(), Bit(), Bit(True)]    # 25
+    PARITY = [Bit(True), Bit(True), Bit(), Bit(True), Bit()]    # 26
+
+    @property
+    def code(self) -> int:
+        """
+        control 비트들을 MSB 부터 읽은 int 값 (opcode)
+        """
+        code = 0
+        for bit in self.value:
+            code = code << 1 | bit.val
+        return code
+
+    @classmethod
+    def from_code(cls, code: int) -> "ControlSignal":
+        """
+        opcode 에 해당하는 ControlSignal
+        :param code: control 비트들을 MSB 부터 읽은 int 값
+        :return: 해당하는 ControlSignal, 없을 경우 ValueError
+        """
+        for signal in cls:
+            if signal.code == code:
+                return signal
+        raise ValueError('{} 에 해당하는 ControlSignal 이 없음'.format(code))
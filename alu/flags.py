@@ -0,0 +1,91 @@
+from alu.logic_gate import *
+from word.word import Word
+
+_BITS = (Bit.ZERO, Bit.ONE)
+
+
+class Flags:
+    """
+    ALU 연산 결과의 상태 flag (status register)
+
+    zero (Z): 결과가 0
+    negative (N): 결과의 MSB (부호 비트)
+    carry (C): 덧셈, 뺄셈의 최상위 비트에서 나온 carry 또는 shift 로 마지막에 밀려난 비트
+    overflow (V): 부호 있는 값으로 본 덧셈, 뺄셈의 overflow
+
+    carry, overflow 는 덧셈기, shifter 가 결과를 계산하면서 만든 carry 로 같은 연산 중에 설정하고
+    carry 를 만들지 않는 연산의 carry, overflow 는 0
+    zero, negative 는 결과 Word 의 값 ( packed Word 는 int 값, 이외의 Word 는 비트 List ) 만 저장해두고
+    필요할 때 계산하므로 flag 를 사용하지 않는 경우에는 비용이 없음
+    각 flag 는 Bit 이며 BitWord 연산의 경우 해당 비트 객체 ( BitSlice 등 )
+    """
+    __slots__ = ('carry', 'overflow', 'value', 'length', 'bits')
+
+    def __init__(self):
+        self.carry = Bit()
+        self.overflow = Bit()
+        self.value = 0
+        self.length = Word.length
+        self.bits = None
+
+    def set_result(self, word: Word):
+        """
+        결과 Word 를 저장
+        이후 Word 의 값이 바뀌어도 flag 는 바뀌지 않음
+        """
+        self.length = word.length
+        if word.packed:
+            self.value = word.value
+            self.bits = None
+        else:
+            self.bits = list(word.bit_list)
+
+    @property
+    def zero(self) -> Bit:
+        """
+        결과가 0인 경우 1
+        packed Word 는 int 값으로, 이외의 Word 는 OR Gate tree 로 계산
+        """
+        if self.bits is None:
+            return _BITS[self.value == 0]
+        bits = self.bits
+        while len(bits) > 1:
+            bits = [or_gate(bits[i], bits[i + 1]) if i + 1 < len(bits) else bits[i] for i in range(0, len(bits), 2)]
+        return not_gate(bits[0])
+
+    @property
+    def negative(self) -> Bit:
+        """
+        결과의 MSB
+        """
+        if self.bits is None:
+            return _BITS[self.value >> (self.length - 1)]
+        return self.bits[0]
+
+    def set_add(self, a_msb: Bit, b_msb: Bit, res_msb: Bit, carry: Bit):
+        """
+        덧셈 a + b 의 carry, overflow 를 설정
+        overflow 는 a, b 의 부호가 같고 결과의 부호가 다른 경우
+        :param a_msb: 더한 값 a 의 MSB
+        :param b_msb: 더한 값 b 의 MSB ( 뺄셈의 경우 반전된 값의 MSB )
+        :param res_msb: 덧셈 결과의 MSB
+        :param carry: 최상위 비트에서 나온 carry
+        """
+        self.carry = carry
+        self.overflow = and_gate(xnor_gate(a_msb, b_msb), xor_gate(res_msb, a_msb))
+
+    def clear(self):
+        """
+        carry, overflow 를 0으로 설정
+        """
+        self.carry = Bit.ZERO
+        self.overflow = Bit.ZERO
+
+    def __int__(self) -> int:
+        """
+        NZCV 순서의 4 bit 값
+        """
+        return self.negative.val << 3 | self.zero.val << 2 | self.carry.val << 1 | self.overflow.val
+
+    def __repr__(self) -> str:
+        return 'Flags(Z={}, N={}, C={}, V={})'.format(self.zero, self.negative, self.carry, self.overflow)
@@ -0,0 +1,172 @@
+import logging
+import random
+from typing import Callable, Dict, List
+
+from alu.alu import ALU
+from alu.control_signal import ControlSignal
+from alu.flags import Flags, _BITS
+from word.word import Word, BitWord
+
+logger = logging.getLogger(__name__)
+
+
+def _add(a: int, b: int, carry_in: int, n: int) -> (int, int, int):
+    """
+    n bit 덧셈 a + b + carry_in 의 (결과, carry, overflow)
+    """
+    total = a + b + carry_in
+    sign = 1 << (n - 1)
+    res = total & ((1 << n) - 1)
+    return res, total >> n, int((a & sign) == (b & sign) and (res & sign) != (a & sign))
+
+
+def _shift(value: int, carry: int) -> (int, int, int):
+    return value, carry, 0
+
+
+def _rotate(x: int, s: int, n: int) -> int:
+    return (x << s | x >> (n - s)) & ((1 << n) - 1)
+
+
+# ControlSignal 별 int 연산, (x, y, n) -> (결과, carry, overflow)
+# x, y 는 0 이상 2^n 미만의 값이고 결과는 n bit 로 자름
+OPERATIONS: Dict[ControlSignal, Callable[[int, int, int], tuple]] = {
+    ControlSignal.NOT: lambda x, y, n: (~x, 0, 0),
+    ControlSignal.AND: lambda x, y, n: (x & y, 0, 0),
+    ControlSignal.NAND: lambda x, y, n: (~(x & y), 0, 0),
+    ControlSignal.OR: lambda x, y, n: (x | y, 0, 0),
+    ControlSignal.NOR: lambda x, y, n: (~(x | y), 0, 0),
+    ControlSignal.XOR: lambda x, y, n: (x ^ y, 0, 0),
+    ControlSignal.XNOR: lambda x, y, n: (~(x ^ y), 0, 0),
+    ControlSignal.INC: lambda x, y, n: _add(x, 0, 1, n),
+    ControlSignal.DEC: lambda x, y, n: _add(x, (1 << n) - 1, 0, n),
+    ControlSignal.MINUS: lambda x, y, n: _add(~x & ((1 << n) - 1), 0, 1, n),
+    ControlSignal.ADD: lambda x, y, n: _add(x, y, 0, n),
+    ControlSignal.SUB: lambda x, y, n: _add(x, ~y & ((1 << n) - 1), 1, n),
+    ControlSignal.LSHIFT: lambda x, y, n: _shift(x << 1, x >> (n - 1)),
+    ControlSignal.RSHIFT: lambda x, y, n: _shift(x >> 1, x & 1),
+    ControlSignal.SLL: lambda x, y, n: _shift(x << (y & (n - 1)), x >> (n - (y & (n - 1))) & 1 if y & (n - 1) else 0),
+    ControlSignal.SRL: lambda x, y, n: _shift(x >> (y & (n - 1)), x >> ((y & (n - 1)) - 1) & 1 if y & (n - 1) else 0),
+    ControlSignal.SRA: lambda x, y, n: _shift((x - (x >> (n - 1) << n)) >> (y & (n - 1)),
+                                              x >> ((y & (n - 1)) - 1) & 1 if y & (n - 1) else 0),
+    ControlSignal.ROL: lambda x, y, n: _shift(_rotate(x, y & (n - 1), n), _rotate(x, y & (n - 1), n) & 1),
+    ControlSignal.ROR: lambda x, y, n: _shift(_rotate(x, -y & (n - 1), n), _rotate(x, -y & (n - 1), n) >> (n - 1)),
+    ControlSignal.MUL: lambda x, y, n: (x * y, 0, 0),
+    ControlSignal.MULH: lambda x, y, n: (x * y >> n, 0, 0),
+    ControlSignal.DIV: lambda x, y, n: (x // y if y else -1, 0, 0),
+    ControlSignal.REM: lambda x, y, n: (x % y if y else x, 0, 0),
+    ControlSignal.CLZ: lambda x, y, n: (n - x.bit_length(), 0, 0),
+    ControlSignal.CTZ: lambda x, y, n: ((x & -x).bit_length() - 1 if x else n, 0, 0),
+    ControlSignal.POPCNT: lambda x, y, n: (bin(x).count('1'), 0, 0),
+    ControlSignal.PARITY: lambda x, y, n: (bin(x).count('1') & 1, 0, 0),
+}
+
+
+class Mismatch:
+    """
+    빠른 연산과 Gate 연산의 결과가 다른 연산 하나
+    """
+    __slots__ = ('control', 'x', 'y', 'fast', 'gate')
+
+    def __init__(self, control: ControlSignal, x: int, y: int, fast: tuple, gate: tuple):
+        self.control = control
+        self.x = x
+        self.y = y
+        self.fast = fast
+        self.gate = gate
+
+    def __repr__(self) -> str:
+        return 'Mismatch({}, x={:#x}, y={:#x}, fast={}, gate={})'.format(
+            self.control.name, self.x, self.y, self.fast, self.gate)
+
+
+class FunctionalALU:
+    """
+    ControlSignal 의 연산을 Gate 대신 python int 연산으로 수행하는 빠른 ALU
+
+    결과와 상태 flag 는 ALU 와 같고 ( OPERATIONS ) ALU.func, ALU.func_batch 와 같은 방식으로 사용
+    sample_rate 의 비율만큼 같은 연산을 Gate 수준의 ALU ( BitWord 입력 ) 로도 수행하여 결과와 flag 를 비교하고
+    다른 경우 logger 에 경고를 남기고 mismatches 에 저장
+    - checked: Gate 연산으로 비교한 연산 수
+    - mismatch_count: 결과가 다른 연산 수
+    - mismatches: 결과가 다른 연산 ( 최대 limit 개 )
+    """
+
+    def __init__(self, sample_rate: float = 0.0, reference: ALU = None, seed: int = None, limit: int = 100):
+        """
+        :param sample_rate: Gate 연산으로 비교할 연산의 비율 ( 0 ~ 1 )
+        :param reference: 비교에 사용할 ALU, 없을 경우 ALU()
+        :param seed: 비교할 연산을 고르는 난수의 seed
+        :param limit: 저장할 mismatch 의 최대 개수
+        """
+        self.sample_rate = sample_rate
+        self.reference = reference or ALU()
+        self.random = random.Random(seed)
+        self.limit = limit
+        self.flags = Flags()
+        self.checked = 0
+        self.mismatch_count = 0
+        self.mismatches: List[Mismatch] = []
+
+    def func(self, x: Word, y: Word, control: ControlSignal, out: Word = None) -> Word:
+        """
+        control 신호에 해당하는 연산을 int 연산으로 수행
+        결과의 상태 flag 는 flags 에 저장
+        :param x: 연산할 Word 1
+        :param y: 연산할 Word 2
+        :param control: 수행할 연산의 ControlSignal
+        :param out: 결과를 저장할 Word, 없을 경우 새로운 Word 로 return
+        :return: 연산 결과 Word
+        """
+        value, carry, overflow = OPERATIONS[control](x.value, y.value, x.length)
+        res = x.new(value & x.mask())
+        flags = self.flags
+        flags.carry = _BITS[carry]
+        flags.overflow = _BITS[overflow]
+        flags.set_result(res)
+        if self.sample_rate and self.random.random() < self.sample_rate:
+            self.check(x.value, y.value, control, x.length, (res.value, int(flags)))
+        if out is None:
+            return res
+        out.value = res.value
+        return out
+
+    def func_batch(self, xs, ys, control: ControlSignal, length: int = Word.length) -> list:
+        """
+        배열에 저장된 값들에 대해 같은 연산을 int 연산으로 수행 ( flag 는 저장하지 않음 )
+        sample_rate 의 비율만큼 골라 Gate 연산과 결과를 비교
+        :param xs: 연산할 값들 1
+        :param ys: 연산할 값들 2 (사용하지 않는 연산의 경우 None 가능)
+        :param control: 수행할 연산의 ControlSignal
+        :param length: 연산할 값의 비트 길이
+        :return: 연산 결과 int List
+        """
+        op = OPERATIONS[control]
+        mask = (1 << length) - 1
+        xs = [int(x) for x in xs]
+        ys = [0] * len(xs) if ys is None else [int(y) for y in ys]
+        res = [op(x, y, length)[0] & mask for x, y in zip(xs, ys)]
+        if self.sample_rate and res:
+            count = min(len(res), max(1, round(len(res) * self.sample_rate)))
+            for i in self.random.sample(range(len(res)), count):
+                self.check(xs[i], ys[i], control, length, (res[i], None))
+        return res
+
+    def check(self, x: int, y: int, control: ControlSignal, length: int, fast: tuple) -> bool:
+        """
+        같은 연산을 Gate 수준으로 수행하여 빠른 연산의 결과와 비교
+        :param fast: 빠른 연산의 (결과, NZCV flag), flag 가 None 일 경우 결과만 비교
+        :return: 결과가 같은 지 여부
+        """
+        word = Word.of_width(length)
+        res = self.reference.func(BitWord(word(x).bit_list), BitWord(word(y).bit_list), control)
+        gate = (res.value, int(self.reference.flags) if fast[1] is not None else None)
+        self.checked += 1
+        if gate == fast:
+            return True
+        mismatch = Mismatch(control, x, y, fast, gate)
+        self.mismatch_count += 1
+        if len(self.mismatches) < self.limit:
+            self.mismatches.append(mismatch)
+        logger.warning('functional ALU mismatch: %r', mismatch)
+        return False
@@ -1,5 +1,8 @@
 from bit.bit import Bit
 
+_ONE = Bit.ONE
+_ZERO = Bit.ZERO
+
 
 def not_gate(a: Bit) -> Bit:
     """
@@ -8,10 +11,14 @@ def not_gate(a: Bit) -> Bit:
     비트 값이 1일 경우 0인 비트,
     비트 값이 0일 경우 1인 비트를 반환
 
+    Bit 가 아닌 입력 ( BitSlice 등 )은 해당 타입의 연산자로 계산
+
     :param a: NOT Gate의 입력 비트
     :return: Not Gate의 결과 비트
     """
-    return Bit(not a.val)
+    if a.__class__ is Bit:
+        return _ZERO if a.val else _ONE
+    return ~a
 
 
 def and_gate(a: Bit, b: Bit) -> Bit:
@@ -21,11 +28,15 @@ def and_gate(a: Bit, b: Bit) -> Bit:
     a 비트의 값이 1 이면서 b 비트의 값이 1인 경우 1인 비트,
     이 외의 경우에는 0인 비트를 반환
 
+    Bit 가 아닌 입력 ( BitSlice 등 )은 해당 타입의 연산자로 계산
+
     :param a: AND Gate의 입력 비트 1
     :param b: AND Gate의 입력 비트 2
     :return: AND Gate의 결과 비트
     """
-    return Bit(a.val and b.val)
+    if a.__class__ is Bit and b.__class__ is Bit:
+        return _ONE if a.val and b.val else _ZERO
+    return a & b
 
 
 def or_gate(a: Bit, b: Bit) -> Bit:
@@ -35,11 +46,15 @@ def or_gate(a: Bit, b: Bit) -> Bit:
     a 비트의 값, b 비트의 값 둘 중 하나 이상의 비트가 1인 경우 1인 비트,
     이외의 경우에는 0인 비트를 반환
 
+    Bit 가 아닌 입력 ( BitSlice 등 )은 해당 타입의 연산자로 계산
+
     :param a: OR Gate의 입력 비트 1
     :param b: OR Gate의 입력 비트 2
     :return: OR Gate의 결과 비트
     """
-    return Bit(a.val or b.val)
+    if a.__class__ is Bit and b.__class__ is Bit:
+        return _ONE if a.val or b.val else _ZERO
+    return a | b
 
 
 def xor_gate(a: Bit, b: Bit) -> Bit:
@@ -53,7 +68,7 @@ def xor_gate(a: Bit, b: Bit) -> Bit:
     :param b: XOR Gate의 입력 비트 2
     :return: XOR Gate의 결과 비트
     """
-    t1 = and_gate(a, b)
+    t1 = or_gate(a, b)
     t2 = nand_gate(a, b)
     return and_gate(t1, t2)
 
@@ -101,3 +116,19 @@ def xnor_gate(a: Bit, b: Bit) -> Bit:
     :return: XNOR Gate의 결과 비트
     """
     return not_gate(xor_gate(a, b))
+
+
+def mux_gate(a: Bit, b: Bit, select: Bit) -> Bit:
+    """
+    MUX Gate (2:1 multiplexer)
+    select 비트로 두 입력 중 하나를 선택하는 Gate
+
+    select 비트의 값이 0인 경우 a 비트,
+    select 비트의 값이 1인 경우 b 비트를 반환
+
+    :param a: select 가 0일 때 선택되는 입력 비트
+    :param b: select 가 1일 때 선택되는 입력 비트
+    :param select: 선택 비트
+    :return: MUX Gate의 결과 비트
+    """
+    return or_gate(and_gate(a, not_gate(select)), and_gate(b, select))
@@ -1,116 +1,254 @@
 from word.word import Word
 from alu.logic_gate import *
+from alu.flags import Flags
+
+_BITS = (Bit.ZERO, Bit.ONE)
 
 
 def invert_32bit(a: Word) -> Word:
     """
-    32 bit 단위의 invert 연산
+    Word 단위의 invert 연산
     1의 보수 연산으로도 수행
 
     :param a: invert 연산을 수행할 Word
     :return: invert 연산 수행 결과 Word
     """
-    return Word([not_gate(a[i]) for i in range(Word.length)])
+    if a.packed:
+        return a.new(~a.value)
+    return a.new([not_gate(a[i]) for i in range(a.length)])
 
 
 def and_32bit(a: Word, b: Word) -> Word:
     """
-    32 bit 단위의 AND 논리 연산
+    Word 단위의 AND 논리 연산
 
     :param a: AND 논리 연산을 수행할 Word 1
     :param b: AND 논리 연산을 수행할 Word 2
     :return: AND 논리 연산 수행 결과 Word
     """
-    return Word([and_gate(a[i], b[i]) for i in range(Word.length)])
+    if a.packed and b.packed:
+        return a.new(a.value & b.value)
+    return a.new([and_gate(a[i], b[i]) for i in range(a.length)])
 
 
 def or_32bit(a: Word, b: Word) -> Word:
     """
-    32 bit 단위의 OR 논리 연산
+    Word 단위의 OR 논리 연산
 
     :param a: OR 논리 연산을 수행할 Word 1
     :param b: OR 논리 연산을 수행할 Word 2
     :return: OR 논리 연산 수행 결과 Word
     """
-    return Word([or_gate(a[i], b[i]) for i in range(Word.length)])
+    if a.packed and b.packed:
+        return a.new(a.value | b.value)
+    return a.new([or_gate(a[i], b[i]) for i in range(a.length)])
 
 
 def xor_32bit(a: Word, b: Word) -> Word:
     """
-    32 bit 단위의 XOR 논리 연산
+    Word 단위의 XOR 논리 연산
 
     :param a: XOR 논리 연산을 수행할 Word 1
     :param b: XOR 논리 연산을 수행할 Word 2
     :return: XOR 논리 연산 수행 결과 Word
     """
-    return Word([xor_gate(a[i], b[i]) for i in range(Word.length)])
+    if a.packed and b.packed:
+        return a.new(a.value ^ b.value)
+    return a.new([xor_gate(a[i], b[i]) for i in range(a.length)])
 
 
 def nand_32bit(a: Word, b: Word) -> Word:
     """
-    32 bit 단위의 NAND 논리 연산
+    Word 단위의 NAND 논리 연산
 
     :param a: NAND 논리 연산을 수행할 Word 1
     :param b: NAND 논리 연산을 수행할 Word 2
     :return: NAND 논리 연산 수행 결과 Word
     """
-    return Word([nand_gate(a[i], b[i]) for i in range(Word.length)])
+    if a.packed and b.packed:
+        return a.new(~(a.value & b.value))
+    return a.new([nand_gate(a[i], b[i]) for i in range(a.length)])
 
 
 def nor_32bit(a: Word, b: Word) -> Word:
     """
-    32 bit 단위의 NOR 논리 연산
+    Word 단위의 NOR 논리 연산
 
     :param a: NOR 논리 연산을 수행할 Word 1
     :param b: NOR 논리 연산을 수행할 Word 2
     :return: NOR 논리 연산 수행 결과 Word
     """
-    return Word([nor_gate(a[i], b[i]) for i in range(Word.length)])
+    if a.packed and b.packed:
+        return a.new(~(a.value | b.value))
+    return a.new([nor_gate(a[i], b[i]) for i in range(a.length)])
 
 
 def xnor_32bit(a: Word, b: Word) -> Word:
     """
-    32 bit 단위의 XNOR 논리 연산
+    Word 단위의 XNOR 논리 연산
 
     :param a: XNOR 논리 연산을 수행할 Word 1
     :param b: XNOR 논리 연산을 수행할 Word 2
     :return: XNOR 논리 연산 수행 결과 Word
     """
-    return Word([xnor_gate(a[i], b[i]) for i in range(Word.length)])
+    if a.packed and b.packed:
+        return a.new(~(a.value ^ b.value))
+    return a.new([xnor_gate(a[i], b[i]) for i in range(a.length)])
+
+
+def _shift_amount(a: Word, b: Word or None) -> int or Word:
+    """
+    shift 할 비트 수, b 가 없을 경우 1
+    """
+    if b is None:
+        return 1
+    if b.packed:
+        return b.value & (a.length - 1)
+    return b
 
 
-def logical_lshift_32bit(a: Word) -> Word:
+def barrel_shift_32bit(a: Word, b: Word or int, left: bool, fill: Bit = Bit(), rotate: bool = False,
+                       flags: Flags = None) -> Word:
+    """
+    Word 단위의 barrel shift 연산
+    b 의 하위 log2(a.length) 비트를 shift 할 비트 수로 사용
+    k 번째 단계에서는 b 의 k 번째 비트가 1인 경우 2^k 비트만큼 shift 한 값을 mux_gate 로 선택하므로
+    shift 할 비트 수와 관계 없이 log2(a.length) 단계의 mux_gate 만 거침
+
+    shift 의 경우 밀려나는 쪽에 carry 비트를 하나 더 두어 같은 단계에서 함께 shift 하므로
+    마지막에 밀려난 비트가 carry 비트에 남음 (shift 하지 않은 경우 0)
+    rotate 의 경우 carry 는 결과의 LSB (ROL) 또는 MSB (ROR)
+
+    :param a: shift 연산을 수행할 Word
+    :param b: shift 할 비트 수 Word 또는 int
+    :param left: True 일 경우 left-shift, False 일 경우 right-shift
+    :param fill: shift 된 위치를 채울 비트
+    :param rotate: True 일 경우 밀려난 비트로 shift 된 위치를 채움 (rotate)
+    :param flags: 주어질 경우 carry 를 설정
+    :return: shift 연산 수행 결과 Word
     """
-    32 bit 단위의 Logical left-shift 연산
+    length = a.length
+    stages = (length - 1).bit_length()
+    if type(b) == int:
+        amount = [Bit(bool(b >> k & 1)) for k in range(stages)]
+    else:
+        amount = [b[b.length - 1 - k] for k in range(stages)]
+
+    bits = list(a.bit_list)
+    if not rotate:
+        bits = [Bit()] + bits if left else bits + [Bit()]
+    size = len(bits)
+    for k in range(stages):
+        distance = 1 << k
+        shifted = []
+        for i in range(size):
+            j = i + distance if left else i - distance
+            if rotate:
+                shifted.append(bits[j % size])
+            else:
+                shifted.append(bits[j] if 0 <= j < size else fill)
+        bits = [mux_gate(bits[i], shifted[i], amount[k]) for i in range(size)]
+
+    if rotate:
+        carry = bits[-1] if left else bits[0]
+    else:
+        carry, bits = (bits[0], bits[1:]) if left else (bits[-1], bits[:-1])
+    if flags is not None:
+        flags.carry = carry
+    return a.new(bits)
+
+
+def logical_lshift_32bit(a: Word, b: Word = None, flags: Flags = None) -> Word:
+    """
+    Word 단위의 Logical left-shift 연산
     shift 된 위치의 값은 0으로 채워짐
 
     :param a: logical left-shift 연산을 수행할 Word
-    :return: logical left-shift 연산 수핼 결과 Word
+    :param b: shift 할 비트 수 Word (하위 log2(a.length) 비트 사용), 없을 경우 1 비트
+    :param flags: 주어질 경우 마지막에 밀려난 비트로 carry 를 설정
+    :return: logical left-shift 연산 수행 결과 Word
     """
-    # TODO: shift gate를 통한 계산으로 변경 필요
-    # TODO: Barrel shift 구현
-    word = Word()
-    for new_index, old_index in range(1, Word.length):
-        word[new_index] = a[old_index]
-
-    return word
+    amount = _shift_amount(a, b)
+    if a.packed and type(amount) == int:
+        if flags is not None:
+            flags.carry = _BITS[a.value >> (a.length - amount) & 1 if amount else 0]
+        return a.new(a.value << amount)
+    return barrel_shift_32bit(a, amount, True, flags=flags)
 
 
-def logical_rshift_32bit(a: Word) -> Word:
+def logical_rshift_32bit(a: Word, b: Word = None, flags: Flags = None) -> Word:
     """
-    32 bit 단위의 Logical right-shift 연산
+    Word 단위의 Logical right-shift 연산
     shift 된 위치의 값은 0으로 채워짐
 
     :param a: logical right-shift 연산을 수행할 Word
-    :return: logical right-shift 연산 수핼 결과 Word
+    :param b: shift 할 비트 수 Word (하위 log2(a.length) 비트 사용), 없을 경우 1 비트
+    :param flags: 주어질 경우 마지막에 밀려난 비트로 carry 를 설정
+    :return: logical right-shift 연산 수행 결과 Word
+    """
+    amount = _shift_amount(a, b)
+    if a.packed and type(amount) == int:
+        if flags is not None:
+            flags.carry = _BITS[a.value >> (amount - 1) & 1 if amount else 0]
+        return a.new(a.value >> amount)
+    return barrel_shift_32bit(a, amount, False, flags=flags)
+
+
+def arithmetic_rshift_32bit(a: Word, b: Word = None, flags: Flags = None) -> Word:
     """
-    # TODO: shift gate를 통한 계산으로 변경 필요
-    # TODO: Barrel shift 구현
-    word = Word()
-    for new_index, old_index in range(1, Word.length):
-        word[old_index] = a[new_index]
+    Word 단위의 Arithmetic right-shift 연산
+    shift 된 위치의 값은 MSB (부호 비트) 로 채워짐
 
-    return word
+    :param a: arithmetic right-shift 연산을 수행할 Word
+    :param b: shift 할 비트 수 Word (하위 log2(a.length) 비트 사용), 없을 경우 1 비트
+    :param flags: 주어질 경우 마지막에 밀려난 비트로 carry 를 설정
+    :return: arithmetic right-shift 연산 수행 결과 Word
+    """
+    amount = _shift_amount(a, b)
+    if a.packed and type(amount) == int:
+        if flags is not None:
+            flags.carry = _BITS[a.value >> (amount - 1) & 1 if amount else 0]
+        value = a.value - (a.value >> (a.length - 1) << a.length)
+        return a.new(value >> amount)
+    return barrel_shift_32bit(a, amount, False, fill=a.msb(), flags=flags)
+
+
+def rotate_left_32bit(a: Word, b: Word = None, flags: Flags = None) -> Word:
+    """
+    Word 단위의 rotate-left 연산
+    MSB 쪽으로 밀려난 비트가 LSB 쪽을 채움
+
+    :param a: rotate-left 연산을 수행할 Word
+    :param b: rotate 할 비트 수 Word (하위 log2(a.length) 비트 사용), 없을 경우 1 비트
+    :param flags: 주어질 경우 결과의 LSB 로 carry 를 설정
+    :return: rotate-left 연산 수행 결과 Word
+    """
+    amount = _shift_amount(a, b)
+    if a.packed and type(amount) == int:
+        res = a.new(a.value << amount | a.value >> (a.length - amount))
+        if flags is not None:
+            flags.carry = _BITS[res.value & 1]
+        return res
+    return barrel_shift_32bit(a, amount, True, rotate=True, flags=flags)
+
+
+def rotate_right_32bit(a: Word, b: Word = None, flags: Flags = None) -> Word:
+    """
+    Word 단위의 rotate-right 연산
+    LSB 쪽으로 밀려난 비트가 MSB 쪽을 채움
+
+    :param a: rotate-right 연산을 수행할 Word
+    :param b: rotate 할 비트 수 Word (하위 log2(a.length) 비트 사용), 없을 경우 1 비트
+    :param flags: 주어질 경우 결과의 MSB 로 carry 를 설정
+    :return: rotate-right 연산 수행 결과 Word
+    """
+    amount = _shift_amount(a, b)
+    if a.packed and type(amount) == int:
+        res = a.new(a.value >> amount | a.value << (a.length - amount))
+        if flags is not None:
+            flags.carry = _BITS[res.value >> (a.length - 1)]
+        return res
+    return barrel_shift_32bit(a, amount, False, rotate=True, flags=flags)
 
 
 def pass_through_32bit(a: Word) -> Word:
@@ -120,5 +258,7 @@ def pass_through_32bit(a: Word) -> Word:
     :param a: 그대로 반환할 값 Word
     :return: 입력과 같은 값 Word
     """
-    return Word([bit for bit in a.bit_list])
+    if a.packed:
+        return a.new(a.value)
+    return a.new([bit for bit in a.bit_list])
 
@@ -0,0 +1,204 @@
+from typing import List
+
+from alu.adder import Adder, RippleCarryAdder
+from alu.arithmetic_gate import *
+from word.word import Word
+
+
+class BoothMultiplier:
+    """
+    radix-4 Booth 곱셈기 (unsigned)
+
+    곱하는 수를 2 bit 씩 Booth 부호화 ( -2, -1, 0, 1, 2 ) 하여 부분곱의 수를 절반으로 줄이고
+    부분곱들을 Dadda tree ( carry-save 덧셈 ) 로 두 줄이 될 때까지 줄인 뒤 adder 로 한 번 더함
+    부분곱의 부호 확장은 MSB 를 반전하고 상수를 한 번 더하는 방식으로 대신함
+    """
+
+    def __init__(self, adder: Adder = None):
+        self.adder = adder or RippleCarryAdder()
+
+    @staticmethod
+    def _booth(y: List[Bit], i: int) -> (Bit, Bit, Bit):
+        """
+        LSB 부터의 곱하는 수 y 의 i 번째 Booth 자리 ( y[2i+1], y[2i], y[2i-1] ) 부호화
+        :return: one ( |자리| == 1 ), two ( |자리| == 2 ), neg ( 자리 < 0 )
+        """
+        def bit(j):
+            return y[j] if 0 <= j < len(y) else Bit()
+
+        high, mid, low = bit(2 * i + 1), bit(2 * i), bit(2 * i - 1)
+        one = xor_gate(mid, low)
+        two = or_gate(and_gate(high, nor_gate(mid, low)), and_gate(not_gate(high), and_gate(mid, low)))
+        return one, two, high
+
+    def partial_products(self, a: List[Bit], b: List[Bit]) -> List[List[Bit]]:
+        """
+        a * b 의 부분곱 비트들을 자리 ( column ) 별로 모음
+        :param a: 곱해지는 수 (MSB 부터)
+        :param b: 곱하는 수 (MSB 부터)
+        :return: LSB 부터 2 * 길이 개의 column, 각 column 은 해당 자리에 더할 비트들
+        """
+        length = len(a)
+        width = 2 * length
+        x, y = a[::-1], b[::-1]
+        columns: List[List[Bit]] = [[] for _ in range(width)]
+        constant = 0
+        for i in range((length + 2) // 2):
+            one, two, neg = self._booth(y, i)
+            shift = 2 * i
+            # 부분곱 (length + 2 bit 의 2의 보수) = (one ? x : 0) | (two ? 2x : 0) 를 neg 일 경우 반전
+            for j in range(length + 2):
+                if shift + j >= width:
+                    break
+                m = or_gate(and_gate(one, x[j]) if j < length else Bit(),
+                            and_gate(two, x[j - 1]) if 0 < j <= length else Bit())
+                r = xor_gate(m, neg)
+                columns[shift + j].append(not_gate(r) if j == length + 1 else r)
+            columns[shift].append(neg)
+            constant -= 1 << (shift + length + 1)
+        constant &= (1 << width) - 1
+        for j in range(width):
+            if constant >> j & 1:
+                columns[j].append(Bit(True))
+        return columns
+
+    @staticmethod
+    def reduce(columns: List[List[Bit]]) -> List[List[Bit]]:
+        """
+        Dadda tree 로 모든 column 의 높이가 2 이하가 될 때까지 전가산기, 반가산기로 줄임
+        최상위 column 을 넘는 carry 는 버림
+        """
+        heights = [2]
+        while heights[-1] * 3 // 2 < max(map(len, columns)):
+            heights.append(heights[-1] * 3 // 2)
+        for target in reversed(heights):
+            reduced: List[List[Bit]] = [[] for _ in columns]
+            for i, column in enumerate(columns):
+                bits = list(column)
+                while len(bits) + len(reduced[i]) > target and len(bits) >= 2:
+                    if len(bits) + len(reduced[i]) - target >= 2 and len(bits) >= 3:
+                        s, c = full_adder_gate(bits.pop(), bits.pop(), bits.pop())
+                    else:
+                        s, c = half_adder_gate(bits.pop(), bits.pop())
+                    reduced[i].append(s)
+                    if i + 1 < len(columns):
+                        reduced[i + 1].append(c)
+                reduced[i].extend(bits)
+            columns = reduced
+        return columns
+
+    def multiply(self, a: List[Bit], b: List[Bit]) -> List[Bit]:
+        """
+        같은 길이의 두 unsigned 값의 곱
+        :param a: 곱해지는 수 (MSB 부터)
+        :param b: 곱하는 수 (MSB 부터)
+        :return: 2 * 길이 bit 의 곱 (MSB 부터)
+        """
+        columns = self.reduce(self.partial_products(a, b))
+        first = [column[0] if column else Bit() for column in reversed(columns)]
+        second = [column[1] if len(column) > 1 else Bit() for column in reversed(columns)]
+        return self.adder.add(first, second, Bit())[0]
+
+    def stats(self, length: int = 32):
+        """
+        length bit 곱셈 한 번의 Gate 실행 횟수와 곱의 비트별 논리 깊이
+        :param length: 곱할 값의 비트 길이
+        :return: GateReport
+        """
+        from alu.profiler import measure
+
+        return measure(self.multiply, length, length)
+
+
+class ArrayDivider:
+    """
+    non-restoring array 나눗셈기 (unsigned)
+
+    나누어지는 수의 비트를 하나씩 내리며 각 행에서 이전 나머지의 부호에 따라 나누는 수를 빼거나 더함
+    ( controlled add / subtract 행, 나머지를 복원하지 않음 )
+    마지막 나머지가 음수일 경우 나누는 수를 한 번 더해 보정
+    0으로 나눌 경우 몫은 모든 비트가 1, 나머지는 나누어지는 수
+    """
+
+    def __init__(self, adder: Adder = None):
+        self.adder = adder or RippleCarryAdder()
+
+    def divide(self, a: List[Bit], b: List[Bit]) -> (List[Bit], List[Bit]):
+        """
+        같은 길이의 두 unsigned 값의 나눗셈
+        :param a: 나누어지는 수 (MSB 부터)
+        :param b: 나누는 수 (MSB 부터)
+        :return: 몫, 나머지 (MSB 부터)
+        """
+        divisor = [Bit()] + list(b)
+        remainder = [Bit()] * len(divisor)
+        subtract = Bit(True)
+        quotient = []
+        for bit in a:
+            operand = [xor_gate(d, subtract) for d in divisor]
+            remainder, _ = self.adder.add(remainder[1:] + [bit], operand, subtract)
+            subtract = not_gate(remainder[0])
+            quotient.append(subtract)
+        sign = remainder[0]
+        remainder, _ = self.adder.add(remainder, [and_gate(d, sign) for d in divisor], Bit())
+        return quotient, remainder[1:]
+
+    def stats(self, length: int = 32):
+        """
+        length bit 나눗셈 한 번의 Gate 실행 횟수와 몫, 나머지의 비트별 논리 깊이
+        :param length: 나눌 값의 비트 길이
+        :return: GateReport
+        """
+        from alu.profiler import measure
+
+        return measure(self.divide, length, length)
+
+
+def multiplier_32bit(a: Word, b: Word, adder: Adder = None) -> Word:
+    """
+    Word 단위의 곱셈 연산 (곱의 하위 Word)
+
+    :param a: 곱셈 연산을 수행할 Word 1
+    :param b: 곱셈 연산을 수행할 Word 2
+    :param adder: 부분곱의 마지막 덧셈에 사용할 덧셈기 구조, 없을 경우 ripple-carry
+    :return: a * b 의 하위 Word
+    """
+    return a.new(BoothMultiplier(adder).multiply(list(a.bit_list), list(b.bit_list))[a.length:])
+
+
+def multiplier_high_32bit(a: Word, b: Word, adder: Adder = None) -> Word:
+    """
+    Word 단위의 unsigned 곱셈 연산 (곱의 상위 Word)
+
+    :param a: 곱셈 연산을 수행할 Word 1
+    :param b: 곱셈 연산을 수행할 Word 2
+    :param adder: 부분곱의 마지막 덧셈에 사용할 덧셈기 구조, 없을 경우 ripple-carry
+    :return: a * b 의 상위 Word
+    """
+    return a.new(BoothMultiplier(adder).multiply(list(a.bit_list), list(b.bit_list))[:a.length])
+
+
+def divider_32bit(a: Word, b: Word, adder: Adder = None) -> Word:
+    """
+    Word 단위의 unsigned 나눗셈 연산 (몫)
+    0으로 나눌 경우 모든 비트가 1
+
+    :param a: 나누어지는 Word
+    :param b: 나누는 Word
+    :param adder: 각 행의 덧셈에 사용할 덧셈기 구조, 없을 경우 ripple-carry
+    :return: a // b 의 Word
+    """
+    return a.new(ArrayDivider(adder).divide(list(a.bit_list), list(b.bit_list))[0])
+
+
+def remainder_32bit(a: Word, b: Word, adder: Adder = None) -> Word:
+    """
+    Word 단위의 unsigned 나머지 연산
+    0으로 나눌 경우 a
+
+    :param a: 나누어지는 Word
+    :param b: 나누는 Word
+    :param adder: 각 행의 덧셈에 사용할 덧셈기 구조, 없을 경우 ripple-carry
+    :return: a % b 의 Word
+    """
+    return a.new(ArrayDivider(adder).divide(list(a.bit_list), list(b.bit_list))[1])
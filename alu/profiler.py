@@ -0,0 +1,222 @@
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from alu import arithmetic_gate, logic_gate
+from alu.alu import ALU
+from bit.bit import Bit
+from word.word import Word, BitWord
+
+
+class DepthBit:
+    """
+    논리 깊이 (입력에서 거친 Gate 의 수) 를 함께 가지는 비트
+
+    Gate 에 Bit 대신 전달되어 ~, &, |, ^ 연산마다 깊이를 1씩 증가시킴
+    내부 비트 ( bit ) 는 Bit 또는 BitSlice 이며 상수 Bit 의 깊이는 0
+    """
+    __slots__ = ('bit', 'depth')
+
+    def __init__(self, bit, depth: int = 0):
+        self.bit = bit
+        self.depth = depth
+
+    @staticmethod
+    def _split(other) -> tuple:
+        if other.__class__ is DepthBit:
+            return other.bit, other.depth
+        return other, 0
+
+    def __invert__(self) -> "DepthBit":
+        return DepthBit(~self.bit, self.depth + 1)
+
+    def __and__(self, other) -> "DepthBit":
+        bit, depth = self._split(other)
+        return DepthBit(self.bit & bit, max(self.depth, depth) + 1)
+
+    def __or__(self, other) -> "DepthBit":
+        bit, depth = self._split(other)
+        return DepthBit(self.bit | bit, max(self.depth, depth) + 1)
+
+    def __xor__(self, other) -> "DepthBit":
+        bit, depth = self._split(other)
+        return DepthBit(self.bit ^ bit, max(self.depth, depth) + 1)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __bool__(self) -> bool:
+        return bool(self.bit)
+
+
+class GateReport:
+    """
+    하나의 ControlSignal 에 대한 계측 결과
+
+    calls: ALU.func 호출 횟수
+    gates: Gate 종류별 실행 횟수 (xor_gate 와 같이 다른 Gate 로 이루어진 Gate 는 내부 Gate 도 함께 셈)
+    depth: 결과 Word 의 비트별 논리 깊이의 최대값 (MSB 부터), 기본 Gate (not, and, or) 의 수로 계산
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.gates: Dict[str, int] = defaultdict(int)
+        self.depth: List[int] = []
+
+    def primitive_count(self) -> int:
+        """
+        기본 Gate (not_gate, and_gate, or_gate) 의 실행 횟수
+        """
+        return sum(self.gates.get(name, 0) for name in ('not_gate', 'and_gate', 'or_gate'))
+
+    def critical_path(self) -> int:
+        """
+        결과 비트 중 가장 깊은 비트의 논리 깊이 (critical path)
+        """
+        return max(self.depth, default=0)
+
+    def __repr__(self) -> str:
+        return 'GateReport(calls={}, gates={}, critical_path={})'.format(
+            self.calls, dict(self.gates), self.critical_path())
+
+
+def _flatten(bits) -> list:
+    if isinstance(bits, (list, tuple)):
+        return [bit for item in bits for bit in _flatten(item)]
+    return [bits]
+
+
+def measure(circuit: Callable, *lengths: int) -> GateReport:
+    """
+    비트 List 들로 이루어진 Gate 회로를 한 번 실행하여 Gate 실행 횟수와 출력 비트의 논리 깊이를 계측
+    :param circuit: 비트 List 들을 받아 비트, 비트 List 또는 그 tuple 을 return 하는 함수
+    :param lengths: 입력 비트 List 들의 길이
+    :return: GateReport (depth: 출력 순서대로 펼친 비트들의 논리 깊이)
+    """
+    inputs = [[DepthBit(Bit()) for _ in range(length)] for length in lengths]
+    with GateProfiler() as profiler:
+        outputs = _flatten(circuit(*inputs))
+    report = profiler.reports[None]
+    report.calls = 1
+    report.depth = [bit.depth if bit.__class__ is DepthBit else 0 for bit in outputs]
+    return report
+
+
+class GateProfiler:
+    """
+    ALU 의 Gate 실행 횟수와 결과 비트의 논리 깊이를 계측하는 context manager
+
+    with GateProfiler() as profiler:
+        alu.func(x, y, ControlSignal.ADD)
+    profiler.report()[ControlSignal.ADD]
+
+    with 구문 안에서만 alu 패키지의 Gate 함수와 ALU.func 를 계측 함수로 바꾸고
+    with 구문을 벗어나면 원래 함수로 되돌리므로 사용하지 않을 때에는 비용이 없음
+    계측하는 동안 ALU.func 는 Gate 를 거치도록 Word 를 DepthBit 의 BitWord 로 바꾸어 연산하고
+    ALU.func_sliced 는 컴파일된 Kernel 대신 Gate 를 통해 연산
+    ALU.func 밖에서 직접 실행한 Gate 는 None 에 기록
+    """
+    active = None
+
+    def __init__(self, depth: bool = True):
+        self.track_depth = depth
+        self.reports: Dict[object, GateReport] = defaultdict(GateReport)
+        self._current = self.reports[None]
+        self._patched: List[tuple] = []
+
+    @staticmethod
+    def gate_functions() -> Dict[Callable, str]:
+        """
+        계측할 Gate 함수들
+        """
+        gates = {}
+        for module in (logic_gate, arithmetic_gate):
+            for name, obj in vars(module).items():
+                if name.endswith('_gate') and callable(obj) and obj.__module__ == module.__name__:
+                    gates[obj] = name
+        return gates
+
+    def _count(self, name: str, gate: Callable) -> Callable:
+        def counted(*args):
+            self._current.gates[name] += 1
+            return gate(*args)
+        counted.__name__ = name
+        counted.__wrapped__ = gate
+        return counted
+
+    def _wrap_depth(self, word: Word) -> BitWord:
+        return BitWord([DepthBit(bit) for bit in word.bit_list])
+
+    def _func(self, func: Callable) -> Callable:
+        profiler = self
+
+        def profiled(alu: ALU, x: Word, y: Word, control, out: Word = None):
+            previous = profiler._current
+            report = profiler.reports[control]
+            report.calls += 1
+            profiler._current = report
+            try:
+                if not profiler.track_depth:
+                    return func(alu, x, y, control, out)
+                res = func(alu, profiler._wrap_depth(x), profiler._wrap_depth(y), control)
+            finally:
+                profiler._current = previous
+
+            depth = [bit.depth if bit.__class__ is DepthBit else 0 for bit in res.bit_list]
+            report.depth = [max(pair) for pair in zip(report.depth, depth)] if report.depth else depth
+            bits = [bit.bit if bit.__class__ is DepthBit else bit for bit in res.bit_list]
+            res = x.new(bits) if x.packed else BitWord(bits)
+            flags = alu.flags
+            flags.carry, flags.overflow = [bit.bit if bit.__class__ is DepthBit else bit
+                                           for bit in (flags.carry, flags.overflow)]
+            flags.set_result(res)
+            if out is None:
+                return res
+            out.value = res.value
+            return out
+        profiled.__wrapped__ = func
+        return profiled
+
+    @staticmethod
+    def _func_sliced(func_sliced: Callable) -> Callable:
+        def profiled(alu: ALU, *args, **kwargs):
+            compiled, alu.compiled = alu.compiled, False
+            try:
+                return func_sliced(alu, *args, **kwargs)
+            finally:
+                alu.compiled = compiled
+        profiled.__wrapped__ = func_sliced
+        return profiled
+
+    def __enter__(self) -> "GateProfiler":
+        if GateProfiler.active is not None:
+            raise RuntimeError('GateProfiler 는 동시에 하나만 사용할 수 있음')
+        GateProfiler.active = self
+        gates = self.gate_functions()
+        wrappers = {gate: self._count(name, gate) for gate, name in gates.items()}
+        for module_name, module in list(sys.modules.items()):
+            if module is None or not (module_name == 'alu' or module_name.startswith('alu.')):
+                continue
+            for name, obj in list(vars(module).items()):
+                if callable(obj) and obj in wrappers:
+                    self._patched.append((module, name, obj))
+                    setattr(module, name, wrappers[obj])
+        self._patched.append((ALU, 'func', ALU.func))
+        ALU.func = self._func(ALU.func)
+        self._patched.append((ALU, 'func_sliced', ALU.func_sliced))
+        ALU.func_sliced = self._func_sliced(ALU.func_sliced)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for target, name, obj in reversed(self._patched):
+            setattr(target, name, obj)
+        self._patched = []
+        GateProfiler.active = None
+
+    def report(self) -> Dict[object, GateReport]:
+        """
+        ControlSignal 별 계측 결과
+        ALU.func 밖에서 실행된 Gate 는 None 에 기록
+        """
+        return {key: report for key, report in self.reports.items() if report.calls or report.gates}
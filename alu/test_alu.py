@@ -0,0 +1,480 @@
+import random
+
+import pytest
+from alu.alu import ALU
+from alu.control_signal import ControlSignal
+from bit.bit import Bit
+from word.word import Word, BitWord, Word8, Word64
+
+MASK = 2**Word.length - 1
+
+
+def expected(x: int, y: int, control: ControlSignal, mask: int = MASK) -> int:
+    length = mask.bit_length()
+    shift = y & (length - 1)
+    signed = x - (x >> (length - 1) << length)
+    return {
+        ControlSignal.NOT: ~x,
+        ControlSignal.AND: x & y,
+        ControlSignal.NAND: ~(x & y),
+        ControlSignal.OR: x | y,
+        ControlSignal.NOR: ~(x | y),
+        ControlSignal.XOR: x ^ y,
+        ControlSignal.XNOR: ~(x ^ y),
+        ControlSignal.INC: x + 1,
+        ControlSignal.DEC: x - 1,
+        ControlSignal.MINUS: -x,
+        ControlSignal.ADD: x + y,
+        ControlSignal.SUB: x - y,
+        ControlSignal.MUL: x * y,
+        ControlSignal.MULH: x * y >> mask.bit_length(),
+        ControlSignal.DIV: x // y if y else mask,
+        ControlSignal.REM: x % y if y else x,
+        ControlSignal.LSHIFT: x << 1,
+        ControlSignal.RSHIFT: x >> 1,
+        ControlSignal.SLL: x << shift,
+        ControlSignal.SRL: x >> shift,
+        ControlSignal.SRA: signed >> shift,
+        ControlSignal.ROL: x << shift | x >> (length - shift),
+        ControlSignal.ROR: x >> shift | x << (length - shift),
+        ControlSignal.CLZ: length - x.bit_length(),
+        ControlSignal.CTZ: (x & -x).bit_length() - 1 if x else length,
+        ControlSignal.POPCNT: bin(x).count('1'),
+        ControlSignal.PARITY: bin(x).count('1') % 2,
+    }[control] & mask
+
+
+SIGNALS = [ControlSignal.NOT, ControlSignal.AND, ControlSignal.NAND, ControlSignal.OR, ControlSignal.NOR,
+           ControlSignal.XOR, ControlSignal.XNOR, ControlSignal.INC, ControlSignal.DEC, ControlSignal.MINUS,
+           ControlSignal.ADD, ControlSignal.SUB, ControlSignal.MUL, ControlSignal.MULH, ControlSignal.DIV,
+           ControlSignal.REM, ControlSignal.SLL, ControlSignal.SRL, ControlSignal.SRA, ControlSignal.ROL,
+           ControlSignal.ROR, ControlSignal.CLZ, ControlSignal.CTZ, ControlSignal.POPCNT, ControlSignal.PARITY]
+VALUES = [0, 1, 2, 5, 0x7fffffff, 0x80000000, 0xffffffff, 0x12345678]
+
+
+def test_alu_func():
+    alu = ALU()
+    for control in SIGNALS:
+        for x in VALUES:
+            y = VALUES[(x + 3) % len(VALUES)]
+            assert int(alu.func(Word(x), Word(y), control)) == expected(x, y, control)
+
+
+def test_alu_func_gate():
+    alu = ALU()
+    for control in SIGNALS:
+        for x in VALUES:
+            y = VALUES[(x + 5) % len(VALUES)]
+            res = alu.func(BitWord(Word(x).bit_list), BitWord(Word(y).bit_list), control)
+            assert isinstance(res, BitWord)
+            assert res.value == expected(x, y, control)
+
+
+def test_alu_func_width():
+    alu = ALU()
+    for word, mask in ((Word8, 0xff), (Word64, 2**64 - 1)):
+        for control in SIGNALS:
+            x, y = 0x0123456789abcdef & mask, 0xfedcba9876543210 & mask
+            res = alu.func(word(x), word(y), control)
+            assert isinstance(res, word)
+            assert int(res) == expected(x, y, control, mask)
+
+
+def test_alu_func_sliced():
+    alu = ALU()
+    rand = random.Random(4)
+    xs = VALUES + [rand.getrandbits(32) for _ in range(200)]
+    ys = VALUES[::-1] + [rand.getrandbits(32) for _ in range(200)]
+    for control in SIGNALS:
+        assert alu.func_sliced(xs, ys, control) == [expected(x, y, control) for x, y in zip(xs, ys)]
+
+
+def test_alu_func_shift():
+    alu = ALU()
+    assert int(alu.func(Word(0x80000003), Word(), ControlSignal.LSHIFT)) == 6
+    assert int(alu.func(Word(0x80000003), Word(), ControlSignal.RSHIFT)) == 0x40000001
+    res = alu.func(BitWord(Word(0x80000003).bit_list), Word(), ControlSignal.LSHIFT)
+    assert res.value == 6
+
+    x = BitWord(Word(0x80000003).bit_list)
+    for amount in (0, 1, 5, 31, 32, 37):
+        for control in (ControlSignal.SLL, ControlSignal.SRL, ControlSignal.SRA, ControlSignal.ROL, ControlSignal.ROR):
+            assert alu.func(x, BitWord(Word(amount).bit_list), control).value == expected(x.value, amount, control)
+            assert alu.func(x, Word(amount), control).value == expected(x.value, amount, control)
+
+    from alu.profiler import GateProfiler
+    with GateProfiler() as profiler:
+        alu.func(Word(0x80000003), Word(7), ControlSignal.ROR)
+    assert profiler.report()[ControlSignal.ROR].gates['mux_gate'] == 5 * 32
+    assert profiler.report()[ControlSignal.ROR].critical_path() <= 5 * 3
+
+
+def test_alu_func_out():
+    from word.word_array import WordArray
+
+    alu = ALU()
+    words = WordArray.zeros(2)
+    words[0] = 7
+    res = alu.func(words[0], Word(5), ControlSignal.ADD, out=words[1])
+    assert res.value == 12
+    assert words.items.tolist() == [7, 12]
+
+    out = BitWord()
+    bit_list = out.bit_list
+    res = alu.func(Word(0xfffffffe), Word(3), ControlSignal.ADD, out=out)
+    assert res is out and out.value == 1 and out.bit_list is bit_list
+
+
+def test_alu_func_array(tmp_path):
+    import mmap
+    from array import array
+    from word.word_array import WordArray
+
+    rand = random.Random(6)
+    xs = [rand.getrandbits(32) for _ in range(1000)]
+    ys = [rand.getrandbits(32) for _ in range(1000)]
+    path = tmp_path / 'operands.bin'
+    path.write_bytes(array('I', xs + ys).tobytes())
+
+    alu = ALU()
+    with open(path, 'r+b') as f:
+        with mmap.mmap(f.fileno(), 0) as buffer:
+            with WordArray(buffer) as words:
+                out = WordArray.zeros(1000)
+                alu.func_array(words[:1000], words[1000:], ControlSignal.SUB, out, chunk=300)
+                assert out.items.tolist() == [expected(x, y, ControlSignal.SUB) for x, y in zip(xs, ys)]
+
+
+def test_alu_compiled():
+    alu = ALU()
+    compiled = ALU(compiled=True)
+    rand = random.Random(7)
+    xs = VALUES + [rand.getrandbits(32) for _ in range(50)]
+    ys = VALUES[::-1] + [rand.getrandbits(32) for _ in range(50)]
+    for control in SIGNALS + [ControlSignal.LSHIFT, ControlSignal.RSHIFT]:
+        for x, y in zip(xs, ys):
+            assert compiled.func(Word(x), Word(y), control) == alu.func(Word(x), Word(y), control)
+        assert compiled.func_sliced(xs, ys, control) == alu.func_sliced(xs, ys, control)
+    for control in SIGNALS:
+        assert compiled.func(Word8(0x9c), Word8(0x35), control).value == expected(0x9c, 0x35, control, 0xff)
+
+
+def test_alu_compiled_optimize():
+    compiler = ALU().compiler
+    assert compiler.compile(ControlSignal.AND) is compiler.compile(ControlSignal.AND)
+    assert compiler.compile(ControlSignal.AND).gates == {'and': 32}
+    assert compiler.compile(ControlSignal.LSHIFT).gate_count() == 0
+    assert compiler.compile(ControlSignal.ADD).gate_count() < 32 * 15
+
+
+def test_truth_table():
+    from alu.logic_gate import xor_gate, nor_gate
+    from alu.arithmetic_gate import full_adder_gate
+    from alu.truth_table import registry
+
+    for a in (Bit(), Bit(True)):
+        for b in (Bit(), Bit(True)):
+            assert registry['xor_gate'](a, b) == xor_gate(a, b)
+            assert registry['nor_gate'](a, b) == nor_gate(a, b)
+            for c in (Bit(), Bit(True)):
+                assert registry['full_adder_gate'](a, b, c) == full_adder_gate(a, b, c)
+
+
+def test_alu_cell():
+    alu = ALU()
+    for cell in (4, 8):
+        table = ALU(cell=cell)
+        for control in (ControlSignal.ADD, ControlSignal.SUB, ControlSignal.INC, ControlSignal.DEC):
+            for x in VALUES:
+                y = VALUES[(x + 1) % len(VALUES)]
+                assert table.func(Word(x), Word(y), control) == alu.func(Word(x), Word(y), control)
+        assert table.func(Word64(2**64 - 1), Word64(3), ControlSignal.ADD).value == 2
+
+
+def test_alu_cell_width():
+    from alu.arithmetic_unit import adder_32bit
+    from alu.truth_table import adder_cell, cell_add
+
+    for cell in (3, 5, 16):
+        with pytest.raises(ValueError):
+            adder_cell(cell)
+    with pytest.raises(ValueError):
+        cell_add(1, 2, 0, 35, 5)
+    with pytest.raises(ValueError):
+        adder_32bit(Word(1), Word(2), cell=16)
+
+
+def test_gate_profiler():
+    from alu import logic_gate
+    from alu.profiler import GateProfiler
+
+    alu = ALU(compiled=True)
+    and_gate = logic_gate.and_gate
+    with GateProfiler() as profiler:
+        assert alu.func(Word(3), Word(5), ControlSignal.ADD).value == 8
+        assert alu.func(Word(3), Word(5), ControlSignal.AND).value == 1
+        assert alu.func_sliced([1, 2], [3, 4], ControlSignal.XOR) == [2, 6]
+    assert logic_gate.and_gate is and_gate
+
+    report = profiler.report()
+    add = report[ControlSignal.ADD]
+    assert add.calls == 1
+    assert add.gates['full_adder_gate'] == 31
+    assert add.gates['half_adder_gate'] == 1
+    assert add.primitive_count() > 31 * 10
+    assert len(add.depth) == 32
+    assert add.depth[-1] < add.depth[0] == add.critical_path()
+    assert report[ControlSignal.AND].gates == {'and_gate': 32}
+    assert report[ControlSignal.AND].critical_path() == 1
+    assert report[ControlSignal.XOR].gates['xor_gate'] == 32
+
+
+def test_adders():
+    from alu.adder import adders
+    from nums.arithmetic import Arithmetic
+
+    alu = ALU()
+    rand = random.Random(10)
+    xs = VALUES + [rand.getrandbits(32) for _ in range(20)]
+    ys = VALUES[::-1] + [rand.getrandbits(32) for _ in range(20)]
+    for adder in adders.values():
+        arch = ALU(adder=adder)
+        compiled = ALU(compiled=True, adder=adder)
+        for control in (ControlSignal.ADD, ControlSignal.SUB, ControlSignal.INC):
+            for x, y in zip(xs, ys):
+                assert arch.func(Word(x), Word(y), control) == alu.func(Word(x), Word(y), control)
+            assert arch.func_sliced(xs, ys, control) == alu.func_sliced(xs, ys, control)
+            assert compiled.func_sliced(xs, ys, control) == alu.func_sliced(xs, ys, control)
+        assert arch.func(Word8(0xf0), Word8(0x31), ControlSignal.ADD).value == 0x21
+
+        res, overflow = Arithmetic.raw_add_bits(Word(0xffffffff).bit_list, Word(2).bit_list, adder)
+        assert Word(res).value == 1 and overflow == Bit(True)
+
+
+def test_adder_interface():
+    from alu.adder import Adder
+
+    class Incomplete(Adder):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_adder_stats():
+    from alu.adder import adders
+
+    ripple = adders['ripple-carry'].stats(32)
+    assert len(ripple.depth) == 33
+    for name in ('carry-lookahead', 'kogge-stone', 'brent-kung', 'carry-select'):
+        assert adders[name].stats(32).critical_path() < ripple.critical_path()
+    kogge_stone, brent_kung = adders['kogge-stone'].stats(32), adders['brent-kung'].stats(32)
+    assert kogge_stone.critical_path() < brent_kung.critical_path()
+    assert brent_kung.primitive_count() < kogge_stone.primitive_count()
+
+
+def test_mul_div():
+    from alu.adder import adders
+    from alu.mul_div_unit import BoothMultiplier, ArrayDivider
+
+    alu = ALU(compiled=True, adder=adders['kogge-stone'])
+    rand = random.Random(11)
+    xs = VALUES + [rand.getrandbits(32) for _ in range(30)]
+    ys = VALUES[::-1] + [rand.getrandbits(rand.choice((4, 16, 32))) for _ in range(30)]
+    for control in (ControlSignal.MUL, ControlSignal.MULH, ControlSignal.DIV, ControlSignal.REM):
+        assert alu.func_sliced(xs, ys, control) == [expected(x, y, control) for x, y in zip(xs, ys)]
+    assert alu.func(Word(7), Word(0), ControlSignal.DIV).value == MASK
+    assert alu.func(Word(7), Word(0), ControlSignal.REM).value == 7
+
+    multiplier = BoothMultiplier().stats(8)
+    assert len(multiplier.depth) == 16
+    assert multiplier.gates['full_adder_gate'] > 0
+    assert BoothMultiplier(adders['kogge-stone']).stats(8).critical_path() < multiplier.critical_path()
+    divider = ArrayDivider().stats(8)
+    assert len(divider.depth) == 16
+    assert divider.critical_path() > multiplier.critical_path()
+
+
+def test_alu_func_batch():
+    from array import array
+
+    alu = ALU()
+    rand = random.Random(13)
+    xs = array('I', VALUES + [rand.getrandbits(32) for _ in range(100)])
+    ys = array('I', VALUES[::-1] + [rand.getrandbits(32) for _ in range(100)])
+    for control in (ControlSignal.ADD, ControlSignal.XNOR, ControlSignal.SRA, ControlSignal.MUL):
+        res = alu.func_batch(xs, ys, control, backend='lanes', chunk=50)
+        assert res.typecode == 'I'
+        assert res.tolist() == [expected(x, y, control) for x, y in zip(xs, ys)]
+        assert alu.func_batch(xs[:10], ys[:10], control, backend='gates').tolist() == res.tolist()[:10]
+    assert alu.func_batch(array('B', [250, 3]), None, ControlSignal.INC, length=8).tolist() == [251, 4]
+
+    opcodes = [SIGNALS[i % len(SIGNALS)] for i in range(len(xs))]
+    res = alu.execute_batch(opcodes, xs, ys)
+    assert res.tolist() == [expected(x, y, op) for op, x, y in zip(opcodes, xs, ys)]
+    assert alu.execute_batch([op.code for op in opcodes], xs, ys).tolist() == res.tolist()
+
+
+def test_alu_func_batch_numpy():
+    np = pytest.importorskip('numpy')
+
+    alu = ALU()
+    rand = np.random.RandomState(17)
+    xs = rand.randint(0, 2**32, 1000, dtype=np.uint64).astype(np.uint32)
+    ys = rand.randint(0, 2**32, 1000, dtype=np.uint64).astype(np.uint32)
+    for control in (ControlSignal.SUB, ControlSignal.ROL, ControlSignal.MULH):
+        res = alu.func_batch(xs, ys, control, chunk=300)
+        assert res.dtype == np.uint32
+        assert res.tolist() == [expected(int(x), int(y), control) for x, y in zip(xs, ys)]
+    assert alu.func_batch(xs[:3], ys[:3], ControlSignal.AND, backend='numpy').tolist() == (xs[:3] & ys[:3]).tolist()
+
+    opcodes = np.array([SIGNALS[i % len(SIGNALS)].code for i in range(len(xs))], dtype=np.uint8)
+    res = alu.execute_batch(opcodes, xs, ys)
+    assert res.tolist() == [expected(int(x), int(y), ControlSignal.from_code(int(op)))
+                            for op, x, y in zip(opcodes, xs, ys)]
+
+
+def expected_flags(x: int, y: int, control: ControlSignal, length: int = Word.length) -> (int, int, int, int):
+    mask = (1 << length) - 1
+    sign = 1 << (length - 1)
+    res = expected(x, y, control, mask)
+    shift = y & (length - 1)
+    a, b, carry_in = {
+        ControlSignal.ADD: (x, y, 0),
+        ControlSignal.SUB: (x, ~y & mask, 1),
+        ControlSignal.INC: (x, 0, 1),
+        ControlSignal.DEC: (x, mask, 0),
+        ControlSignal.MINUS: (~x & mask, 0, 1),
+    }.get(control, (None, None, None))
+    if a is not None:
+        carry = (a + b + carry_in) >> length
+        overflow = int((a & sign) == (b & sign) and (res & sign) != (a & sign))
+    else:
+        overflow = 0
+        carry = {
+            ControlSignal.LSHIFT: x >> (length - 1),
+            ControlSignal.RSHIFT: x & 1,
+            ControlSignal.SLL: x >> (length - shift) & 1 if shift else 0,
+            ControlSignal.SRL: x >> (shift - 1) & 1 if shift else 0,
+            ControlSignal.SRA: x >> (shift - 1) & 1 if shift else 0,
+            ControlSignal.ROL: res & 1,
+            ControlSignal.ROR: res >> (length - 1),
+        }.get(control, 0)
+    return int(res == 0), res >> (length - 1), carry, overflow
+
+
+def test_alu_flags():
+    from alu.adder import adders
+
+    alus = [ALU(), ALU(compiled=True), ALU(cell=4), ALU(adder=adders['kogge-stone'])]
+    values = [0, 1, 0x7fffffff, 0x80000000, 0xffffffff, 0x12345678, 0x9abcdef0]
+    for control in SIGNALS + [ControlSignal.LSHIFT, ControlSignal.RSHIFT]:
+        for x in values:
+            for y in (0, 1, 0x7fffffff, 0x80000000, 0xffffffff, 0x85):
+                want = expected_flags(x, y, control)
+                for alu in alus:
+                    alu.func(Word(x), Word(y), control)
+                    flags = alu.flags
+                    assert (flags.zero.val, flags.negative.val, flags.carry.val, flags.overflow.val) == want, \
+                        (control, x, y, alu.compiled)
+
+    alu = ALU()
+    alu.func(BitWord(Word(0x7fffffff).bit_list), BitWord(Word(1).bit_list), ControlSignal.ADD)
+    assert int(alu.flags) == 0b1001
+    alu.func(Word8(0x80), Word8(0x80), ControlSignal.ADD)
+    assert int(alu.flags) == 0b0111
+
+
+def test_alu_trace(tmp_path):
+    from alu.trace import HEADER, TraceWriter, TraceReader, replay
+
+    path = str(tmp_path / 'alu.trace')
+    alu = ALU(compiled=True)
+    with TraceWriter(path) as writer:
+        alu.recorder = writer
+        for i, control in enumerate(SIGNALS):
+            alu.func(Word(VALUES[i % len(VALUES)]), Word(VALUES[-i % len(VALUES)]), control)
+        alu.func(BitWord(Word(1).bit_list), BitWord(Word(2).bit_list), ControlSignal.ADD)
+    alu.recorder = None
+    with TraceWriter(path) as writer:
+        alu.recorder = writer
+        alu.func_batch([1, 2, 3], [4, 5, 6], ControlSignal.MUL)
+    alu.recorder = None
+
+    with TraceReader(path) as reader:
+        assert len(reader) == len(SIGNALS) + 3
+        assert reader[1] == (SIGNALS[1], VALUES[1], VALUES[-1], expected(VALUES[1], VALUES[-1], SIGNALS[1]) & MASK)
+        assert reader[-1] == (ControlSignal.MUL, 3, 6, 18)
+        opcodes, xs, ys, results = reader.columns(len(SIGNALS))
+        with pytest.raises(IndexError):
+            reader[len(reader)]
+    # columns 를 가지고 있어도 close 가능
+    assert list(results) == [4, 10, 18] and list(xs) == [1, 2, 3]
+
+    report = replay(ALU(), path, batch=7)
+    assert report.ok() and report.records == len(SIGNALS) + 3
+    assert replay(ALU(), path, start=5, stop=8).records == 3
+
+    with open(path, 'r+b') as f:
+        f.seek(-4, 2)
+        f.write(b'\x00\x00\x00\x00')
+    report = replay(ALU(), path)
+    assert report.mismatch_count == 1 and report.mismatches == [len(SIGNALS) + 2]
+    with pytest.raises(ValueError):
+        TraceWriter(path, length=8)
+
+    # 알 수 없는 opcode 의 record 는 원래 예외를 그대로 전달 ( mmap 을 닫는 BufferError 가 아님 )
+    with open(path, 'r+b') as f:
+        f.seek(HEADER.size)
+        f.write(b'\xee')
+    with pytest.raises(ValueError, match='ControlSignal'):
+        replay(ALU(), path)
+
+
+def test_functional_alu():
+    from alu.functional import FunctionalALU, OPERATIONS
+
+    assert set(OPERATIONS) == set(ControlSignal)
+    alu = FunctionalALU(sample_rate=0.25, seed=1)
+    for control in SIGNALS + [ControlSignal.LSHIFT, ControlSignal.RSHIFT]:
+        for x in VALUES:
+            for y in (0, 1, 0x7fffffff, 0x80000000, 0xffffffff, 0x85):
+                assert int(alu.func(Word(x), Word(y), control)) == expected(x, y, control)
+                flags = alu.flags
+                assert (flags.zero.val, flags.negative.val, flags.carry.val, flags.overflow.val) == \
+                    expected_flags(x, y, control)
+    assert alu.checked > 0 and alu.mismatch_count == 0
+    assert int(alu.func(Word8(0x80), Word8(0x80), ControlSignal.ADD)) == 0 and int(alu.flags) == 0b0111
+
+    alu = FunctionalALU(sample_rate=1.0, seed=2)
+    assert alu.func_batch(VALUES, VALUES[::-1], ControlSignal.ROR) == \
+        [expected(x, y, ControlSignal.ROR) for x, y in zip(VALUES, VALUES[::-1])]
+    assert alu.checked == len(VALUES) and alu.mismatch_count == 0
+
+    assert not alu.check(3, 4, ControlSignal.ADD, 32, (8, None))
+    assert alu.mismatch_count == 1 and alu.mismatches[0].gate == (7, None)
+
+    for out in (Word(), BitWord()):
+        res = alu.func(Word(0xfffffffe), Word(3), ControlSignal.ADD, out=out)
+        assert res is out and out.value == 1 and alu.flags.carry == Bit(True)
+
+
+def test_bit_count():
+    from alu.bit_count_unit import popcount_tree
+    from alu.profiler import GateProfiler
+
+    assert [ControlSignal.from_code(code) for code in range(23, 27)] == \
+        [ControlSignal.CLZ, ControlSignal.CTZ, ControlSignal.POPCNT, ControlSignal.PARITY]
+    bits = Word(0xf0f0000f).bit_list
+    assert Word(popcount_tree(bits)[::-1]).value == 12
+    assert Word(popcount_tree(bits[:7])[::-1]).value == 4
+
+    alu = ALU()
+    for x in (0, 1, 0x80000000, 0x00f00100):
+        for control in (ControlSignal.CLZ, ControlSignal.CTZ, ControlSignal.POPCNT, ControlSignal.PARITY):
+            assert alu.func(BitWord(Word(x).bit_list), BitWord(), control).value == expected(x, 0, control)
+    with GateProfiler() as profiler:
+        alu.func(BitWord(), BitWord(), ControlSignal.POPCNT)
+    report = profiler.reports[ControlSignal.POPCNT]
+    assert report.gates['half_adder_gate'] == 16 + 8 + 4 + 2 + 1
+    assert report.critical_path() <= 5 * 10
@@ -0,0 +1,222 @@
+import mmap
+import os
+import struct
+import time
+from array import array
+from typing import Iterator, List
+
+from alu.bit_slice import np
+from alu.control_signal import ControlSignal
+from word.word import Word
+from word.word_array import WordArray
+
+MAGIC = b'ALUT'
+VERSION = 1
+HEADER = struct.Struct('<4sBBH')
+
+
+def record_struct(length: int) -> struct.Struct:
+    """
+    length bit Word 연산 하나의 record 형식
+    | opcode (1 byte) | x | y | result | ( 각 값은 length / 8 byte little-endian )
+    """
+    return struct.Struct('<B' + WordArray.formats[length] * 3)
+
+
+def _record_dtype(length: int) -> "np.dtype":
+    value = '<u{}'.format(length // 8)
+    return np.dtype([('op', 'u1'), ('x', value), ('y', value), ('result', value)])
+
+
+class TraceWriter:
+    """
+    ALU 연산 trace 를 binary 파일에 기록
+
+    파일은 header ( MAGIC, version, Word 길이 ) 뒤에 고정 길이 record 가 이어지는 형식이며
+    이미 있는 파일은 header 를 확인한 뒤 끝에 이어서 기록 (append)
+    ALU.recorder 로 지정하면 ALU.func, ALU.func_batch 의 모든 연산을 기록
+    """
+
+    def __init__(self, path: str, length: int = Word.length):
+        self.length = length
+        self.record = record_struct(length)
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, 'rb') as f:
+                _, length = _read_header(f.read(HEADER.size))
+            if length != self.length:
+                raise ValueError('trace 파일의 Word 길이 ({} bit) 가 다름'.format(length))
+        self.file = open(path, 'ab')
+        if not exists:
+            self.file.write(HEADER.pack(MAGIC, VERSION, length, 0))
+
+    def __call__(self, control: ControlSignal, x: Word, y: Word, res: Word):
+        """
+        ALU.func 의 연산 하나를 기록 (ALU.recorder hook)
+        """
+        self.file.write(self.record.pack(control.code, x.value, y.value, res.value))
+
+    def write_batch(self, control: ControlSignal, xs, ys, results):
+        """
+        같은 연산의 여러 값을 한 번에 기록 (ALU.func_batch hook)
+        """
+        code = control.code
+        if np is not None:
+            records = np.empty(len(results), dtype=_record_dtype(self.length))
+            records['op'] = code
+            records['x'], records['y'], records['result'] = xs, ys, results
+            self.file.write(records.tobytes())
+            return
+        pack = self.record.pack
+        self.file.write(b''.join(pack(code, int(x), int(y), int(r)) for x, y, r in zip(xs, ys, results)))
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _read_header(data: bytes) -> (int, int):
+    if len(data) < HEADER.size:
+        raise ValueError('trace 파일의 header 가 없음')
+    magic, version, length, _ = HEADER.unpack(data[:HEADER.size])
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('ALU trace 파일이 아님')
+    return version, length
+
+
+class TraceReader:
+    """
+    trace 파일을 mmap 으로 열어 record index 로 바로 접근
+
+    record 는 고정 길이이므로 i 번째 record 의 위치를 계산하여 파일 전체를 읽지 않고 필요한 부분만 읽음
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, self.length = _read_header(self.map[:HEADER.size])
+        self.record = record_struct(self.length)
+
+    def __len__(self) -> int:
+        return (len(self.map) - HEADER.size) // self.record.size
+
+    def _offset(self, index: int) -> int:
+        return HEADER.size + index * self.record.size
+
+    def __getitem__(self, index: int) -> (ControlSignal, int, int, int):
+        """
+        index 번째 record
+        :return: ControlSignal, x, y, result
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('trace record index out of range')
+        code, x, y, res = self.record.unpack_from(self.map, self._offset(index))
+        return ControlSignal.from_code(code), x, y, res
+
+    def records(self, start: int = 0, stop: int = None) -> Iterator[tuple]:
+        """
+        start 번째부터 stop 번째 전까지의 record 를 (opcode, x, y, result) 로 순서대로 읽음
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return iter(())
+        return self.record.iter_unpack(self.map[self._offset(start):self._offset(stop)])
+
+    def columns(self, start: int = 0, stop: int = None, copy: bool = True) -> tuple:
+        """
+        start 번째부터 stop 번째 전까지의 record 를 field 별 배열로 읽음
+        numpy 가 있을 경우 numpy 배열, 없을 경우 array
+
+        copy 가 False 일 경우 numpy 배열은 mmap 을 복사하지 않는 view 이므로
+        view 를 모두 지운 뒤에 close 해야 함 ( view 가 남아 있으면 mmap 을 닫을 수 없음 )
+        :param copy: numpy 배열을 mmap 에서 복사할 지 여부
+        :return: opcodes, xs, ys, results
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        count = max(stop - start, 0)
+        if np is not None:
+            records = np.frombuffer(self.map, dtype=_record_dtype(self.length), count=count,
+                                    offset=self._offset(start))
+            if copy:
+                records = records.copy()
+            return records['op'], records['x'], records['y'], records['result']
+        fmt = WordArray.formats[self.length]
+        columns = (array('B'), array(fmt), array(fmt), array(fmt))
+        for record in self.records(start, stop):
+            for column, value in zip(columns, record):
+                column.append(value)
+        return columns
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ReplayReport:
+    """
+    trace 재실행 결과
+
+    records: 재실행한 record 수
+    mismatches: 재실행 결과가 기록된 결과와 다른 record 의 index (최대 limit 개)
+    mismatch_count: 결과가 다른 record 의 수
+    """
+
+    def __init__(self, limit: int = 100):
+        self.records = 0
+        self.mismatch_count = 0
+        self.mismatches: List[int] = []
+        self.limit = limit
+        self.elapsed = 0.0
+
+    def ok(self) -> bool:
+        return self.mismatch_count == 0
+
+    def __repr__(self) -> str:
+        return 'ReplayReport(records={}, mismatches={}, {:.0f} ops/s)'.format(
+            self.records, self.mismatch_count, self.records / self.elapsed if self.elapsed else 0.0)
+
+
+def replay(alu, path: str, start: int = 0, stop: int = None, batch: int = 1 << 16) -> ReplayReport:
+    """
+    trace 파일의 start 번째부터 stop 번째 전까지의 record 를 ALU 로 다시 실행하여 결과를 확인
+    batch 개씩 읽어 ALU.execute_batch 로 연산하므로 trace 의 크기와 관계 없이 일정한 메모리만 사용
+
+    :param alu: 연산을 수행할 ALU
+    :param path: trace 파일 경로
+    :param start: 재실행할 첫 record index
+    :param stop: 재실행을 멈출 record index, 없을 경우 끝까지
+    :param batch: 한 번에 재실행할 record 수
+    :return: ReplayReport
+    """
+    report = ReplayReport()
+    begin = time.perf_counter()
+    with TraceReader(path) as reader:
+        stop = len(reader) if stop is None else min(stop, len(reader))
+        for offset in range(start, stop, batch):
+            end = min(offset + batch, stop)
+            # execute_batch 가 예외를 일으켜도 mmap 의 view 가 남지 않도록 복사한 배열 사용
+            opcodes, xs, ys, results = reader.columns(offset, end)
+            res = alu.execute_batch(opcodes, xs, ys, reader.length)
+            different = [i for i, (a, b) in enumerate(zip(res, results)) if a != b] if np is None \
+                else np.nonzero(np.asarray(res) != results)[0].tolist()
+            report.mismatch_count += len(different)
+            report.mismatches.extend(offset + i for i in different[:report.limit - len(report.mismatches)])
+            report.records += end - offset
+    report.elapsed = time.perf_counter() - begin
+    return report
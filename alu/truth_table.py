@@ -0,0 +1,111 @@
+from array import array
+from itertools import product
+from typing import Callable, Dict
+
+from alu.arithmetic_gate import *
+
+
+class TruthTable:
+    """
+    순수 함수인 Gate 의 진리표
+
+    Gate 의 모든 입력 조합에 대해 Gate 를 한 번씩 실행하여 결과를 저장하고
+    이후에는 Gate 를 다시 실행하지 않고 표에서 결과를 찾음
+    입력 Bit 들은 첫 번째 입력이 MSB 인 index 로 변환
+    """
+
+    def __init__(self, gate: Callable, arity: int):
+        self.gate = gate
+        self.arity = arity
+        self.table = tuple(gate(*[Bit(val) for val in vals]) for vals in product((False, True), repeat=arity))
+
+    def __call__(self, *bits: Bit):
+        index = 0
+        for bit in bits:
+            index = index << 1 | bit.val
+        return self.table[index]
+
+
+registry: Dict[str, TruthTable] = {}
+
+
+def register(gate: Callable, arity: int) -> TruthTable:
+    """
+    Gate 의 진리표를 만들어 registry 에 등록
+    :param gate: 진리표를 만들 순수 Gate 함수
+    :param arity: Gate 의 입력 Bit 개수
+    :return: Gate 와 같이 호출할 수 있는 TruthTable
+    """
+    registry[gate.__name__] = TruthTable(gate, arity)
+    return registry[gate.__name__]
+
+
+for _gate, _arity in ((not_gate, 1), (and_gate, 2), (or_gate, 2), (xor_gate, 2), (nand_gate, 2), (nor_gate, 2),
+                      (xnor_gate, 2), (mux_gate, 3), (half_adder_gate, 2), (full_adder_gate, 3)):
+    register(_gate, _arity)
+
+
+_cells: Dict[int, array] = {}
+# adder_cell 로 만들 수 있는 cell 의 비트 길이
+CELL_WIDTHS = (1, 2, 4, 8)
+
+
+def adder_cell(width: int) -> array:
+    """
+    width bit 덧셈 cell 의 진리표
+    index 는 a << (width + 1) | b << 1 | carry_in 이고 값은 carry_out << width | sum
+
+    4 bit 이하의 cell 은 full_adder_gate 를 ripple 연결하여 만들고
+    더 큰 cell 은 절반 크기 cell 두 개를 연결하여 만듦
+    처음 사용할 때 만들고 이후에는 cache 된 표를 사용
+    :param width: cell 의 비트 길이 (1, 2, 4, 8)
+    :return: 2 ** (2 * width + 1) 개의 값을 가지는 array
+    """
+    if width in _cells:
+        return _cells[width]
+    if width not in CELL_WIDTHS:
+        raise ValueError('cell 크기는 {} 중 하나여야 함'.format(CELL_WIDTHS))
+    size = 1 << width
+    table = array('H', bytes(2 * (1 << (2 * width + 1))))
+    if width <= 4:
+        full_adder = registry['full_adder_gate']
+        for a, b, carry_in in product(range(size), range(size), range(2)):
+            res, c = 0, Bit(carry_in)
+            for i in range(width):
+                s, c = full_adder(Bit(a >> i & 1), Bit(b >> i & 1), c)
+                res |= s.val << i
+            table[a << (width + 1) | b << 1 | carry_in] = c.val << width | res
+    else:
+        half = width // 2
+        half_table = adder_cell(half)
+        half_mask = (1 << half) - 1
+        for a, b, carry_in in product(range(size), range(size), range(2)):
+            low = half_table[(a & half_mask) << (half + 1) | (b & half_mask) << 1 | carry_in]
+            high = half_table[(a >> half) << (half + 1) | (b >> half) << 1 | low >> half]
+            table[a << (width + 1) | b << 1 | carry_in] = high << half | (low & half_mask)
+    _cells[width] = table
+    return table
+
+
+def cell_add(a: int, b: int, carry_in: int, length: int, cell: int) -> (int, int):
+    """
+    adder_cell 진리표를 이용하여 cell bit 씩 더하는 ripple-carry 덧셈
+    :param a: 더할 값 (length bit)
+    :param b: 더할 값 (length bit)
+    :param carry_in: LSB 에 더할 carry (0 또는 1)
+    :param length: 값의 비트 길이, cell 의 배수여야 함
+    :param cell: 한 번에 더할 비트 수
+    :return: a + b + carry_in 의 하위 length bit, carry_out
+    """
+    if cell not in CELL_WIDTHS:
+        raise ValueError('cell 크기는 {} 중 하나여야 함'.format(CELL_WIDTHS))
+    if length % cell:
+        raise ValueError('Word 길이는 cell 크기의 배수여야 함')
+    table = adder_cell(cell)
+    mask = (1 << cell) - 1
+    res, carry = 0, carry_in
+    for shift in range(0, length, cell):
+        entry = table[(a >> shift & mask) << (cell + 1) | (b >> shift & mask) << 1 | carry]
+        res |= (entry & mask) << shift
+        carry = entry >> cell
+    return res, carry
@@ -0,0 +1,79 @@
+"""
+Integer, Float 덧셈의 메모리 할당 벤치마크
+
+Integer.__add__, Float.__add__, BitOperation.equalize_bit_length, 길이별 Arithmetic.raw_add_bits 1회에 필요한 시간과
+연산 중 최대 메모리 사용량 ( Bit List 복사본 등 임시 할당 포함 ) 을 측정
+
+실행: python -m benchmark.bench_alloc
+"""
+import timeit
+import tracemalloc
+from typing import Callable
+
+from float.float import Float
+from integer.integer import Integer
+from nums.arithmetic import Arithmetic
+from nums.bit_operation import BitOperation
+
+
+def bench_time(op: Callable, number: int = 200) -> float:
+    """
+    op 1회 수행 시간 (us)
+    """
+    return timeit.timeit(op, number=number) / number * 1e6
+
+
+def bench_peak(op: Callable) -> int:
+    """
+    op 1회 수행 중 최대 메모리 사용량 (byte)
+    """
+    op()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    op()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - before
+
+
+def add_op(a, b) -> Callable:
+    def op():
+        return a + b
+    return op
+
+
+def equalize_op(a: list, b: list, length: int) -> Callable:
+    def op():
+        return BitOperation.equalize_bit_length(a, b, length)
+    return op
+
+
+def raw_add_op(a: list, b: list) -> Callable:
+    def op():
+        return Arithmetic.raw_add_bits(a, b)
+    return op
+
+
+def main():
+    cases = {
+        'Integer + Integer': (Integer(123456), Integer(-98765)),
+        'Integer + small': (Integer(123456), Integer([Integer.max_value().bits[0]] * 3)),
+        'Float + Float': (Float('3.25'), Float('-1.5')),
+    }
+    for name, (a, b) in cases.items():
+        op = add_op(a, b)
+        print('{:<19}: {:8.1f} us/op, peak {:6} bytes/op'.format(name, bench_time(op), bench_peak(op)))
+    short, full = Integer(5).bits[-3:], Integer.max_value().bits[1:]
+    op = equalize_op(short, full, Integer.field_len)
+    print('{:<19}: {:8.1f} us/op, peak {:6} bytes/op'.format('equalize_bit_length', bench_time(op), bench_peak(op)))
+    for length in (8, 256, 4096, 65536):
+        # carry 가 모든 자리로 전파되는 가장 긴 덧셈 ( 2^length - 1 ) + 1
+        a = BitOperation.decimal_to_binary((1 << length) - 1, length)
+        b = BitOperation.decimal_to_binary(1, length)
+        op = raw_add_op(a, b)
+        print('{:<19}: {:8.1f} us/op, peak {:6} bytes/op'.format(
+            'raw_add_bits {}'.format(length), bench_time(op, 20), bench_peak(op)))
+
+
+if __name__ == '__main__':
+    main()
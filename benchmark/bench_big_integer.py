@@ -0,0 +1,48 @@
+"""
+BigInteger 곱셈 벤치마크
+
+같은 길이의 두 값을 schoolbook, Karatsuba, Toom-3 곱셈으로 각각 곱하는 시간을 길이별로 측정
+Karatsuba, Toom-3 의 재귀 곱셈은 현재 threshold 의 mul_bits 를 사용하므로
+한 단계만 바꿨을 때 더 빨라지는 길이가 BigInteger.karatsuba_threshold, toom3_threshold 의 기준
+
+실행: python -m benchmark.bench_big_integer [최대 bit 길이]
+"""
+import random
+import sys
+import time
+
+from big_integer.big_integer import BigInteger
+
+METHODS = (
+    ('schoolbook', BigInteger.schoolbook_mul_bits),
+    ('karatsuba', BigInteger.karatsuba_mul_bits),
+    ('toom3', BigInteger.toom3_mul_bits),
+)
+
+
+def measure(func, a: list, b: list) -> float:
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        func(a, b)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    rand = random.Random(0)
+    print('thresholds: karatsuba {}, toom3 {}'.format(BigInteger.karatsuba_threshold, BigInteger.toom3_threshold))
+    print('{:>6} '.format('bits') + ' '.join('{:>11}'.format(name) for name, _ in METHODS))
+    length = 16
+    while length <= limit:
+        a = BigInteger(rand.getrandbits(length) | 1 << (length - 1)).bits
+        b = BigInteger(rand.getrandbits(length) | 1 << (length - 1)).bits
+        times = [measure(func, a, b) for _, func in METHODS]
+        print('{:>6} '.format(length) + ' '.join('{:>9.2f}ms'.format(t * 1000) for t in times))
+        length *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Bit 객체 할당 벤치마크
+
+32 bit 덧셈 ( adder_32bit ) 1회에 필요한 시간과 메모리 할당량을 측정
+
+실행: python -m benchmark.bench_bit
+"""
+import timeit
+import tracemalloc
+
+from alu.arithmetic_unit import adder_32bit
+from bit.bit import Bit
+from word.word import Word
+
+
+def make_word(val: int) -> Word:
+    return Word([Bit(bool(val >> (31 - i) & 1)) for i in range(32)])
+
+
+def bench_time(a: Word, b: Word, number: int = 2000) -> float:
+    """
+    adder_32bit 1회 수행 시간 (us)
+    """
+    return timeit.timeit(lambda: adder_32bit(a, b), number=number) / number * 1e6
+
+
+def bench_alloc(a: Word, b: Word, number: int = 1000) -> (int, int):
+    """
+    adder_32bit 결과를 number 개 유지할 때의 메모리 블록 수, 바이트 수
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [adder_32bit(a, b) for _ in range(number)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del results
+    return blocks, size
+
+
+def bench_peak(a: Word, b: Word) -> int:
+    """
+    adder_32bit 1회 수행 중 최대 메모리 사용량 (byte)
+    """
+    tracemalloc.start()
+    adder_32bit(a, b)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    a = make_word(0x12345678)
+    b = make_word(0x0fedcba9)
+    blocks, size = bench_alloc(a, b)
+    print('adder_32bit time      : {:.1f} us/op'.format(bench_time(a, b)))
+    print('adder_32bit peak      : {} bytes/op'.format(bench_peak(a, b)))
+    print('1000 results retained : {} blocks, {} bytes'.format(blocks, size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Bit List <-> int, bytes 변환 벤치마크
+
+32 bit Bit List n 개를 bytes buffer 로 변환 ( export ) 하고 다시 Bit List 로 변환 ( ingest ) 하는 시간을
+Bit 마다 반복하는 변환과 BitOperation 의 일괄 변환 함수로 각각 측정
+
+실행: python -m benchmark.bench_convert [n]
+"""
+import random
+import sys
+import time
+
+from bit.bit import Bit
+from nums.bit_operation import BitOperation
+
+
+def export_loop(bit_lists: list) -> bytes:
+    res = bytearray()
+    for bits in bit_lists:
+        value = 0
+        for bit in bits:
+            value = value << 1 | (1 if bit else 0)
+        res += value.to_bytes(4, 'big')
+    return bytes(res)
+
+
+def ingest_loop(data: bytes) -> list:
+    res = []
+    for i in range(0, len(data), 4):
+        value = int.from_bytes(data[i:i + 4], 'big')
+        res.append([Bit(value >> j & 1) for j in range(31, -1, -1)])
+    return res
+
+
+def measure(func, arg) -> (float, object):
+    start = time.perf_counter()
+    res = func(arg)
+    return time.perf_counter() - start, res
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rand = random.Random(0)
+    bit_lists = [BitOperation.decimal_to_binary(rand.getrandbits(32), 32) for _ in range(n)]
+    loop_export, data = measure(export_loop, bit_lists)
+    bulk_export, bulk = measure(lambda lists: BitOperation.bit_lists_to_bytes(lists, 32), bit_lists)
+    loop_ingest, _ = measure(ingest_loop, data)
+    bulk_ingest, res = measure(lambda buffer: BitOperation.bytes_to_bit_lists(buffer, 32), data)
+    assert bulk == data and res == bit_lists
+    print('export {} values: loop {:.3f} s, bulk {:.3f} s (x{:.1f})'.format(
+        n, loop_export, bulk_export, loop_export / bulk_export))
+    print('ingest {} values: loop {:.3f} s, bulk {:.3f} s (x{:.1f})'.format(
+        n, loop_ingest, bulk_ingest, loop_ingest / bulk_ingest))
+
+
+if __name__ == '__main__':
+    main()
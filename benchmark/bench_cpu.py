@@ -0,0 +1,52 @@
+"""
+CPU interpreter 처리량 벤치마크
+
+1 + 2 + ... + n 을 계산하는 반복문 프로그램을 파일로 저장한 뒤 불러와 실행하고
+ALU 의 실행 방식 ( Gate, 컴파일된 Kernel ) 별 초당 실행 명령어 수 (IPS) 와
+파이프라인 모드의 cycle 수, CPI 를 측정
+
+실행: python -m benchmark.bench_cpu [n]
+"""
+import os
+import sys
+import tempfile
+
+from alu.alu import ALU
+from alu.control_signal import ControlSignal
+from cpu.cpu import CPU
+from cpu.instruction import Opcode, encode, save_program
+from cpu.pipeline import Pipeline
+
+
+def sum_program(n: int) -> list:
+    return [
+        encode(Opcode.LI, rd=1, imm=n),
+        encode(Opcode.LI, rd=2, imm=0),
+        encode(ControlSignal.ADD, rd=2, rs1=2, rs2=1),
+        encode(ControlSignal.SUB, rd=1, rs1=1, imm=1),
+        encode(Opcode.BNZ, rs1=1, imm=-2),
+        encode(Opcode.HALT),
+    ]
+
+
+def bench(alu: ALU, path: str) -> CPU:
+    cpu = CPU(alu).load_file(path)
+    cpu.run()
+    return cpu
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'sum.bin')
+        save_program(path, sum_program(n))
+        for name, alu in (('gate', ALU()), ('compiled', ALU(compiled=True))):
+            cpu = bench(alu, path)
+            print('{:<9}: {} (r2 = {})'.format(name, cpu.report(), cpu.registers[2].value))
+        for forwarding in (True, False):
+            stats = Pipeline(CPU().load_file(path), forwarding=forwarding).run()
+            print('pipeline (forwarding={}): {}'.format(forwarding, stats))
+
+
+if __name__ == '__main__':
+    main()
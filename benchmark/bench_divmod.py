@@ -0,0 +1,83 @@
+"""
+Bit List 나눗셈 벤치마크
+
+2n bit 값을 n bit 값으로 나누는 시간을 길이별로 측정
+- restoring: 이전 raw_div_bits 의 방식 ( 자리마다 shift, 덧셈, 비교 ) 으로 몫과 나머지를 구함
+- shift-subtract: raw_divmod_bits 의 shift-subtract 나눗셈
+- newton: raw_divmod_bits 의 Newton-Raphson 나눗셈 ( raw_mul_bits, BigInteger.mul_bits 곱셈 )
+shift-subtract 보다 newton ( BigInteger.mul_bits ) 이 빨라지는 길이가 Arithmetic.newton_threshold 의 기준
+
+실행: python -m benchmark.bench_divmod [최대 bit 길이]
+"""
+import random
+import sys
+import time
+
+from big_integer.big_integer import BigInteger
+from nums.arithmetic import Arithmetic
+from nums.bit_operation import BitOperation
+
+
+def restoring_divmod(a: list, b: list) -> (list, list):
+    remain = BitOperation.empty_bits(len(a))
+    res = BitOperation.empty_bits(len(a))
+    one = BitOperation.fit_bits(BitOperation.num_map['1'], len(a))
+    first_bit = BitOperation.first_bit_index(b)
+    for i in range(len(a) - 1, -1, -1):
+        if first_bit < i:
+            continue
+        div = BitOperation.raw_lshift_bits(b, i)
+        sum_val, overflow = Arithmetic.raw_add_bits(remain, div)
+        if overflow:
+            continue
+        if BitOperation.raw_le_bits(sum_val, a):
+            remain = sum_val
+            res = BitOperation.raw_or_bits(res, BitOperation.raw_lshift_bits(one, i))
+    return res, Arithmetic.raw_sub_bits(a, remain)[0]
+
+
+def divide(threshold: int, mul=None):
+    def func(a: list, b: list) -> (list, list):
+        Arithmetic.newton_threshold = threshold
+        return Arithmetic.raw_divmod_bits(a, b, mul)
+    return func
+
+
+def measure(func, a: list, b: list) -> (float, tuple):
+    start = time.perf_counter()
+    res = func(a, b)
+    return time.perf_counter() - start, res
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    threshold = Arithmetic.newton_threshold
+    methods = (
+        ('restoring', restoring_divmod),
+        ('shift-subtract', divide(limit * 4)),
+        ('newton', divide(32)),
+        ('newton (big)', divide(32, BigInteger.mul_bits)),
+    )
+    rand = random.Random(0)
+    print('newton_threshold: {}'.format(threshold))
+    print('{:>6} '.format('bits') + ' '.join('{:>15}'.format(name) for name, _ in methods))
+    length = 64
+    while length <= limit:
+        x, y = rand.getrandbits(2 * length), rand.getrandbits(length) | 1 << (length - 1)
+        a = BitOperation.decimal_to_binary(x, 2 * length)
+        b = BitOperation.decimal_to_binary(y, 2 * length)
+        row = []
+        for name, func in methods:
+            if name == 'restoring' and length > 512:
+                row.append('{:>15}'.format('-'))
+                continue
+            elapsed, (quotient, remain) = measure(func, a, b)
+            assert (BitOperation.binary_to_decimal(quotient), BitOperation.binary_to_decimal(remain)) == divmod(x, y)
+            row.append('{:>13.1f}ms'.format(elapsed * 1000))
+        print('{:>6} '.format(length) + ' '.join(row))
+        length *= 2
+    Arithmetic.newton_threshold = threshold
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+ParallelExecutor 확장성 벤치마크
+
+임의의 32 bit 값들의 ALU 덧셈 ( adder_32bit ) 과 Arithmetic.add_bits 를
+worker process 수를 늘려가며 수행하고 수행 시간과 worker 1 개 대비 속도 향상을 측정
+두 방식의 결과가 같은지 함께 확인
+
+실행: python -m benchmark.bench_parallel [n]
+"""
+import os
+import random
+import sys
+import time
+from array import array
+
+from alu.control_signal import ControlSignal
+from parallel.executor import ParallelExecutor
+
+
+def bench(workers: int, xs: array, ys: array, compiled: bool) -> (float, float, bool):
+    """
+    worker 수별 ALU 연산, Arithmetic 연산의 수행 시간 (초) 과 결과 일치 여부
+    """
+    with ParallelExecutor(workers, compiled=compiled) as executor:
+        executor.func(xs[:64], ys[:64], ControlSignal.ADD)
+        start = time.perf_counter()
+        res = executor.func(xs, ys, ControlSignal.ADD)
+        alu = time.perf_counter() - start
+        start = time.perf_counter()
+        want = executor.primitive('add_bits', xs, ys)
+        arithmetic = time.perf_counter() - start
+    return alu, arithmetic, res == want
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rand = random.Random(0)
+    xs = array('I', [rand.getrandbits(32) for _ in range(n)])
+    ys = array('I', [rand.getrandbits(32) for _ in range(n)])
+    workers = 1
+    base = None
+    while workers <= (os.cpu_count() or 1):
+        alu, arithmetic, same = bench(workers, xs, ys, compiled=False)
+        base = base or (alu, arithmetic)
+        print('workers={:<3}: alu {:.3f} s (x{:.2f}), add_bits {:.3f} s (x{:.2f}), same={}'.format(
+            workers, alu, base[0] / alu, arithmetic, base[1] / arithmetic, same))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,446 @@
+from typing import List
+
+from bit.bit import Bit
+from nums.arithmetic import Arithmetic
+from nums.bit_operation import BitOperation
+
+# (나머지 << 1 | 다음 Bit) 를 index 로 하는 3 으로 나누기의 (몫 Bit, 새 나머지)
+_DIV3 = tuple((Bit(r * 2 + bit >= 3), (r * 2 + bit) % 3) for r in range(3) for bit in range(2))
+
+# Toom-3 의 중간 값은 음수가 될 수 있으므로 (음수 여부, 절대값 Bit List) 로 표현
+Signed = tuple
+
+
+class BigInteger:
+    """
+    BigInteger의 메모리 구조
+    +--------------+----------------------------------------------------------------------+
+    | sign (1 bit) |                      field (필요한 만큼의 bit)                        |
+    +--------------+----------------------------------------------------------------------+
+
+    길이가 정해지지 않은 integer 값
+
+    Integer 와 같이 sign bit 와 절대값 ( field ) 으로 표현하고
+    field 는 앞의 0을 제거한 Bit List ( 0 은 빈 Bit List ) 로 값에 필요한 만큼의 비트만 사용
+    모든 연산은 Arithmetic, BitOperation 의 Bit List 연산으로 수행
+
+    곱셈은 두 값 중 짧은 값의 길이에 따라
+    - karatsuba_threshold 미만: Arithmetic.raw_mul_bits ( shift-and-add, schoolbook )
+    - toom3_threshold 미만: Karatsuba ( 3 번의 절반 길이 곱셈 )
+    - 이상: Toom-3 ( 5 번의 1/3 길이 곱셈 )
+    threshold 는 benchmark/bench_big_integer.py 로 측정한 교차 지점
+    """
+    karatsuba_threshold = 160
+    toom3_threshold = 512
+
+    def __init__(self, bits: list or str or int = None, sign: Bit = Bit()):
+        if type(bits) == str:
+            res = self.str_to_big_int(bits)
+            self.sign = res.sign
+            self.bits = res.bits
+        elif type(bits) == int:
+            self.sign = Bit(bits < 0)
+            self.bits = BitOperation.decimal_to_binary(abs(bits), abs(bits).bit_length())
+        elif type(bits) == list:
+            self.bits = BigInteger.trim_bits(bits)
+            self.sign = sign
+        else:
+            self.sign = sign
+            self.bits = []
+        if not self.bits:
+            self.sign = Bit()
+
+    @classmethod
+    def str_to_big_int(cls, val: str) -> "BigInteger":
+        """
+        String 값을 통해 BigInteger 값 read
+        10진수 한 자리는 4 bit 이하이므로 자리수 * 4 bit 길이로 읽은 뒤 앞의 0을 제거
+        :param val: String 으로 표현된 정수 값 (공백이 없다는 가정)
+        :return: BigInteger 의 값
+        """
+        if val[0] == '-':
+            sign = Bit(True)
+            val = val[1:]
+        else:
+            sign = Bit()
+        return BigInteger(Arithmetic.str_to_integer(val, len(val) * 4), sign)
+
+    def val(self) -> int:
+        """
+        bit 들로 이루어진 값을 int 값으로 읽을 수 있도록 만드는 함수
+        :return: int 값으로 리턴
+        """
+        res = BitOperation.binary_to_decimal(self.bits)
+        if self.sign:
+            return -res
+        return res
+
+    def __str__(self) -> str:
+        return str(self.val())
+
+    def __repr__(self) -> str:
+        return 'BigInteger({})'.format(self.__str__())
+
+    def __len__(self) -> int:
+        """
+        field 의 비트 수
+        """
+        return len(self.bits)
+
+    def is_zero(self) -> bool:
+        return not self.bits
+
+    def is_negative(self) -> Bit:
+        return self.sign
+
+    # field ( 0 이상의 값 ) 연산
+
+    @staticmethod
+    def trim_bits(a: List[Bit]) -> List[Bit]:
+        """
+        Bit List 앞의 0을 제거
+        """
+        first = BitOperation.first_bit_index(a)
+        return list(a[first:]) if first else list(a)
+
+    @staticmethod
+    def compare_bits(a: List[Bit], b: List[Bit]) -> int:
+        """
+        앞의 0이 없는 두 Bit List 의 비교
+        :return: a < b 일 경우 -1, a == b 일 경우 0, a > b 일 경우 1
+        """
+        if len(a) != len(b):
+            return -1 if len(a) < len(b) else 1
+        if BitOperation.raw_eq_bits(a, b):
+            return 0
+        return -1 if BitOperation.raw_le_bits(a, b) else 1
+
+    @staticmethod
+    def add_bits(a: List[Bit], b: List[Bit]) -> List[Bit]:
+        """
+        두 Bit List 의 덧셈, 결과가 넘치지 않도록 긴 값보다 1 bit 길게 더함
+        """
+        length = max(len(a), len(b)) + 1
+        a, b = BitOperation.equalize_bit_length(a, b, length)
+        res, _ = Arithmetic.raw_add_bits(a, b)
+        return BigInteger.trim_bits(res)
+
+    @staticmethod
+    def sub_bits(a: List[Bit], b: List[Bit]) -> List[Bit]:
+        """
+        a >= b 인 두 Bit List 의 뺄셈
+        """
+        a, b = BitOperation.equalize_bit_length(a, b, len(a))
+        res, _ = Arithmetic.raw_sub_bits(a, b)
+        return BigInteger.trim_bits(res)
+
+    @staticmethod
+    def shift_bits(a: List[Bit], index: int) -> List[Bit]:
+        """
+        Bit List 의 left-shift ( << ), 길이를 index 만큼 늘림
+        """
+        return a + BitOperation.empty_bits(index) if a else []
+
+    @staticmethod
+    def split_bits(a: List[Bit], size: int, count: int) -> List[List[Bit]]:
+        """
+        Bit List 를 LSB 부터 size bit 씩 count 개로 나눔, 마지막 부분은 남은 상위 비트 전부
+        :return: 하위 자리부터의 Bit List 들
+        """
+        end = len(a)
+        parts = []
+        for i in range(count):
+            start = 0 if i == count - 1 else max(end - size, 0)
+            parts.append(BigInteger.trim_bits(a[start:end]) if end > 0 else [])
+            end -= size
+        return parts
+
+    @staticmethod
+    def div3_bits(a: List[Bit]) -> List[Bit]:
+        """
+        3 의 배수인 Bit List 를 3 으로 나눔
+        MSB 부터 나머지 ( 0, 1, 2 ) 만 가지고 한 번 반복하므로 길이에 비례하는 시간에 계산
+        """
+        res = []
+        remain = 0
+        for bit in a:
+            q, remain = _DIV3[remain << 1 | bit.val]
+            res.append(q)
+        return BigInteger.trim_bits(res)
+
+    @staticmethod
+    def schoolbook_mul_bits(a: List[Bit], b: List[Bit]) -> List[Bit]:
+        """
+        Arithmetic.raw_mul_bits ( b 의 1인 비트마다 a 를 shift 하여 더함 ) 를 통한 곱셈
+        결과가 넘치지 않도록 두 길이의 합으로 맞춰 곱함
+        """
+        if len(a) < len(b):
+            a, b = b, a
+        length = len(a) + len(b)
+        res = Arithmetic.raw_mul_bits(BitOperation.fit_bits(a, length), BitOperation.fit_bits(b, length))
+        return BigInteger.trim_bits(res)
+
+    @staticmethod
+    def karatsuba_mul_bits(a: List[Bit], b: List[Bit]) -> List[Bit]:
+        """
+        Karatsuba 곱셈
+        a = a1 * 2^m + a0, b = b1 * 2^m + b0 일 때
+        a * b = z2 * 2^2m + (z1 - z2 - z0) * 2^m + z0
+        ( z0 = a0 * b0, z2 = a1 * b1, z1 = (a0 + a1) * (b0 + b1) )
+        3 번의 절반 길이 곱셈은 다시 mul_bits 로 길이에 맞는 방식으로 곱함
+        """
+        m = max(len(a), len(b)) // 2
+        a0, a1 = BigInteger.split_bits(a, m, 2)
+        b0, b1 = BigInteger.split_bits(b, m, 2)
+        z0 = BigInteger.mul_bits(a0, b0)
+        z2 = BigInteger.mul_bits(a1, b1)
+        z1 = BigInteger.mul_bits(BigInteger.add_bits(a0, a1), BigInteger.add_bits(b0, b1))
+        z1 = BigInteger.sub_bits(BigInteger.sub_bits(z1, z2), z0)
+        res = BigInteger.add_bits(BigInteger.shift_bits(z2, 2 * m), BigInteger.shift_bits(z1, m))
+        return BigInteger.add_bits(res, z0)
+
+    @staticmethod
+    def toom3_mul_bits(a: List[Bit], b: List[Bit]) -> List[Bit]:
+        """
+        Toom-3 곱셈
+        a, b 를 k bit 씩 3 부분으로 나눈 2차 다항식 p(x), q(x) 로 보고 ( x = 2^k )
+        x = 0, 1, -1, -2, ∞ 에서의 값을 곱한 5 개의 값으로 4차 다항식 r(x) = p(x) q(x) 의 계수를 구함 ( Bodrato 보간 )
+        5 번의 1/3 길이 곱셈은 다시 mul_bits 로 길이에 맞는 방식으로 곱함
+        """
+        k = (max(len(a), len(b)) + 2) // 3
+        p = BigInteger._evaluate(*BigInteger.split_bits(a, k, 3))
+        q = BigInteger._evaluate(*BigInteger.split_bits(b, k, 3))
+        r0, r1, rm1, rm2, rinf = [BigInteger._signed_mul(x, y) for x, y in zip(p, q)]
+
+        c3 = BigInteger._signed_div(BigInteger._signed_sub(rm2, r1), 3)
+        c1 = BigInteger._signed_div(BigInteger._signed_sub(r1, rm1), 2)
+        c2 = BigInteger._signed_sub(rm1, r0)
+        c3 = BigInteger._signed_add(BigInteger._signed_div(BigInteger._signed_sub(c2, c3), 2),
+                                    (False, BigInteger.shift_bits(rinf[1], 1)))
+        c2 = BigInteger._signed_sub(BigInteger._signed_add(c2, c1), rinf)
+        c1 = BigInteger._signed_sub(c1, c3)
+
+        res = []
+        for i, (_, c) in enumerate((r0, c1, c2, c3, rinf)):
+            res = BigInteger.add_bits(res, BigInteger.shift_bits(c, i * k))
+        return res
+
+    @staticmethod
+    def mul_bits(a: List[Bit], b: List[Bit]) -> List[Bit]:
+        """
+        앞의 0이 없는 두 Bit List 의 곱셈
+        짧은 값의 길이에 따라 schoolbook, Karatsuba, Toom-3 중 하나로 곱함
+        """
+        if not a or not b:
+            return []
+        length = min(len(a), len(b))
+        if length < BigInteger.karatsuba_threshold:
+            return BigInteger.schoolbook_mul_bits(a, b)
+        if length < BigInteger.toom3_threshold:
+            return BigInteger.karatsuba_mul_bits(a, b)
+        return BigInteger.toom3_mul_bits(a, b)
+
+    @staticmethod
+    def divmod_bits(a: List[Bit], b: List[Bit]) -> (List[Bit], List[Bit]):
+        """
+        앞의 0이 없는 두 Bit List 의 나눗셈
+        Arithmetic.divmod_bits 로 몫과 나머지를 함께 구하고 Newton-Raphson 나눗셈의 곱셈은 mul_bits 를 사용
+        :return: 몫, 나머지
+        """
+        quotient, remain = Arithmetic.divmod_bits(a, b, max(len(a), len(b)), BigInteger.mul_bits)
+        return BigInteger.trim_bits(quotient), BigInteger.trim_bits(remain)
+
+    # Toom-3 의 부호 있는 중간 값 연산
+
+    @staticmethod
+    def _evaluate(m0: List[Bit], m1: List[Bit], m2: List[Bit]) -> List[Signed]:
+        """
+        p(x) = m2 x^2 + m1 x + m0 의 x = 0, 1, -1, -2, ∞ 에서의 값
+        """
+        t = BigInteger.add_bits(m0, m2)
+        pm1 = BigInteger._signed_sub((False, t), (False, m1))
+        sum2 = BigInteger._signed_add(pm1, (False, m2))
+        pm2 = BigInteger._signed_sub((sum2[0], BigInteger.shift_bits(sum2[1], 1)), (False, m0))
+        return [(False, m0), (False, BigInteger.add_bits(t, m1)), pm1, pm2, (False, m2)]
+
+    @staticmethod
+    def _signed_add(x: Signed, y: Signed) -> Signed:
+        if x[0] == y[0]:
+            return x[0], BigInteger.add_bits(x[1], y[1])
+        order = BigInteger.compare_bits(x[1], y[1])
+        if order >= 0:
+            return x[0] and order > 0, BigInteger.sub_bits(x[1], y[1])
+        return y[0], BigInteger.sub_bits(y[1], x[1])
+
+    @staticmethod
+    def _signed_sub(x: Signed, y: Signed) -> Signed:
+        return BigInteger._signed_add(x, (not y[0] and bool(y[1]), y[1]))
+
+    @staticmethod
+    def _signed_mul(x: Signed, y: Signed) -> Signed:
+        res = BigInteger.mul_bits(x[1], y[1])
+        return x[0] != y[0] and bool(res), res
+
+    @staticmethod
+    def _signed_div(x: Signed, divisor: int) -> Signed:
+        """
+        2 또는 3 의 배수인 값을 나눔
+        """
+        if divisor == 2:
+            return x[0], x[1][:-1]
+        return x[0], BigInteger.div3_bits(x[1])
+
+    # operator overloading
+
+    def __neg__(self) -> "BigInteger":
+        """
+        sign minus 연산( - )을 위한 operator overloading
+        :return: 새로운 BigInteger 객체로 return
+        """
+        return BigInteger(self.bits, ~self.sign)
+
+    def __abs__(self) -> "BigInteger":
+        return BigInteger(self.bits)
+
+    def __add__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Binary Add 연산 ( + )을 위한 operator overloading
+        부호가 같으면 절대값을 더하고 다르면 큰 절대값에서 작은 절대값을 뺌
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        sign, bits = BigInteger._signed_add((bool(self.sign), self.bits), (bool(other.sign), other.bits))
+        return BigInteger(bits, Bit(sign))
+
+    def __sub__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Binary Sub 연산 ( - )을 위한 operator overloading
+        음수로 변경한 후 add 연산
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        return self + (-other)
+
+    def __mul__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Binary Mul 연산 ( * )을 위한 operator overloading
+        길이에 따라 schoolbook, Karatsuba, Toom-3 곱셈 ( mul_bits )
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        return BigInteger(BigInteger.mul_bits(self.bits, other.bits), self.sign ^ other.sign)
+
+    def __truediv__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Binary Div 연산 ( / )을 위한 operator overloading
+        Integer 와 같이 0 방향으로 버린 몫
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        quotient, _ = BigInteger.divmod_bits(self.bits, other.bits)
+        return BigInteger(quotient, self.sign ^ other.sign)
+
+    def __divmod__(self, other: "BigInteger") -> ("BigInteger", "BigInteger"):
+        """
+        divmod 연산을 위한 operator overloading
+        몫과 나머지를 한 번의 나눗셈으로 구하고 python int 와 같이 몫은 내림하고 나머지는 other 와 같은 부호
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체의 몫, 나머지
+        """
+        quotient, remain = BigInteger.divmod_bits(self.bits, other.bits)
+        sign = self.sign ^ other.sign
+        if sign and remain:
+            quotient = BigInteger.add_bits(quotient, [Bit(True)])
+            remain = BigInteger.sub_bits(other.bits, remain)
+        return BigInteger(quotient, sign), BigInteger(remain, other.sign)
+
+    def __floordiv__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Floor Div 연산 ( // )을 위한 operator overloading
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        quotient, _ = divmod(self, other)
+        return quotient
+
+    def __mod__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Mod 연산 ( % )을 위한 operator overloading
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        _, remain = divmod(self, other)
+        return remain
+
+    def __and__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Bit And 연산( & )을 위한 operator overloading
+        Integer 와 같이 field 와 sign 을 각각 연산
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        length = max(len(self.bits), len(other.bits))
+        return BigInteger(BitOperation.and_bits(self.bits, other.bits, length), self.sign & other.sign)
+
+    def __or__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Bit OR 연산( | )을 위한 operator overloading
+        Integer 와 같이 field 와 sign 을 각각 연산
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        length = max(len(self.bits), len(other.bits))
+        return BigInteger(BitOperation.or_bits(self.bits, other.bits, length), self.sign | other.sign)
+
+    def __xor__(self, other: "BigInteger") -> "BigInteger":
+        """
+        Bit XOR 연산( ^ )을 위한 operator overloading
+        Integer 와 같이 field 와 sign 을 각각 연산
+        :param other: BigInteger 타입 가정
+        :return: 새로운 BigInteger 객체로 return
+        """
+        length = max(len(self.bits), len(other.bits))
+        return BigInteger(BitOperation.xor_bits(self.bits, other.bits, length), self.sign ^ other.sign)
+
+    def __lshift__(self, num: int) -> "BigInteger":
+        """
+        num 만큼 left shift ( << ) 연산을 위한 operator overloading
+        길이가 정해지지 않았으므로 넘치는 비트 없이 2^num 을 곱한 값
+        :param num: shift 하는 크기
+        :return: 새로운 BigInteger 객체로 return
+        """
+        return BigInteger(BigInteger.shift_bits(self.bits, num), self.sign)
+
+    def __rshift__(self, num: int) -> "BigInteger":
+        """
+        num 만큼 right shift ( >> ) 연산을 위한 operator overloading
+        절대값의 하위 num 비트를 버림
+        :param num: shift 하는 크기
+        :return: 새로운 BigInteger 객체로 return
+        """
+        return BigInteger(self.bits[:max(len(self.bits) - num, 0)], self.sign)
+
+    def _compare(self, other: "BigInteger") -> int:
+        if self.sign != other.sign:
+            return -1 if self.sign else 1
+        order = BigInteger.compare_bits(self.bits, other.bits)
+        return -order if self.sign else order
+
+    def __eq__(self, other: "BigInteger") -> bool:
+        if not isinstance(other, BigInteger):
+            return NotImplemented
+        return self._compare(other) == 0
+
+    __hash__ = None
+
+    def __lt__(self, other: "BigInteger") -> bool:
+        return self._compare(other) < 0
+
+    def __le__(self, other: "BigInteger") -> bool:
+        return self._compare(other) <= 0
+
+    def __gt__(self, other: "BigInteger") -> bool:
+        return self._compare(other) > 0
+
+    def __ge__(self, other: "BigInteger") -> bool:
+        return self._compare(other) >= 0
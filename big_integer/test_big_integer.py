@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from big_integer.big_integer import BigInteger, Bit
+
+
+def test_big_integer_init():
+    assert str(BigInteger('12345678901234567890123')) == '12345678901234567890123'
+    assert str(BigInteger('-3')) == '-3'
+    assert BigInteger(-2 ** 100).val() == -2 ** 100
+    assert BigInteger('0').bits == [] and BigInteger('-0').sign == Bit()
+
+
+def test_big_integer_plus():
+    assert BigInteger('5') + BigInteger('-10') == BigInteger('-5')
+    assert BigInteger('25') + BigInteger('-10') == BigInteger('15')
+    assert BigInteger('-5') - BigInteger('-5') == BigInteger('0')
+    assert (BigInteger(2 ** 200 - 1) + BigInteger(1)).val() == 2 ** 200
+
+
+def test_big_integer_multiplication():
+    assert BigInteger('-107') * BigInteger('97') == BigInteger('-10379')
+    assert BigInteger('-107') * BigInteger('-97') == BigInteger('10379')
+    assert BigInteger('107') * BigInteger('0') == BigInteger('0')
+
+
+def test_big_integer_division():
+    assert BigInteger('20') / BigInteger('-4') == BigInteger('-5')
+    assert BigInteger('-21') / BigInteger('4') == BigInteger('-5')
+    assert BigInteger('5') / BigInteger(2 ** 100) == BigInteger('0')
+    with pytest.raises(ZeroDivisionError):
+        BigInteger('6') / BigInteger('0')
+
+
+def test_big_integer_bit_operation():
+    x, y = 0b1100 << 70, 0b1010 << 70
+    assert (BigInteger(x) & BigInteger(y)).val() == x & y
+    assert (BigInteger(x) | BigInteger(y)).val() == x | y
+    assert (BigInteger(x) ^ BigInteger(y)).val() == x ^ y
+    assert (BigInteger('-3') << 100).val() == -3 << 100
+    assert (BigInteger(x) >> 72).val() == x >> 72
+
+
+def test_big_integer_compare():
+    values = [-2 ** 80, -5, -1, 0, 3, 2 ** 80]
+    for x in values:
+        for y in values:
+            assert (BigInteger(x) < BigInteger(y)) == (x < y)
+            assert (BigInteger(x) <= BigInteger(y)) == (x <= y)
+            assert (BigInteger(x) == BigInteger(y)) == (x == y)
+            assert (BigInteger(x) >= BigInteger(y)) == (x >= y)
+
+
+@pytest.mark.parametrize('mul', [BigInteger.schoolbook_mul_bits, BigInteger.karatsuba_mul_bits,
+                                 BigInteger.toom3_mul_bits])
+def test_big_integer_mul_bits(mul, monkeypatch):
+    # 재귀 곱셈도 각 방식을 거치도록 threshold 를 낮춤
+    monkeypatch.setattr(BigInteger, 'karatsuba_threshold', 8)
+    monkeypatch.setattr(BigInteger, 'toom3_threshold', 24)
+    rand = random.Random(0)
+    for length in (1, 2, 7, 33, 100, 257):
+        for _ in range(5):
+            x, y = rand.getrandbits(length), rand.getrandbits(rand.randint(1, length))
+            assert BigInteger(mul(BigInteger(x).bits, BigInteger(y).bits)).val() == x * y
+
+
+def test_big_integer_4096bit():
+    rand = random.Random(4096)
+    x, y = rand.getrandbits(4096), -rand.getrandbits(4096)
+    assert (BigInteger(x) * BigInteger(y)).val() == x * y
+    assert (BigInteger(x) + BigInteger(y)).val() == x + y
+    assert (BigInteger(x * y) / BigInteger(y)).val() == x
+
+
+def test_big_integer_divmod():
+    rand = random.Random(25)
+    for _ in range(20):
+        x = rand.getrandbits(300) * rand.choice((1, -1))
+        y = rand.getrandbits(rand.randint(1, 200)) * rand.choice((1, -1))
+        if y == 0:
+            continue
+        quotient, remain = divmod(BigInteger(x), BigInteger(y))
+        assert (quotient.val(), remain.val()) == divmod(x, y)
+        assert (BigInteger(x) // BigInteger(y)).val() == x // y
+        assert (BigInteger(x) % BigInteger(y)).val() == x % y
+    with pytest.raises(ZeroDivisionError):
+        BigInteger('0') % BigInteger('0')
@@ -3,12 +3,35 @@
 class Bit:
     """
     bit 표현
+
+    0과 1 두 개의 값만 존재하므로 불변(immutable) 객체로 구현하고
+    Bit.ZERO, Bit.ONE 두 객체를 공유하는 flyweight 로 사용
+    Bit(val) 생성자는 새 객체를 만들지 않고 공유 객체를 return
     """
-    def __init__(self, val: bool = False):
-        self.val: bool = val
+    __slots__ = ('val',)
+
+    ZERO: "Bit"
+    ONE: "Bit"
+
+    def __new__(cls, val: bool = False):
+        if val:
+            return cls.ONE
+        return cls.ZERO
+
+    def __setattr__(self, key, value):
+        raise AttributeError('Bit 는 불변 객체이므로 값을 변경할 수 없음')
+
+    def __delattr__(self, key):
+        raise AttributeError('Bit 는 불변 객체이므로 값을 변경할 수 없음')
 
-    def set(self, _val: bool):
-        self.val = _val
+    def __reduce__(self):
+        return Bit, (self.val,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self):
         return str(int(self.val))
@@ -16,12 +39,17 @@ class Bit:
     def __repr__(self):
         return self.__str__()
 
+    def __hash__(self):
+        return hash(self.val)
+
     def __invert__(self):
         """
         Bit invert 연산( ~ )을 위한 operator overloading
-        :return: 새로운 Bit 객체로 return
+        :return: 공유 Bit 객체로 return
         """
-        return Bit(not self.val)
+        if self.val:
+            return _ZERO
+        return _ONE
 
     def __eq__(self, other: "Bit"):
         return self.val == other.val
@@ -30,33 +58,45 @@ class Bit:
         """
         Greater 연산 ( > )을 위한 operator overloading
         :param other: Bit 타입 가정
-        :return: 새로운 Bit 객체로 return
+        :return: 비교 결과 bool
         """
         return self.val and not other.val
 
     def __xor__(self, other: "Bit"):
         """
         Bit XOR 연산( ^ )을 위한 operator overloading
-        :param other: Bit 타입 가정
-        :return: 새로운 Bit 객체로 return
+        :param other: Bit 타입 가정, Bit 가 아닐 경우 상대 타입의 연산에 위임
+        :return: 공유 Bit 객체로 return
         """
-        return Bit(self.val ^ other.val)
+        if other.__class__ is not Bit:
+            return NotImplemented
+        if self.val ^ other.val:
+            return _ONE
+        return _ZERO
 
     def __and__(self, other: "Bit"):
         """
         Bit AND 연산( & )을 위한 operator overloading
-        :param other: Bit 타입 가정
-        :return: 새로운 Bit 객체로 return
+        :param other: Bit 타입 가정, Bit 가 아닐 경우 상대 타입의 연산에 위임
+        :return: 공유 Bit 객체로 return
         """
-        return Bit(self.val & other.val)
+        if other.__class__ is not Bit:
+            return NotImplemented
+        if self.val and other.val:
+            return _ONE
+        return _ZERO
 
     def __or__(self, other: "Bit"):
         """
         Bit Or 연산( | )을 위한 operator overloading
-        :param other: Bit 타입 가정
-        :return: 새로운 Bit 객체로 return
+        :param other: Bit 타입 가정, Bit 가 아닐 경우 상대 타입의 연산에 위임
+        :return: 공유 Bit 객체로 return
         """
-        return Bit(self.val | other.val)
+        if other.__class__ is not Bit:
+            return NotImplemented
+        if self.val or other.val:
+            return _ONE
+        return _ZERO
 
     def __bool__(self):
         """
@@ -64,3 +104,17 @@ class Bit:
         :return: val 값
         """
         return self.val
+
+
+def _make_bit(val: bool) -> Bit:
+    """
+    공유 Bit 객체를 생성하는 함수
+    모듈 로딩 시점에 ZERO, ONE 두 번만 호출됨
+    """
+    bit = object.__new__(Bit)
+    object.__setattr__(bit, 'val', val)
+    return bit
+
+
+_ZERO = Bit.ZERO = _make_bit(False)
+_ONE = Bit.ONE = _make_bit(True)
@@ -0,0 +1,28 @@
+import copy
+import pickle
+
+import pytest
+from bit.bit import Bit
+
+
+def test_bit_flyweight1():
+    assert Bit() is Bit.ZERO
+    assert Bit(True) is Bit.ONE
+
+
+def test_bit_flyweight2():
+    assert (Bit(True) & Bit(True)) is Bit.ONE
+    assert (Bit(True) ^ Bit(True)) is Bit.ZERO
+    assert (~Bit()) is Bit.ONE
+
+
+def test_bit_immutable():
+    bit = Bit(True)
+    with pytest.raises(AttributeError):
+        bit.val = False
+    assert Bit(True).val
+
+
+def test_bit_copy():
+    assert copy.deepcopy(Bit(True)) is Bit.ONE
+    assert pickle.loads(pickle.dumps(Bit())) is Bit.ZERO
@@ -0,0 +1,173 @@
+import time
+from array import array
+from typing import Callable, List
+
+from alu.alu import ALU
+from alu.control_signal import ControlSignal
+from cpu.instruction import Opcode, IMMEDIATE, REGISTER_COUNT, decode, sign_extend, load_program
+from word.word import Word
+
+
+class CPU:
+    """
+    ALU 를 실행 장치로 사용하는 register machine interpreter
+
+    register 는 REGISTER_COUNT 개의 Word 이고 ALU 연산의 결과는 ALU.func 의 out 으로 register 에 직접 저장
+    프로그램을 불러올 때 모든 명령어를 (처리 함수, rd, rs1, operand) 로 한 번만 해석 (decode) 해두고
+    실행 중에는 opcode 마다 미리 만든 jump table 의 처리 함수를 호출하므로 ControlSignal 을 다시 찾지 않음
+    """
+
+    def __init__(self, alu: ALU = None, length: int = Word.length):
+        self.alu = alu or ALU(compiled=True)
+        self.length = length
+        self.word = Word.of_width(length)
+        self.registers: List[Word] = [self.word() for _ in range(REGISTER_COUNT)]
+        self.program: list = []
+        self.opcodes = array('B')
+        self.pc = 0
+        self.halted = False
+        self.executed = 0
+        self.elapsed = 0.0
+        self.table: List[Callable] = self._jump_table()
+
+    def _jump_table(self) -> List[Callable]:
+        """
+        opcode (0 ~ 255) 를 index 로 하는 명령어 처리 함수 List
+        처리 함수는 (pc, rd, rs1, operand) 를 받아 다음 pc 를 return
+        """
+        table = [self._undefined] * 256
+        for signal in ControlSignal:
+            table[signal.code] = self._alu_register(signal)
+            table[signal.code | IMMEDIATE] = self._alu_immediate(signal)
+        for op, handler in self._load_handlers().items():
+            table[op] = handler
+        for op, handler in self._branch_handlers().items():
+            table[op] = handler
+        return table
+
+    @staticmethod
+    def _undefined(pc, rd, rs1, operand):
+        raise ValueError('정의되지 않은 opcode 의 명령어 (pc: {})'.format(pc))
+
+    def _alu_register(self, signal: ControlSignal) -> Callable:
+        """
+        register 두 개를 연산하는 ALU 명령어 처리 함수
+        """
+        registers = self.registers
+        func = self.alu.func
+
+        def execute(pc, rd, rs1, rs2):
+            func(registers[rs1], registers[rs2], signal, registers[rd])
+            return pc + 1
+        return execute
+
+    def _alu_immediate(self, signal: ControlSignal) -> Callable:
+        """
+        register 와 immediate Word 를 연산하는 ALU 명령어 처리 함수
+        """
+        registers = self.registers
+        func = self.alu.func
+
+        def execute(pc, rd, rs1, imm):
+            func(registers[rs1], imm, signal, registers[rd])
+            return pc + 1
+        return execute
+
+    def _load_handlers(self) -> dict:
+        """
+        LI, LUI 명령어 처리 함수
+        LUI 는 immediate 를 register 의 상위 절반 ( length // 2 bit 위 ) 으로 옮김
+        """
+        registers = self.registers
+        mask = (1 << self.length) - 1
+        upper = self.length // 2
+
+        def li(pc, rd, rs1, imm):
+            registers[rd].value = imm.value
+            return pc + 1
+
+        def lui(pc, rd, rs1, imm):
+            registers[rd].value = imm << upper & mask
+            return pc + 1
+        return {Opcode.LI: li, Opcode.LUI: lui}
+
+    def _branch_handlers(self) -> dict:
+        """
+        JMP, BZ, BNZ, HALT 명령어 처리 함수
+        """
+        registers = self.registers
+
+        def jmp(pc, rd, rs1, offset):
+            return pc + offset
+
+        def bz(pc, rd, rs1, offset):
+            return pc + 1 if registers[rs1].value else pc + offset
+
+        def bnz(pc, rd, rs1, offset):
+            return pc + offset if registers[rs1].value else pc + 1
+
+        def halt(pc, rd, rs1, operand):
+            self.halted = True
+            return len(self.program)
+        return {Opcode.JMP: jmp, Opcode.BZ: bz, Opcode.BNZ: bnz, Opcode.HALT: halt}
+
+    def load(self, program) -> "CPU":
+        """
+        32 bit 명령어들을 불러와 해석
+        immediate operand ( LUI 제외 ) 는 부호 확장한 Word, 분기 offset 은 부호 있는 int 로 미리 변환
+        :param program: 32 bit 명령어들 (array, List 등)
+        :return: self
+        """
+        decoded = []
+        opcodes = array('B')
+        for instruction in program:
+            op, rd, rs1, operand = decode(instruction)
+            opcodes.append(op)
+            if (op & IMMEDIATE and op < Opcode.LI) or op == Opcode.LI:
+                operand = self.word(sign_extend(operand))
+            elif op in (Opcode.JMP, Opcode.BZ, Opcode.BNZ):
+                operand = sign_extend(operand)
+            decoded.append((self.table[op], rd, rs1, operand))
+        self.program = decoded
+        self.opcodes = opcodes
+        self.pc = 0
+        self.halted = False
+        return self
+
+    def load_file(self, path: str) -> "CPU":
+        """
+        save_program 으로 저장한 명령어 파일을 불러와 해석
+        :param path: 명령어 파일 경로
+        :return: self
+        """
+        return self.load(load_program(path))
+
+    def run(self, max_steps: int = None) -> int:
+        """
+        HALT 명령어를 만나거나 프로그램의 끝에 도달할 때까지 실행
+        :param max_steps: 최대 실행 명령어 수, 없을 경우 제한 없음
+        :return: 실행한 명령어 수
+        """
+        program = self.program
+        end = len(program)
+        pc = self.pc
+        steps = 0
+        limit = -1 if max_steps is None else max_steps
+        start = time.perf_counter()
+        while 0 <= pc < end and steps != limit:
+            handler, rd, rs1, operand = program[pc]
+            pc = handler(pc, rd, rs1, operand)
+            steps += 1
+        self.elapsed += time.perf_counter() - start
+        self.executed += steps
+        self.pc = pc
+        return steps
+
+    def ips(self) -> float:
+        """
+        지금까지 실행한 명령어의 초당 실행 수 (instructions per second)
+        """
+        return self.executed / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        return '{} instructions, {:.3f} s, {:.0f} IPS'.format(self.executed, self.elapsed, self.ips())
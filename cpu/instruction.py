@@ -0,0 +1,96 @@
+import enum
+import sys
+from array import array
+from typing import List
+
+from alu.control_signal import ControlSignal
+
+
+class Opcode(enum.IntEnum):
+    """
+    ALU 연산 외의 명령어 opcode
+
+    opcode 0x00 ~ 0x3f 는 ControlSignal.code 를 그대로 사용하는 ALU 연산 ( rd = rs1 op rs2 )
+    opcode 0x40 ~ 0x7f 는 IMMEDIATE 비트가 더해진 ALU 연산 ( rd = rs1 op imm )
+    """
+    LI = 0x80     # rd = imm
+    LUI = 0x81    # rd = imm << (length // 2), 32 bit 의 경우 imm << 16
+    JMP = 0x82    # pc = pc + imm
+    BZ = 0x83     # rs1 == 0 일 경우 pc = pc + imm
+    BNZ = 0x84    # rs1 != 0 일 경우 pc = pc + imm
+    HALT = 0xff   # 실행 종료
+
+
+IMMEDIATE = 0x40
+REGISTER_COUNT = 16
+
+
+def encode(op: ControlSignal or Opcode, rd: int = 0, rs1: int = 0, rs2: int = 0, imm: int = None) -> int:
+    """
+    명령어를 32 bit 값으로 부호화
+
+    | op (8 bit) | rd (4 bit) | rs1 (4 bit) | rs2 또는 imm (16 bit) |
+
+    :param op: ALU 연산의 ControlSignal 또는 Opcode
+    :param rd: 결과를 저장할 register
+    :param rs1: 첫 번째 operand register
+    :param rs2: 두 번째 operand register ( imm 이 없을 경우 )
+    :param imm: 16 bit immediate 값, ControlSignal 과 함께 주어질 경우 rs2 대신 사용
+    :return: 32 bit 명령어
+    """
+    if isinstance(op, ControlSignal):
+        code = op.code
+        if imm is not None:
+            code |= IMMEDIATE
+    else:
+        code = int(op)
+    operand = rs2 if imm is None else imm & 0xffff
+    if not (0 <= rd < REGISTER_COUNT and 0 <= rs1 < REGISTER_COUNT and 0 <= operand <= 0xffff):
+        raise ValueError('register 는 0 ~ {}, operand 는 16 bit 여야 함'.format(REGISTER_COUNT - 1))
+    return code << 24 | rd << 20 | rs1 << 16 | operand
+
+
+def decode(instruction: int) -> (int, int, int, int):
+    """
+    32 bit 명령어를 각 field 로 분리
+    :param instruction: 32 bit 명령어
+    :return: op, rd, rs1, rs2 또는 imm (16 bit)
+    """
+    return instruction >> 24, instruction >> 20 & 0xf, instruction >> 16 & 0xf, instruction & 0xffff
+
+
+def sign_extend(imm: int) -> int:
+    """
+    16 bit immediate 값을 부호 있는 int 로 변환
+    """
+    return imm - ((imm & 0x8000) << 1)
+
+
+def save_program(path: str, program: List[int]):
+    """
+    명령어들을 little-endian 32 bit 값으로 파일에 저장
+    :param path: 저장할 파일 경로
+    :param program: 32 bit 명령어들
+    """
+    words = array('I', program)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    with open(path, 'wb') as f:
+        words.tofile(f)
+
+
+def load_program(path: str) -> array:
+    """
+    save_program 으로 저장한 파일에서 명령어들을 읽음
+    :param path: 읽을 파일 경로
+    :return: 32 bit 명령어들의 array
+    """
+    words = array('I')
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) % words.itemsize:
+        raise ValueError('명령어 파일의 크기는 {} byte 의 배수여야 함'.format(words.itemsize))
+    words.frombytes(data)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
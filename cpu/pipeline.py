@@ -0,0 +1,166 @@
+from math import ceil
+from typing import Dict, List
+
+from alu.control_signal import ControlSignal
+from alu.profiler import GateProfiler
+from cpu.cpu import CPU
+from cpu.instruction import Opcode, IMMEDIATE
+from word.word import Word
+
+UNITS: Dict[str, tuple] = {
+    'logic': (ControlSignal.NOT, ControlSignal.AND, ControlSignal.NAND, ControlSignal.OR, ControlSignal.NOR,
+              ControlSignal.XOR, ControlSignal.XNOR),
+    'adder': (ControlSignal.INC, ControlSignal.DEC, ControlSignal.MINUS, ControlSignal.ADD, ControlSignal.SUB),
+    'shifter': (ControlSignal.LSHIFT, ControlSignal.RSHIFT, ControlSignal.SLL, ControlSignal.SRL, ControlSignal.SRA,
+                ControlSignal.ROL, ControlSignal.ROR),
+    'multiplier': (ControlSignal.MUL, ControlSignal.MULH),
+    'divider': (ControlSignal.DIV, ControlSignal.REM),
+    'bit_count': (ControlSignal.CLZ, ControlSignal.CTZ, ControlSignal.POPCNT, ControlSignal.PARITY),
+}
+
+
+class PipelineStats:
+    """
+    파이프라인 실행 결과 통계
+
+    cycles: 마지막 명령어의 writeback 까지 걸린 cycle 수
+    stalls: 원인별 stall cycle 수
+    - data: 앞 명령어의 결과를 기다린 cycle ( RAW hazard )
+    - structural: 여러 cycle 이 걸리는 실행 장치가 비기를 기다린 cycle
+    - control: 분기로 인해 버려진 fetch cycle
+    busy: 실행 장치별 사용 cycle 수 ( pipeline 된 실행 장치는 새 명령어를 받는 cycle 만 셈 )
+    """
+
+    def __init__(self):
+        self.instructions = 0
+        self.cycles = 0
+        self.stalls: Dict[str, int] = {'data': 0, 'structural': 0, 'control': 0}
+        self.busy: Dict[str, int] = {}
+
+    def cpi(self) -> float:
+        """
+        명령어 하나 당 평균 cycle 수 (cycles per instruction)
+        """
+        return self.cycles / self.instructions if self.instructions else 0.0
+
+    def utilization(self) -> Dict[str, float]:
+        """
+        실행 장치별 사용률 (사용 cycle 수 / 전체 cycle 수)
+        """
+        return {unit: busy / self.cycles for unit, busy in self.busy.items()} if self.cycles else {}
+
+    def __repr__(self) -> str:
+        return 'PipelineStats(instructions={}, cycles={}, cpi={:.2f}, stalls={})'.format(
+            self.instructions, self.cycles, self.cpi(), self.stalls)
+
+
+class Pipeline:
+    """
+    CPU 의 명령어 흐름을 fetch, decode, execute, writeback 4 단계의 in-order 파이프라인으로 실행하는 모드
+
+    명령어는 CPU 의 처리 함수로 실제로 실행하고 각 명령어가 각 단계에 들어가는 cycle 만 int 로 계산하므로
+    cycle 마다 Word 를 만들지 않고 명령어 수에 비례하는 시간에 cycle 단위 통계를 계산
+    - 각 단계는 한 번에 하나의 명령어만 가질 수 있고 앞 명령어가 단계를 비워야 다음 명령어가 들어감
+    - execute 단계의 latency 는 ALU 연산의 논리 깊이 (critical path) 를 cycle_depth 로 나눈 cycle 수
+    - pipelined 에 포함된 실행 장치는 매 cycle 새 명령어를 받고 나머지는 latency 동안 execute 단계를 차지
+    - forwarding 이 True 일 경우 execute 가 끝난 결과를 바로 다음 명령어가 사용하고
+      False 일 경우 writeback 이 끝난 다음 cycle 부터 사용
+    - 분기는 not-taken 으로 예측하고 execute 에서 분기할 경우 이후 fetch 한 명령어를 버림
+    """
+    stages = ('fetch', 'decode', 'execute', 'writeback')
+
+    def __init__(self, cpu: CPU, forwarding: bool = True, cycle_depth: int = 32, pipelined: tuple = ('multiplier',)):
+        self.cpu = cpu
+        self.forwarding = forwarding
+        self.cycle_depth = cycle_depth
+        self.pipelined = pipelined
+        self._latency: Dict[ControlSignal, int] = {}
+        self._unit = {signal: unit for unit, signals in UNITS.items() for signal in signals}
+
+    def latency(self, control: ControlSignal, length: int = Word.length) -> int:
+        """
+        ALU 연산의 execute 단계 cycle 수
+        GateProfiler 로 한 번 계측한 논리 깊이를 cycle_depth 로 나누어 올림
+        """
+        if control not in self._latency:
+            word = Word.of_width(length)
+            with GateProfiler() as profiler:
+                self.cpu.alu.func(word(), word(), control)
+            depth = profiler.reports[control].critical_path()
+            self._latency[control] = max(1, ceil(depth / self.cycle_depth))
+        return self._latency[control]
+
+    def _schedule(self) -> List[tuple]:
+        """
+        명령어마다 (읽는 register, 쓰는 register, 실행 장치, latency, 실행 장치의 pipeline 여부)
+        ControlSignal 의 opcode 로 ALU 연산을 구분
+        """
+        schedule = []
+        for op, (handler, rd, rs1, operand) in zip(self.cpu.opcodes, self.cpu.program):
+            if op < Opcode.LI:
+                control = ControlSignal.from_code(op & ~IMMEDIATE)
+                sources = (rs1,) if op & IMMEDIATE else (rs1, operand)
+                unit = self._unit[control]
+                schedule.append((sources, rd, unit, self.latency(control, self.cpu.length), unit in self.pipelined))
+            elif op in (Opcode.LI, Opcode.LUI):
+                schedule.append(((), rd, 'logic', 1, False))
+            elif op in (Opcode.BZ, Opcode.BNZ):
+                schedule.append(((rs1,), -1, 'branch', 1, False))
+            else:
+                schedule.append(((), -1, 'branch', 1, False))
+        return schedule
+
+    def run(self, max_steps: int = None) -> PipelineStats:
+        """
+        CPU 에 불러온 프로그램을 HALT 명령어를 만나거나 프로그램의 끝에 도달할 때까지 파이프라인으로 실행
+        :param max_steps: 최대 실행 명령어 수, 없을 경우 제한 없음
+        :return: PipelineStats
+        """
+        cpu = self.cpu
+        program = cpu.program
+        schedule = self._schedule()
+        stats = PipelineStats()
+        stalls = stats.stalls
+        busy = stats.busy
+        forwarding = self.forwarding
+
+        ready = [0] * len(cpu.registers)
+        fetch = decode = execute = writeback = -1
+        execute_free = fetch_ready = 0
+        end = len(program)
+        pc = cpu.pc
+        steps = 0
+        limit = -1 if max_steps is None else max_steps
+        while 0 <= pc < end and steps != limit:
+            sources, rd, unit, latency, pipelined = schedule[pc]
+
+            # fetch 단계는 앞 명령어가 decode 로 넘어가야 비고, 분기 후에는 분기 대상부터 다시 fetch
+            fetch = max(fetch + 1, decode, fetch_ready)
+            decode = max(fetch + 1, execute)
+            issue = max(decode + 1, execute_free)
+            stalls['structural'] += issue - (decode + 1)
+            operands = max([ready[r] for r in sources], default=0)
+            if operands > issue:
+                stalls['data'] += operands - issue
+                issue = operands
+            execute = issue
+            done = execute + latency
+            execute_free = execute + 1 if pipelined else done
+            writeback = max(done, writeback + 1)
+            if rd >= 0:
+                ready[rd] = done if forwarding else writeback + 1
+            busy[unit] = busy.get(unit, 0) + (1 if pipelined else latency)
+
+            handler, rd, rs1, operand = program[pc]
+            next_pc = handler(pc, rd, rs1, operand)
+            if next_pc != pc + 1 and next_pc < end:
+                stalls['control'] += done - (fetch + 1)
+                fetch_ready = done
+            pc = next_pc
+            steps += 1
+
+        cpu.pc = pc
+        cpu.executed += steps
+        stats.instructions = steps
+        stats.cycles = writeback + 1
+        return stats
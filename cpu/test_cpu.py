@@ -0,0 +1,124 @@
+import pytest
+
+from alu.alu import ALU
+from alu.control_signal import ControlSignal
+from cpu.cpu import CPU
+from cpu.instruction import Opcode, encode, decode, save_program, load_program
+
+
+def sum_program(n: int) -> list:
+    """
+    r2 = 1 + 2 + ... + n
+    """
+    return [
+        encode(Opcode.LI, rd=1, imm=n),
+        encode(Opcode.LI, rd=2, imm=0),
+        encode(ControlSignal.ADD, rd=2, rs1=2, rs2=1),
+        encode(ControlSignal.SUB, rd=1, rs1=1, imm=1),
+        encode(Opcode.BNZ, rs1=1, imm=-2),
+        encode(Opcode.HALT),
+    ]
+
+
+def test_encode():
+    instruction = encode(ControlSignal.SUB, rd=3, rs1=4, imm=-1)
+    assert decode(instruction) == (ControlSignal.SUB.code | 0x40, 3, 4, 0xffff)
+    assert decode(encode(ControlSignal.MUL, rd=15, rs1=1, rs2=2)) == (ControlSignal.MUL.code, 15, 1, 2)
+    with pytest.raises(ValueError):
+        encode(ControlSignal.ADD, rd=16)
+
+
+def test_cpu_run():
+    for alu in (ALU(), ALU(compiled=True)):
+        cpu = CPU(alu).load(sum_program(100))
+        assert cpu.run() == 2 + 3 * 100 + 1
+        assert cpu.halted
+        assert cpu.registers[2].value == 5050
+        assert cpu.ips() > 0
+
+
+def test_cpu_immediate():
+    cpu = CPU().load([
+        encode(Opcode.LUI, rd=1, imm=0x8001),
+        encode(ControlSignal.OR, rd=1, rs1=1, imm=0x7fff),
+        encode(Opcode.LI, rd=2, imm=-3),
+        encode(ControlSignal.SRA, rd=3, rs1=2, imm=1),
+        encode(Opcode.BZ, rs1=0, imm=2),
+        encode(Opcode.LI, rd=4, imm=1),
+        encode(ControlSignal.MUL, rd=5, rs1=2, rs2=2),
+    ])
+    cpu.run()
+    assert not cpu.halted
+    assert [register.value for register in cpu.registers[1:6]] == [0x80017fff, 0xfffffffd, 0xfffffffe, 0, 9]
+
+    for length, value in ((16, 0x1200), (8, 0x20)):
+        cpu = CPU(length=length).load([encode(Opcode.LUI, rd=1, imm=0x12)])
+        cpu.run()
+        assert cpu.registers[1].value == value
+
+
+def test_cpu_file(tmp_path):
+    path = str(tmp_path / 'sum.bin')
+    save_program(path, sum_program(1000))
+    assert list(load_program(path)) == sum_program(1000)
+    cpu = CPU().load_file(path)
+    assert cpu.run(max_steps=10) == 10
+    cpu.run()
+    assert cpu.registers[2].value == 500500
+    assert cpu.executed == 2 + 3 * 1000 + 1
+
+
+def test_pipeline():
+    from cpu.pipeline import Pipeline
+
+    independent = [encode(Opcode.LI, rd=r, imm=r) for r in range(1, 9)]
+    stats = Pipeline(CPU().load(independent)).run()
+    assert stats.instructions == 8
+    assert stats.cycles == 8 + len(Pipeline.stages) - 1
+    assert sum(stats.stalls.values()) == 0
+
+    chain = [encode(Opcode.LI, rd=1, imm=1)] + [encode(ControlSignal.XOR, rd=1, rs1=1, imm=3)] * 8
+    forwarded = Pipeline(CPU().load(chain)).run()
+    assert forwarded.stalls['data'] == 0
+    stalled = Pipeline(CPU().load(chain), forwarding=False).run()
+    assert stalled.stalls['data'] == 8
+    assert stalled.cpi() > forwarded.cpi()
+
+    cpu = CPU().load(sum_program(100))
+    pipeline = Pipeline(cpu, cycle_depth=1000)
+    stats = pipeline.run()
+    assert cpu.registers[2].value == 5050 and cpu.halted
+    assert stats.stalls['control'] == 2 * 99
+    assert pipeline.latency(ControlSignal.ADD) == 1
+
+    slow = Pipeline(CPU().load(sum_program(100)), cycle_depth=16)
+    assert slow.latency(ControlSignal.ADD) > 1
+    slow_stats = slow.run()
+    assert slow_stats.cycles > stats.cycles
+    assert slow_stats.stalls['structural'] > 0
+    assert 0 < slow_stats.utilization()['adder'] <= 1
+
+
+def test_pipeline_units():
+    from cpu.pipeline import Pipeline
+
+    program = [encode(Opcode.LI, rd=1, imm=12345), encode(Opcode.LI, rd=2, imm=67)]
+    program += [encode(ControlSignal.MUL, rd=3 + i, rs1=1, rs2=2) for i in range(4)]
+    program += [encode(ControlSignal.DIV, rd=8, rs1=1, rs2=2), encode(ControlSignal.REM, rd=9, rs1=1, rs2=2)]
+    pipeline = Pipeline(CPU().load(program))
+    stats = pipeline.run()
+    assert pipeline.latency(ControlSignal.DIV) > pipeline.latency(ControlSignal.MUL) > 1
+    assert pipeline.cpu.registers[3].value == 12345 * 67
+    assert pipeline.cpu.registers[8].value == 12345 // 67 and pipeline.cpu.registers[9].value == 12345 % 67
+    assert stats.busy['multiplier'] == 4
+    assert stats.stalls['structural'] >= pipeline.latency(ControlSignal.DIV) - 1
+
+
+def test_pipeline_utilization():
+    from cpu.pipeline import Pipeline
+
+    program = [encode(Opcode.LI, rd=1, imm=12345), encode(Opcode.LI, rd=2, imm=67)]
+    program += [encode(ControlSignal.MUL, rd=3 + i % 8, rs1=1, rs2=2) for i in range(200)]
+    stats = Pipeline(CPU().load(program)).run()
+    assert stats.busy['multiplier'] == 200
+    assert all(0 < utilization <= 1 for utilization in stats.utilization().values())
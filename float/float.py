@@ -3,6 +3,7 @@ from functools import reduce
 from bit.bit import Bit
 from nums.arithmetic import Arithmetic
 from nums.bit_operation import BitOperation
+from nums.bit_vector import BitVector
 from unsigned_integer.unsigned_integer import UnsignedInteger
 
 
@@ -36,7 +37,7 @@ class Float:
             self.exponents = self.default_exponent_field[::]
             self.fractions = self.default_fraction_field[::]
             self.set(exponents)
-        elif type(exponents) == list:
+        elif isinstance(exponents, (list, BitVector)):
             self.sign = sign
             self.exponents = exponents
             self.fractions = fractions
@@ -228,6 +229,26 @@ class Float:
             return -res
         return res
 
+    def to_bytes(self, byteorder: str = 'big') -> bytes:
+        """
+        sign, exponent, fraction 을 IEEE 754 단정밀도 형식의 bytes 로 변환
+        struct.pack('>f', ...) 와 같은 형식
+        :param byteorder: 'big' 또는 'little'
+        :return: bit_len // 8 byte 의 bytes
+        """
+        return BitOperation.bits_to_bytes([self.sign] + list(self.exponents) + list(self.fractions), byteorder)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, byteorder: str = 'big') -> "Float":
+        """
+        IEEE 754 단정밀도 형식의 bytes 를 Float 로 읽음
+        :param data: bit_len // 8 byte 의 bytes
+        :param byteorder: 'big' 또는 'little'
+        :return: Float 객체
+        """
+        bits = BitOperation.bytes_to_bits(data, cls.bit_len, byteorder)
+        return Float(bits[1:1 + cls.exponent_len], bits[1 + cls.exponent_len:], bits[0])
+
     def __str__(self) -> str:
         return str(self.val())
 
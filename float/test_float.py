@@ -150,3 +150,13 @@ def test_float_min_value2():
     for bit in Float.min_value().fractions[:-1]:
         assert bit == Bit()
     assert Float.min_value().fractions[-1] == Bit(True)
+
+
+def test_float_bytes():
+    import struct
+
+    for val in ('3.25', '-1.5', '0.1'):
+        assert Float(val).to_bytes() == struct.pack('>f', Float(val).val())
+        assert Float(val).to_bytes('little') == struct.pack('<f', Float(val).val())
+    assert Float.from_bytes(struct.pack('<f', -6.5), 'little').val() == -6.5
+    assert Float.from_bytes(struct.pack('>f', 0.0)).is_zero()
@@ -1,6 +1,7 @@
 from bit.bit import Bit
 from nums.arithmetic import Arithmetic
 from nums.bit_operation import BitOperation
+from nums.bit_vector import BitVector
 
 
 class Integer:
@@ -29,7 +30,7 @@ class Integer:
             self.sign = sign
             self.bits = BitOperation.empty_bits(self.field_len)
             self._set(bits)
-        elif type(bits) == list:
+        elif isinstance(bits, (list, BitVector)):
             self.sign = sign
             self.bits = bits
         else:
@@ -77,7 +78,7 @@ class Integer:
             self.sign = Bit()
         _int = _int % self.limit
         for i, x in enumerate(self.frame):
-            self.bits[i].set(bool(_int & x))
+            self.bits[i] = Bit(bool(_int & x))
 
     @classmethod
     def str_to_int(cls, val: str) -> "Integer":
@@ -121,6 +122,25 @@ class Integer:
             return -res
         return res
 
+    def to_bytes(self, byteorder: str = 'big') -> bytes:
+        """
+        sign bit 와 field 를 bit_len 비트의 bytes 로 변환
+        :param byteorder: 'big' 또는 'little'
+        :return: bit_len // 8 byte 의 bytes
+        """
+        return BitOperation.bits_to_bytes([self.sign] + list(self.bits), byteorder)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, byteorder: str = 'big') -> "Integer":
+        """
+        to_bytes 로 변환한 bytes 를 Integer 로 읽음
+        :param data: bit_len // 8 byte 의 bytes
+        :param byteorder: 'big' 또는 'little'
+        :return: Integer 객체
+        """
+        bits = BitOperation.bytes_to_bits(data, cls.bit_len, byteorder)
+        return Integer(bits[1:], bits[0])
+
     def __str__(self) -> str:
         return str(self.val())
 
@@ -156,11 +176,11 @@ class Integer:
         if self.is_negative():
             a_bits, _ = Arithmetic.complement_bits(self.bits, self.field_len)
         else:
-            a_bits = self.bits[::]
+            a_bits = self.bits
         if other.is_negative():
             b_bits, _ = Arithmetic.complement_bits(other.bits, self.field_len)
         else:
-            b_bits = other.bits[::]
+            b_bits = other.bits
 
         res, overflow = Arithmetic.add_bits(a_bits, b_bits, self.field_len)
         sign = self.sign ^ other.sign ^ overflow
@@ -195,6 +215,42 @@ class Integer:
         """
         return Integer(Arithmetic.div_bits(self.bits, other.bits, self.field_len), self.sign ^ other.sign)
 
+    def __divmod__(self, other: "Integer") -> ("Integer", "Integer"):
+        """
+        divmod 연산을 위한 operator overloading
+        Arithmetic.divmod_bits 로 몫과 나머지를 한 번의 나눗셈으로 구함
+        python int 와 같이 몫은 내림하고 나머지는 other 와 같은 부호
+        :param other: Integer 타입 가정
+        :return: 새로운 Integer 객체의 몫, 나머지
+        """
+        quotient, remain = Arithmetic.divmod_bits(self.bits, other.bits, self.field_len)
+        sign = self.sign ^ other.sign
+        if sign and not BitOperation.is_empty(remain):
+            quotient, _ = Arithmetic.add_bits(quotient, [Bit(True)], self.field_len)
+            remain, _ = Arithmetic.sub_bits(other.bits, remain, self.field_len)
+        if BitOperation.is_empty(quotient):
+            sign = Bit()
+        remain_sign = other.sign if not BitOperation.is_empty(remain) else Bit()
+        return Integer(quotient, sign), Integer(remain, remain_sign)
+
+    def __floordiv__(self, other: "Integer") -> "Integer":
+        """
+        Floor Div 연산 ( // )을 위한 operator overloading
+        :param other: Integer 타입 가정
+        :return: 새로운 Integer 객체로 return
+        """
+        quotient, _ = divmod(self, other)
+        return quotient
+
+    def __mod__(self, other: "Integer") -> "Integer":
+        """
+        Mod 연산 ( % )을 위한 operator overloading
+        :param other: Integer 타입 가정
+        :return: 새로운 Integer 객체로 return
+        """
+        _, remain = divmod(self, other)
+        return remain
+
     def __le__(self, other: "Integer") -> bool:
         """
         Low Equal 연산 ( <= )을 위한 operator overloading
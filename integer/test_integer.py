@@ -1,5 +1,6 @@
 import pytest
 from integer.integer import Integer, Bit
+from nums.bit_vector import BitVector
 
 
 def test_integer_init1():
@@ -130,3 +131,29 @@ def test_integer_min_value2():
     assert Integer.min_value().sign == Bit(True)
     for bit in bits:
         assert bit == Bit(True)
+
+
+def test_integer_bytes():
+    assert Integer('5').to_bytes() == b'\x00\x00\x00\x05'
+    assert Integer('-5').to_bytes('little') == b'\x05\x00\x00\x80'
+    assert Integer.from_bytes(b'\x80\x00\x01\x00') == Integer('-256')
+    assert Integer.from_bytes(Integer('-12345').to_bytes('little'), 'little').val() == -12345
+
+
+def test_integer_divmod():
+    for a in (20, -20, 21, -21, 0, 7):
+        for b in (4, -4, 6, -6, 25):
+            quotient, remain = divmod(Integer(str(a)), Integer(str(b)))
+            assert (quotient.val(), remain.val()) == divmod(a, b)
+            assert (Integer(str(a)) // Integer(str(b))).val() == a // b
+            assert (Integer(str(a)) % Integer(str(b))).val() == a % b
+    with pytest.raises(ZeroDivisionError):
+        Integer('6') % Integer('0')
+
+
+def test_integer_bit_vector():
+    integer = Integer(BitVector(5, 31))
+    assert integer.val() == 5
+    assert (integer + Integer('3')).val() == 8
+    integer._set(-12345)
+    assert integer.val() == -12345 and isinstance(integer.bits, BitVector)
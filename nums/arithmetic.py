@@ -2,9 +2,19 @@ from typing import List
 
 from bit.bit import Bit
 from nums.bit_operation import BitOperation
+from nums.bit_vector import BitVector
+
+_BITS = (Bit.ZERO, Bit.ONE)
+# a << 2 | b << 1 | carry 를 index 로 하는 전가산기 진리표, (합 Bit, carry)
+_FULL_ADDER = tuple((_BITS[(i >> 2 ^ i >> 1 ^ i) & 1], int(bin(i).count('1') >= 2)) for i in range(8))
+# Newton-Raphson 역수를 shift-subtract 나눗셈으로 바로 구하는 정확도
+_RECIPROCAL_BASE = 64
 
 
 class Arithmetic:
+    # raw_divmod_bits 가 Newton-Raphson 나눗셈을 사용하는 최소 비트 길이 ( benchmark/bench_divmod.py )
+    newton_threshold = 32768
+
     @staticmethod
     def complement_bits(a: List[Bit], length: int) -> (List[Bit], Bit):
         """
@@ -14,8 +24,7 @@ class Arithmetic:
         :param length: 원하는 Bit List의 길이
         :return: Bit List의 2의 보수 값
         """
-        a = BitOperation.fit_bits(a, length)
-        a = BitOperation.invert_bits(a)
+        a = BitOperation.invert_bits(BitOperation.view_bits(a, length))
         return Arithmetic.add_bits(a, [Bit(True)], length)
 
     @staticmethod
@@ -27,8 +36,8 @@ class Arithmetic:
         :param length: 원하는 Bit List의 길이
         :return: 2의 보수를 되돌린 Bit List 값
         """
-        a = BitOperation.fit_bits(a, length)
-        a, _ = Arithmetic.add_bits(a, [Bit(True) for _ in range(len(a))], length)
+        a = BitOperation.view_bits(a, length)
+        a, _ = Arithmetic.add_bits(a, [Bit(True)] * length, length)
         return BitOperation.invert_bits(a)
 
     @staticmethod
@@ -47,25 +56,38 @@ class Arithmetic:
         return Arithmetic.raw_add_bits(a, b)
 
     @staticmethod
-    def raw_add_bits(a: List[Bit], b: List[Bit]) -> (List[Bit], Bit):
+    def raw_add_bits(a: List[Bit], b: List[Bit], adder=None) -> (List[Bit], Bit):
         """
         같은 길이의 Bit List를 더하는 ( + ) 함수
         덧셈 결과 overflow 되었는지 여부를 함께 return
 
-        and ( & ) 연산, xor ( ^ ) 연산과 left-shift ( << ) 연산을 통해 덧셈을 구현
+        LSB 부터 MSB 까지 한 번 반복하며 각 자리의 합과 carry 를 전가산기 진리표 ( _FULL_ADDER ) 로 계산
+        결과 Bit List 는 a 를 한 번만 복사한 뒤 그 자리에 바로 저장하고
+        b 의 남은 상위 비트가 모두 0이고 carry 가 0이 되면 나머지는 a 와 같으므로 반복을 멈춤
+        재귀 없이 길이에 비례하는 시간에 계산하므로 긴 Bit List 도 RecursionError 없이 더할 수 있음
+        adder 가 주어질 경우 adder.add 를 통해 덧셈 ( alu.adder 의 덧셈기 구조 등 )
 
         :param a: 더할 Bit List
         :param b: 더할 Bit List
+        :param adder: add(a, b, carry_in) -> (합, carry_out) 를 가진 덧셈기
         :return: a + b의 값인 Bit List, overflow 된 Bit
         """
-        if BitOperation.is_empty(b):
-            return a, Bit()
-        carry_0 = BitOperation.raw_and_bits(a, b)
-        remain = BitOperation.raw_xor_bits(a, b)
-        carry = BitOperation.raw_lshift_bits(carry_0, 1)
-
-        res, overflow = Arithmetic.raw_add_bits(remain, carry)
-        return res, overflow ^ carry_0[0]
+        if adder is not None:
+            return adder.add(list(a), list(b), Bit())
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            a = BitVector.from_bits(a)
+            total = a.value + BitVector.from_bits(b).value
+            return BitVector(total, a.width), _BITS[total >> a.width & 1]
+
+        res = list(a)
+        top = BitOperation.first_bit_index(b)
+        table = _FULL_ADDER
+        carry = 0
+        for i in range(len(res) - 1, -1, -1):
+            if i < top and not carry:
+                break
+            res[i], carry = table[res[i].val << 2 | b[i].val << 1 | carry]
+        return res, _BITS[carry]
 
     @staticmethod
     def sub_bits(a: List[Bit], b: List[Bit], length: int) -> (List[Bit], Bit):
@@ -146,35 +168,62 @@ class Arithmetic:
     def raw_div_bits(a: List[Bit], b: List[Bit]) -> List[Bit]:
         """
         같은 길이의 Bit List를 나누는 ( / ) 함수
-
-        left-shift ( << ) 연산과 add ( + ) 연산, lower-equal ( <= ) 연산을 통해 나눗셈 구현
-        상위 비트부터 하위 비트까지 값을 빼면서 몫을 구함
+        raw_divmod_bits 의 몫
 
         :param a: / 앞의 Bit List
         :param b: 나눌 Bit List
         :return: a / b의 값인 Bit List
         """
-        if BitOperation.is_empty(b):
-            raise ZeroDivisionError()
+        quotient, _ = Arithmetic.raw_divmod_bits(a, b)
+        return quotient
 
-        remain = BitOperation.empty_bits(len(a))
-        res = BitOperation.empty_bits(len(a))
-        one = BitOperation.fit_bits(BitOperation.num_map['1'], len(a))
-
-        for i in range(len(a) - 1, -1, -1):
-            first_bit = BitOperation.first_bit_index(b)
-            if first_bit < i:
-                continue
-            div = BitOperation.raw_lshift_bits(b, i)
-            sum_val, overflow = Arithmetic.raw_add_bits(remain, div)
-            if overflow:
-                continue
-            if BitOperation.raw_le_bits(sum_val, a):
-                remain, _ = Arithmetic.raw_add_bits(remain, div)
-                quotient = BitOperation.raw_lshift_bits(one, i)
-                res = BitOperation.raw_or_bits(res, quotient)
+    @staticmethod
+    def divmod_bits(a: List[Bit], b: List[Bit], length: int, mul=None) -> (List[Bit], List[Bit]):
+        """
+        Bit List의 길이를 length로 맞춘 후 몫과 나머지를 함께 구하는 ( divmod ) 함수
+        raw_divmod_bits 함수를 통해 계산
+        :param a: 나눠질 Bit List
+        :param b: 나눌 Bit List
+        :param length: 원하는 Bit List의 길이
+        :param mul: Newton-Raphson 나눗셈에 사용할 곱셈 mul(a, b) ( 앞의 0이 없는 Bit List 의 곱 )
+        :return: 몫 Bit List, 나머지 Bit List
+        """
+        a, b = BitOperation.equalize_bit_length(a, b, length)
+        return Arithmetic.raw_divmod_bits(a, b, mul)
 
-        return res
+    @staticmethod
+    def raw_divmod_bits(a: List[Bit], b: List[Bit], mul=None) -> (List[Bit], List[Bit]):
+        """
+        같은 길이의 Bit List를 나누어 몫과 나머지를 함께 구하는 ( divmod ) 함수
+
+        몫의 길이와 b 의 유효 비트 길이가 모두 newton_threshold 이상일 경우
+        b 의 역수를 Newton-Raphson 반복으로 구한 뒤 a 에 곱하여 몫을 구함 ( 곱셈 몇 번의 시간 )
+        아닐 경우 a 의 상위 비트부터 나머지에 한 비트씩 내려 붙이고 b 를 빼 보는 shift-subtract 로 구함
+        shift-subtract 는 b 의 2의 보수를 한 번만 구해 두고 나머지를 b 의 유효 비트 + 1 길이로만 계산하며
+        나머지가 b 보다 작은 자리는 비교만 하고 덧셈을 하지 않음
+
+        :param a: 나눠질 Bit List
+        :param b: 나눌 Bit List
+        :param mul: Newton-Raphson 나눗셈에 사용할 곱셈 mul(a, b), 없을 경우 raw_mul_bits
+        :return: 몫 Bit List, 나머지 Bit List
+        """
+        if BitOperation.is_empty(b):
+            raise ZeroDivisionError()
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            a = BitVector.from_bits(a)
+            quotient, remain = divmod(a.value, BitVector.from_bits(b).value)
+            return BitVector(quotient, a.width), BitVector(remain, a.width)
+
+        length = len(a)
+        b = _trim(b)
+        size = length - BitOperation.first_bit_index(a)
+        if size < len(b):
+            return BitOperation.empty_bits(length), list(a)
+        if min(len(b), size - len(b) + 1) >= Arithmetic.newton_threshold:
+            quotient, remain = _newton_divmod(_trim(a), b, mul or _mul)
+            return BitOperation.fit_bits(quotient, length), BitOperation.fit_bits(remain, length)
+        quotient, remain = _shift_subtract(a, b)
+        return quotient, BitOperation.fit_bits(remain, length)
 
     @staticmethod
     def equalize_exponent(a_exp: List[Bit], a_frac: List[Bit], b_exp: List[Bit], b_frac: List[Bit]):
@@ -261,7 +310,8 @@ class Arithmetic:
         :param length: 원하는 Bit List의 길이
         :return: 문자열 실수값에 해당하는 Bit List, 자리수
         """
-        real, ten = BitOperation.equalize_bit_length(real, BitOperation.num_map['10'], length)
+        real = BitOperation.fit_bits(real, length)
+        ten = BitOperation.view_bits(BitOperation.num_map['10'], length)
         base = BitOperation.fit_bits(BitOperation.num_map['1'], length)
         twenty = BitOperation.raw_lshift_bits(ten, 1)
         remain = BitOperation.empty_bits(length)
@@ -294,3 +344,100 @@ class Arithmetic:
                 digit -= 1
 
         return real, digit
+
+
+def _trim(a: List[Bit]) -> List[Bit]:
+    """
+    Bit List 앞의 0을 제거
+    """
+    return list(a[BitOperation.first_bit_index(a):])
+
+
+def _add(a: List[Bit], b: List[Bit]) -> List[Bit]:
+    a, b = BitOperation.equalize_bit_length(a, b, max(len(a), len(b)) + 1)
+    res, _ = Arithmetic.raw_add_bits(a, b)
+    return _trim(res)
+
+
+def _sub(a: List[Bit], b: List[Bit]) -> List[Bit]:
+    """
+    a >= b 인 앞의 0이 없는 두 Bit List 의 뺄셈
+    """
+    a, b = BitOperation.equalize_bit_length(a, b, len(a))
+    res, _ = Arithmetic.raw_sub_bits(a, b)
+    return _trim(res)
+
+
+def _less(a: List[Bit], b: List[Bit]) -> bool:
+    """
+    앞의 0이 없는 두 Bit List 의 a < b
+    """
+    if len(a) != len(b):
+        return len(a) < len(b)
+    return not BitOperation.raw_ge_bits(a, b)
+
+
+def _mul(a: List[Bit], b: List[Bit]) -> List[Bit]:
+    length = len(a) + len(b)
+    return _trim(Arithmetic.raw_mul_bits(BitOperation.fit_bits(a, length), BitOperation.fit_bits(b, length)))
+
+
+def _shift_subtract(a: List[Bit], b: List[Bit]) -> (List[Bit], List[Bit]):
+    """
+    a 를 앞의 0이 없는 b 로 나누는 shift-subtract 나눗셈
+    나머지는 b 보다 작으므로 한 비트를 내려 붙여도 b 의 길이 + 1 비트에 들어감
+    나머지 >= b 인 지는 같은 길이의 Bit List 비교 ( list 의 > 는 처음 다른 Bit 만 비교 ) 로 확인하고
+    뺄 수 있을 때만 미리 구한 b 의 2의 보수를 더함
+    :return: a 와 같은 길이의 몫, b 의 길이 + 1 비트의 나머지
+    """
+    width = len(b) + 1
+    bound = BitOperation.fit_bits(b, width)
+    negative, _ = Arithmetic.complement_bits(b, width)
+    remain = BitOperation.empty_bits(width)
+    res = BitOperation.empty_bits(len(a))
+    for i in range(BitOperation.first_bit_index(a), len(a)):
+        del remain[0]
+        remain.append(a[i])
+        if bound > remain:
+            continue
+        remain, _ = Arithmetic.raw_add_bits(remain, negative)
+        res[i] = Bit.ONE
+    return res, remain
+
+
+def _reciprocal(b: List[Bit], precision: int, mul) -> List[Bit]:
+    """
+    b 의 상위 precision 비트 bt 의 역수 2^(2 * precision) / bt 의 근사값
+    precision 의 절반으로 구한 역수를 precision 에 맞게 shift 한 뒤 Newton-Raphson 한 번 ( y = 2y - bt * y^2 / 2^(2 * precision) )
+    한 번 반복할 때마다 정확한 비트 수가 두 배가 되므로 precision 을 절반씩 줄여가며 재귀
+    """
+    top = b[:precision] if len(b) >= precision else b + BitOperation.empty_bits(precision - len(b))
+    if precision <= _RECIPROCAL_BASE:
+        quotient, _ = _shift_subtract([Bit.ONE] + BitOperation.empty_bits(2 * precision), top)
+        return _trim(quotient)
+    half = (precision + 1) // 2
+    y = _reciprocal(b, half, mul) + BitOperation.empty_bits(precision - half)
+    error = mul(top, mul(y, y))
+    error = error[:len(error) - 2 * precision] if len(error) > 2 * precision else []
+    return _sub(y + [Bit.ZERO], error)
+
+
+def _newton_divmod(a: List[Bit], b: List[Bit], mul) -> (List[Bit], List[Bit]):
+    """
+    앞의 0이 없는 두 Bit List 의 Newton-Raphson 나눗셈
+    몫의 비트 수 + 2 비트의 정확도로 b 의 역수를 구해 a 에 곱한 값을 몫의 근사값으로 사용하고
+    근사값의 오차 ( 몇 이하 ) 는 나머지를 확인하며 보정
+    :return: 몫, 나머지 ( 앞의 0이 없는 Bit List )
+    """
+    precision = len(a) - len(b) + 3
+    quotient = mul(a, _reciprocal(b, precision, mul))
+    quotient = quotient[:len(quotient) - len(b) - precision] if len(quotient) > len(b) + precision else []
+    product = mul(quotient, b) if quotient else []
+    while _less(a, product):
+        quotient = _sub(quotient, [Bit.ONE])
+        product = _sub(product, b)
+    remain = _sub(a, product)
+    while not _less(remain, b):
+        quotient = _add(quotient, [Bit.ONE])
+        remain = _sub(remain, b)
+    return quotient, remain
@@ -1,7 +1,25 @@
+from array import array
 from functools import reduce
+from itertools import chain
+from operator import attrgetter
 from typing import List
 
 from bit.bit import Bit
+from nums.bit_vector import BitVector
+from nums.bit_view import BitView
+
+
+_BITS = (Bit.ZERO, Bit.ONE)
+# byte 값 ( 0 ~ 255 ) 을 index 로 하는 8 개의 Bit ( MSB 부터 )
+_BYTE_BITS = tuple(tuple(_BITS[byte >> i & 1] for i in range(7, -1, -1)) for byte in range(256))
+# byte 값 별 1인 비트의 개수
+_POPCOUNT = bytes(bin(byte).count('1') for byte in range(256))
+# 0, 1 byte 를 문자 '0', '1' 로 바꾸는 table 과 그 반대
+_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+_val = attrgetter('val')
+# byte 크기별 array typecode
+_TYPECODES = {array(code).itemsize: code for code in 'BHIQ'}
 
 
 class BitOperation:
@@ -23,14 +41,13 @@ class BitOperation:
     def equalize_bit_length(a: List[Bit], b: List[Bit], length: int) -> (List[Bit], List[Bit]):
         """
         입력받은 두 Bit List의 길이를 length 길이로 만듦
+        Bit List 를 복사하지 않는 view ( view_bits ) 로 return 하므로 raw_* 함수의 입력으로만 사용
         :param a: length 길이로 맞출 Bit List
         :param b: length 길이로 맞출 Bit List
         :param length: 원하는 Bit List의 길이
         :return: length 길이의 a, b
         """
-        a = BitOperation.fit_bits(a, length)
-        b = BitOperation.fit_bits(b, length)
-        return a, b
+        return BitOperation.view_bits(a, length), BitOperation.view_bits(b, length)
 
     @staticmethod
     def eq_bits(a: List[Bit], b: List[Bit], length: int) -> bool:
@@ -53,9 +70,11 @@ class BitOperation:
         :param b: 비교 BitList
         :return: 값이 같은 지 여부
         """
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            return BitVector.from_bits(a).value == BitVector.from_bits(b).value
         res = Bit()
-        for i in range(len(a)):
-            res |= (a[i] ^ b[i])
+        for x, y in zip(a, b):
+            res |= x ^ y
         return bool(~res)
 
     @staticmethod
@@ -79,10 +98,12 @@ class BitOperation:
         :param b: 비교 BitList
         :return: 값이 작거나 같은지 여부
         """
-        for i in range(len(a)):
-            if a[i] > b[i]:
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            return BitVector.from_bits(a).value <= BitVector.from_bits(b).value
+        for x, y in zip(a, b):
+            if x > y:
                 return False
-            if b[i] > a[i]:
+            if y > x:
                 return True
         return True
 
@@ -107,10 +128,12 @@ class BitOperation:
         :param b: 비교 BitList
         :return: 값이 크거나 같은 지 여부
         """
-        for i in range(len(a)):
-            if a[i] > b[i]:
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            return BitVector.from_bits(a).value >= BitVector.from_bits(b).value
+        for x, y in zip(a, b):
+            if x > y:
                 return True
-            if b[i] > a[i]:
+            if y > x:
                 return False
         return True
 
@@ -135,7 +158,9 @@ class BitOperation:
         :param b: And 연산을 수행할 Bit List
         :return: And 연산 결과 Bit List
         """
-        return [a[i] & b[i] for i in range(len(a))]
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            return BitVector.from_bits(a) & b
+        return [x & y for x, y in zip(a, b)]
 
     @staticmethod
     def xor_bits(a: List[Bit], b: List[Bit], length: int) -> List[Bit]:
@@ -158,7 +183,9 @@ class BitOperation:
         :param b: Xor 연산을 수행할 Bit List
         :return: Xor 연산 결과 Bit List
         """
-        return [a[i] ^ b[i] for i in range(len(a))]
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            return BitVector.from_bits(a) ^ b
+        return [x ^ y for x, y in zip(a, b)]
 
     @staticmethod
     def or_bits(a: List[Bit], b: List[Bit], length: int) -> List[Bit]:
@@ -181,7 +208,9 @@ class BitOperation:
         :param b: Or 연산을 수행할 Bit List
         :return: Or 연산 결과 Bit List
         """
-        return [a[i] | b[i] for i in range(len(a))]
+        if isinstance(a, BitVector) or isinstance(b, BitVector):
+            return BitVector.from_bits(a) | b
+        return [x | y for x, y in zip(a, b)]
 
     @staticmethod
     def lshift_bits(a: List[Bit], index: int or List[Bit], length: int) -> List[Bit]:
@@ -197,7 +226,7 @@ class BitOperation:
         if type(index) == list:
             index = BitOperation.binary_to_decimal(index)
 
-        a = BitOperation.fit_bits(a, length)
+        a = BitOperation.view_bits(a, length)
         return BitOperation.raw_lshift_bits(a, index)
 
     @staticmethod
@@ -208,6 +237,8 @@ class BitOperation:
         :param index: left-shift 할 크기
         :return: index 크기만큼 left-shift 한 Bit List
         """
+        if isinstance(a, BitVector):
+            return a << index
         bits = BitOperation.empty_bits(len(a))
         bits[:len(a) - index] = a[index:]
         return bits
@@ -226,7 +257,7 @@ class BitOperation:
         if type(index) == list:
             index = BitOperation.binary_to_decimal(index)
 
-        a = BitOperation.fit_bits(a, length)
+        a = BitOperation.view_bits(a, length)
         return BitOperation.raw_rshift_bits(a, index)
 
     @staticmethod
@@ -237,6 +268,8 @@ class BitOperation:
         :param index: right-shift 할 크기
         :return: index 크기만큼 right-shift 한 Bit List
         """
+        if isinstance(a, BitVector):
+            return a >> index
         bits = BitOperation.empty_bits(len(a))
         bits[index:] = a[:len(a) - index]
         return bits
@@ -248,6 +281,8 @@ class BitOperation:
         :param a: 소수점의 유효숫자만 표현된 가수 값
         :return: 1이 추가된 가수 값
         """
+        if isinstance(a, BitVector):
+            return BitVector(a.value | 1 << a.width, a.width + 1)
         frac = a[::]
         frac.insert(0, Bit(True))
         return frac
@@ -260,6 +295,8 @@ class BitOperation:
         :param a: invert 연산할 Bit List
         :return: invert 연산된 Bit List
         """
+        if isinstance(a, BitVector):
+            return ~a
         return [~bit for bit in a]
 
     @staticmethod
@@ -273,15 +310,28 @@ class BitOperation:
         :param length: 원하는 Bit List의 길이
         :return: length 길이의 Bit List
         """
+        if isinstance(a, BitVector):
+            return a.fit(length)
         if len(a) >= length:
             return a[-length:]
-        if len(a) == length:
-            return a[::]
+        return BitOperation.empty_bits(length - len(a)) + list(a)
 
-        empty = BitOperation.empty_bits(length)
-        for i in range(1, len(a)+1):
-            empty[-i] = a[-i]
-        return empty
+    @staticmethod
+    def view_bits(a: List[Bit], length: int) -> List[Bit]:
+        """
+        Bit List를 복사하지 않고 length 길이로 보여주는 BitView
+        fit_bits 와 같은 값이지만 새 Bit List 를 만들지 않음
+        길이가 이미 length 인 Bit List 는 그대로 return 하므로 결과를 변경하지 않는 경우에만 사용
+
+        :param a: length 길이로 보여줄 Bit List
+        :param length: 원하는 Bit List의 길이
+        :return: length 길이의 Bit List 또는 BitView
+        """
+        if isinstance(a, BitVector):
+            return a.fit(length)
+        if len(a) == length:
+            return a
+        return BitView(a, length)
 
     @staticmethod
     def is_empty(a: List[Bit]) -> bool:
@@ -290,6 +340,8 @@ class BitOperation:
         :param a: 모든 Bit 가 0인지 확인할 함수
         :return: 모든 Bit 가 0인지 여부
         """
+        if isinstance(a, BitVector):
+            return a.is_empty()
         if not a:
             return True
         return not reduce(lambda x, y: x | y, a)
@@ -301,24 +353,132 @@ class BitOperation:
         :param length: 원하는 Bit List의 길이
         :return: 비어있는 length 길이의 Bit List
         """
-        return [Bit() for _ in range(length)]
+        return [Bit.ZERO] * length
 
     @staticmethod
     def binary_to_decimal(a: List[Bit]) -> int:
         """
         입력받은 Bit List의 값을 읽어 int로 변환하는 함수
         python 의 기능을 실행시키기 위해 int로 변환할 때 사용 ( << 연산 등 )
+        Bit 마다 반복하지 않고 Bit 값들을 bytes 로 모은 뒤 '0', '1' 문자로 바꾸어 int 로 한 번에 변환
         :param a: int 값을 확인하기 위한 Bit List
         :return: Bit List에 해당하는 int 값
         """
-        res = 0
-        frame = 1
-        for bit in a[::-1]:
-            if bit:
-                res += frame
-            frame <<= 1
+        if isinstance(a, BitVector):
+            return a.value
+        if not len(a):
+            return 0
+        try:
+            digits = bytes(map(_val, a))
+        except AttributeError:
+            digits = bytes(map(bool, a))
+        return int(digits.translate(_TO_DIGITS), 2)
+
+    @staticmethod
+    def decimal_to_binary(value: int, length: int) -> List[Bit]:
+        """
+        0 이상의 int 값을 length 길이의 Bit List로 변환하는 함수
+        length 보다 긴 값은 하위 length 비트만 사용
+        :param value: 변환할 int 값
+        :param length: 원하는 Bit List의 길이
+        :return: length 길이의 Bit List
+        """
+        if length <= 0:
+            return []
+        digits = format(value & ((1 << length) - 1), '0{}b'.format(length)).encode()
+        return list(map(_BITS.__getitem__, digits.translate(_FROM_DIGITS)))
+
+    @staticmethod
+    def bits_to_bytes(a: List[Bit], byteorder: str = 'big') -> bytes:
+        """
+        Bit List를 bytes 로 변환하는 함수
+        길이가 8의 배수가 아닌 경우 앞을 0으로 채운 것으로 보고 변환
+        :param a: 변환할 Bit List
+        :param byteorder: 'big' 또는 'little'
+        :return: (len(a) + 7) // 8 byte 의 bytes
+        """
+        return BitOperation.binary_to_decimal(a).to_bytes((len(a) + 7) // 8, byteorder)
+
+    @staticmethod
+    def bytes_to_bits(data: bytes, length: int = None, byteorder: str = 'big') -> List[Bit]:
+        """
+        bytes 를 Bit List로 변환하는 함수
+        byte 마다 미리 만든 8 개의 Bit table 을 이어 붙여 변환
+        :param data: 변환할 bytes ( bytearray, memoryview 등 )
+        :param length: 원하는 Bit List의 길이, 없을 경우 byte 수 * 8
+        :param byteorder: 'big' 또는 'little'
+        :return: Bit List
+        """
+        data = bytes(data)
+        if byteorder == 'little':
+            data = data[::-1]
+        bits = list(chain.from_iterable(map(_BYTE_BITS.__getitem__, data)))
+        if length is None or length == len(bits):
+            return bits
+        return BitOperation.fit_bits(bits, length)
+
+    @staticmethod
+    def bit_lists_to_bytes(bit_lists: List[List[Bit]], length: int, byteorder: str = 'big') -> bytes:
+        """
+        여러 Bit List를 하나의 bytes buffer 로 변환하는 함수
+        각 Bit List는 (length + 7) // 8 byte 씩 차례로 저장
+        :param bit_lists: 변환할 Bit List 들
+        :param length: Bit List의 길이
+        :param byteorder: 각 값의 byte 순서, 'big' 또는 'little'
+        :return: len(bit_lists) * ((length + 7) // 8) byte 의 bytes
+        """
+        size = (length + 7) // 8
+        if length % 8 == 0 and bit_lists and set(map(len, bit_lists)) == {length}:
+            # 모든 Bit List 를 이어 붙인 값을 int 하나로 한 번에 변환
+            digits = bytes(map(_val, chain.from_iterable(bit_lists))).translate(_TO_DIGITS)
+            data = int(digits, 2).to_bytes(size * len(bit_lists), 'big')
+            if byteorder == 'big' or size == 1:
+                return data
+            if size in _TYPECODES:
+                values = array(_TYPECODES[size], data)
+                values.byteswap()
+                return values.tobytes()
+            return b''.join(data[i:i + size][::-1] for i in range(0, len(data), size))
+        mask = (1 << length) - 1
+        to_int = BitOperation.binary_to_decimal
+        return b''.join((to_int(bits) & mask).to_bytes(size, byteorder) for bits in bit_lists)
+
+    @staticmethod
+    def bytes_to_bit_lists(data: bytes, length: int, byteorder: str = 'big') -> List[List[Bit]]:
+        """
+        bit_lists_to_bytes 로 저장한 bytes buffer 를 여러 Bit List로 변환하는 함수
+        :param data: 변환할 bytes ( bytearray, memoryview, array 등 )
+        :param length: Bit List의 길이
+        :param byteorder: 각 값의 byte 순서, 'big' 또는 'little'
+        :return: Bit List 들
+        """
+        data = memoryview(data).cast('B')
+        size = (length + 7) // 8
+        return [BitOperation.bytes_to_bits(data[i:i + size], length, byteorder) for i in range(0, len(data), size)]
+
+    @staticmethod
+    def bit_lists_to_array(bit_lists: List[List[Bit]], typecode: str = 'I') -> array:
+        """
+        여러 Bit List를 int 값의 array 로 변환하는 함수 ( native byte order )
+        :param bit_lists: 변환할 Bit List 들
+        :param typecode: array 의 typecode ( 'B', 'H', 'I', 'Q' 등 )
+        :return: array
+        """
+        res = array(typecode)
+        mask = (1 << res.itemsize * 8) - 1
+        res.extend(BitOperation.binary_to_decimal(bits) & mask for bits in bit_lists)
         return res
 
+    @staticmethod
+    def array_to_bit_lists(values, length: int) -> List[List[Bit]]:
+        """
+        int 값들 ( array 등 ) 을 length 길이의 Bit List 들로 변환하는 함수
+        :param values: 변환할 0 이상의 int 값들
+        :param length: Bit List의 길이
+        :return: Bit List 들
+        """
+        return [BitOperation.decimal_to_binary(int(value), length) for value in values]
+
     @staticmethod
     def binary_to_float(exp: List[Bit], fraction: List[Bit]) -> float:
         """
@@ -345,7 +505,47 @@ class BitOperation:
         :param a: 첫 1의 위치를 찾을 Bit List
         :return: 첫 1의 위치
         """
-        for i in range(len(a)):
-            if a[i]:
-                return i
-        return len(a)
+        return BitOperation.clz_bits(a)
+
+    @staticmethod
+    def clz_bits(a: List[Bit]) -> int:
+        """
+        Bit List의 MSB 부터 연속된 0의 개수 ( count leading zeros )
+        Bit List를 int 값으로 한 번에 변환한 뒤 int 의 비트 길이로 계산
+        :param a: 0의 개수를 셀 Bit List
+        :return: 연속된 0의 개수, 모든 Bit 가 0일 경우 Bit List의 길이
+        """
+        return len(a) - BitOperation.binary_to_decimal(a).bit_length()
+
+    @staticmethod
+    def ctz_bits(a: List[Bit]) -> int:
+        """
+        Bit List의 LSB 부터 연속된 0의 개수 ( count trailing zeros )
+        가장 낮은 1 비트만 남긴 값 ( value & -value ) 의 비트 길이로 계산
+        :param a: 0의 개수를 셀 Bit List
+        :return: 연속된 0의 개수, 모든 Bit 가 0일 경우 Bit List의 길이
+        """
+        value = BitOperation.binary_to_decimal(a)
+        if not value:
+            return len(a)
+        return (value & -value).bit_length() - 1
+
+    @staticmethod
+    def popcount_bits(a: List[Bit]) -> int:
+        """
+        Bit List의 1인 Bit 의 개수 ( population count )
+        Bit List를 int 값으로 변환한 뒤 byte 단위 table 로 셈
+        :param a: 1의 개수를 셀 Bit List
+        :return: 1의 개수
+        """
+        value = BitOperation.binary_to_decimal(a)
+        return sum(map(_POPCOUNT.__getitem__, value.to_bytes((value.bit_length() + 7) // 8, 'big')))
+
+    @staticmethod
+    def parity_bits(a: List[Bit]) -> Bit:
+        """
+        Bit List의 1인 Bit 의 개수가 홀수인 지 여부 ( parity )
+        :param a: parity 를 계산할 Bit List
+        :return: 1의 개수가 홀수일 경우 Bit(True)
+        """
+        return _BITS[BitOperation.popcount_bits(a) & 1]
@@ -0,0 +1,211 @@
+from typing import List
+
+from bit.bit import Bit
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_BITS = (Bit.ZERO, Bit.ONE)
+
+
+def _plane(a) -> "np.ndarray":
+    """
+    (N, width) 모양의 bool 또는 uint8 numpy 배열로 변환
+    bool, uint8 배열은 복사하지 않고 그대로 사용
+    """
+    if np is None:
+        raise ImportError('BitPlane 을 사용하기 위해서는 numpy 가 필요함')
+    a = np.asarray(a)
+    if a.dtype != np.bool_ and a.dtype != np.uint8:
+        a = a.astype(np.uint8)
+    if a.ndim != 2:
+        raise ValueError('BitPlane 은 (N, width) 모양의 배열이어야 함')
+    return a
+
+
+class BitPlane:
+    """
+    N 개의 Bit List 를 (N, width) 모양의 numpy 배열 하나로 표현하여 한 번에 연산
+
+    각 행이 하나의 Bit List 에 해당하고 BitOperation 과 같이 열 index 0 이 MSB
+    BitOperation 의 raw_* 함수와 같은 연산을 행마다 반복하지 않고 배열 연산 한 번으로 처리
+    numpy 가 설치되어 있을 때만 사용 가능
+    """
+
+    @staticmethod
+    def from_bit_lists(bit_lists: List[List[Bit]], length: int = None) -> "np.ndarray":
+        """
+        Bit List 들을 (N, length) 모양의 uint8 배열로 변환
+        length 가 없을 경우 가장 긴 Bit List 의 길이를 사용하고
+        짧은 Bit List 는 BitOperation.fit_bits 와 같이 앞을 0으로 채움
+        :param bit_lists: 변환할 Bit List 들
+        :param length: 원하는 Bit List의 길이
+        :return: (N, length) 모양의 uint8 배열
+        """
+        if np is None:
+            raise ImportError('BitPlane 을 사용하기 위해서는 numpy 가 필요함')
+        if length is None:
+            length = max((len(bits) for bits in bit_lists), default=0)
+        plane = np.zeros((len(bit_lists), length), dtype=np.uint8)
+        for row, bits in zip(plane, bit_lists):
+            bits = [bit.val for bit in bits[-length:]] if length else []
+            if bits:
+                row[length - len(bits):] = bits
+        return plane
+
+    @staticmethod
+    def to_bit_lists(a) -> List[List[Bit]]:
+        """
+        (N, width) 모양의 배열을 Bit List 들로 변환
+        :param a: 변환할 배열
+        :return: N 개의 width 길이 Bit List
+        """
+        return [[_BITS[bit] for bit in row] for row in _plane(a).astype(np.uint8).tolist()]
+
+    @staticmethod
+    def decimal_to_binary(values, length: int) -> "np.ndarray":
+        """
+        0 이상의 int 값들을 (N, length) 모양의 uint8 배열로 변환 ( length <= 64 )
+        :param values: 변환할 int 값들
+        :param length: 원하는 Bit List의 길이
+        :return: (N, length) 모양의 uint8 배열
+        """
+        if np is None:
+            raise ImportError('BitPlane 을 사용하기 위해서는 numpy 가 필요함')
+        values = np.asarray(values, dtype=np.uint64).reshape(-1, 1)
+        shifts = np.arange(length - 1, -1, -1, dtype=np.uint64)
+        return ((values >> shifts) & np.uint64(1)).astype(np.uint8)
+
+    @staticmethod
+    def binary_to_decimal(a) -> "np.ndarray" or List[int]:
+        """
+        각 행의 값을 int 로 변환
+        길이가 64 이하이면 uint64 배열, 그보다 길면 python int List 로 return
+        :param a: (N, width) 모양의 배열
+        :return: 각 행에 해당하는 int 값
+        """
+        a = _plane(a)
+        length = a.shape[1]
+        if length <= 64:
+            shifts = np.arange(length - 1, -1, -1, dtype=np.uint64)
+            return (a.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+        pad = -length % 8
+        packed = np.packbits(np.pad(a.astype(np.uint8), ((0, 0), (pad, 0))), axis=1)
+        return [int.from_bytes(row.tobytes(), 'big') for row in packed]
+
+    @staticmethod
+    def fit_bits(a, length: int) -> "np.ndarray":
+        """
+        각 행을 length 길이로 만듦
+        length 보다 길 경우 뒤에서부터 length 길이로 자르고
+        length 보다 짧을 경우 0을 앞에 추가함
+        :param a: (N, width) 모양의 배열
+        :param length: 원하는 Bit List의 길이
+        :return: (N, length) 모양의 배열
+        """
+        a = _plane(a)
+        width = a.shape[1]
+        if width >= length:
+            return a[:, width - length:]
+        return np.pad(a, ((0, 0), (length - width, 0)))
+
+    @staticmethod
+    def raw_and_bits(a, b) -> "np.ndarray":
+        """
+        같은 모양의 배열의 행마다 And ( & ) 연산
+        """
+        return _plane(a) & _plane(b)
+
+    @staticmethod
+    def raw_xor_bits(a, b) -> "np.ndarray":
+        """
+        같은 모양의 배열의 행마다 Xor ( ^ ) 연산
+        """
+        return _plane(a) ^ _plane(b)
+
+    @staticmethod
+    def raw_or_bits(a, b) -> "np.ndarray":
+        """
+        같은 모양의 배열의 행마다 Or ( | ) 연산
+        """
+        return _plane(a) | _plane(b)
+
+    @staticmethod
+    def invert_bits(a) -> "np.ndarray":
+        """
+        배열의 모든 Bit 에 invert ( ~ ) 연산
+        """
+        a = _plane(a)
+        return a ^ a.dtype.type(1)
+
+    @staticmethod
+    def raw_lshift_bits(a, index: int) -> "np.ndarray":
+        """
+        각 행을 index 크기만큼 left-shift ( << ) 연산
+        """
+        a = _plane(a)
+        bits = np.zeros_like(a)
+        if index < a.shape[1]:
+            bits[:, :a.shape[1] - index] = a[:, index:]
+        return bits
+
+    @staticmethod
+    def raw_rshift_bits(a, index: int) -> "np.ndarray":
+        """
+        각 행을 index 크기만큼 right-shift ( >> ) 연산
+        """
+        a = _plane(a)
+        bits = np.zeros_like(a)
+        if index < a.shape[1]:
+            bits[:, index:] = a[:, :a.shape[1] - index]
+        return bits
+
+    @staticmethod
+    def raw_eq_bits(a, b) -> "np.ndarray":
+        """
+        행마다 값이 같은 지 ( == ) 비교
+        :return: (N,) 모양의 bool 배열
+        """
+        return np.all(_plane(a) == _plane(b), axis=1)
+
+    @staticmethod
+    def raw_le_bits(a, b) -> "np.ndarray":
+        """
+        행마다 a가 작거나 같은 지 ( <= ) 비교
+        처음으로 다른 Bit 에서 b의 Bit 가 1이거나 모든 Bit 가 같으면 True
+        :return: (N,) 모양의 bool 배열
+        """
+        a, b = _plane(a), _plane(b)
+        diff = a != b
+        first = diff.argmax(axis=1)
+        rows = np.arange(a.shape[0])
+        return ~diff.any(axis=1) | (b[rows, first] > a[rows, first])
+
+    @staticmethod
+    def raw_ge_bits(a, b) -> "np.ndarray":
+        """
+        행마다 a가 크거나 같은 지 ( >= ) 비교
+        :return: (N,) 모양의 bool 배열
+        """
+        return BitPlane.raw_le_bits(b, a)
+
+    @staticmethod
+    def is_empty(a) -> "np.ndarray":
+        """
+        행마다 모든 Bit 가 0인지 확인
+        :return: (N,) 모양의 bool 배열
+        """
+        return ~np.any(_plane(a), axis=1)
+
+    @staticmethod
+    def first_bit_index(a) -> "np.ndarray":
+        """
+        행마다 첫 1의 위치를 찾음
+        없을 경우 행의 길이 값
+        :return: (N,) 모양의 int 배열
+        """
+        a = _plane(a)
+        return np.where(np.any(a, axis=1), a.argmax(axis=1), a.shape[1])
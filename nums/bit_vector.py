@@ -0,0 +1,193 @@
+from typing import List, Iterator
+
+from bit.bit import Bit
+
+
+class BitVector:
+    """
+    하나의 int 값으로 표현되는 고정 길이 Bit 열
+
+    Bit List 와 같이 index 0 이 MSB (최상위 비트), index -1 이 LSB (최하위 비트)
+    Bit List 처럼 indexing, slicing, iteration 을 지원하므로 Bit List 대신 사용 가능하고
+    &, |, ^, ~, <<, >> 연산은 Bit 마다 반복하지 않고 int 연산 한 번으로 처리
+    """
+    __slots__ = ('value', 'width')
+
+    def __init__(self, value: int = 0, width: int = 32):
+        self.width: int = width
+        self.value: int = value & ((1 << width) - 1)
+
+    @classmethod
+    def from_bits(cls, bits: List[Bit]) -> "BitVector":
+        """
+        Bit List를 BitVector로 변환
+        :param bits: 변환할 Bit List
+        :return: Bit List와 같은 길이, 같은 값의 BitVector
+        """
+        if isinstance(bits, BitVector):
+            return bits
+        value = 0
+        for bit in bits:
+            value <<= 1
+            if bit:
+                value |= 1
+        return cls(value, len(bits))
+
+    def to_bits(self) -> List[Bit]:
+        """
+        BitVector를 Bit List로 변환
+        :return: 같은 길이, 같은 값의 Bit List
+        """
+        return [Bit(self.value >> i & 1) for i in range(self.width - 1, -1, -1)]
+
+    def mask(self) -> int:
+        """
+        width 길이의 모든 비트가 1인 int 값
+        """
+        return (1 << self.width) - 1
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __iter__(self) -> Iterator[Bit]:
+        value = self.value
+        for i in range(self.width - 1, -1, -1):
+            yield Bit(value >> i & 1)
+
+    def __getitem__(self, item: int or slice) -> Bit or "BitVector" or List[Bit]:
+        """
+        Bit List 와 같은 indexing, slicing 지원
+        int index 는 Bit, 연속 구간 slice 는 BitVector, step 이 있는 slice 는 Bit List 로 return
+        """
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self.width)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if stop <= start:
+                return BitVector(0, 0)
+            return BitVector(self.value >> (self.width - stop), stop - start)
+
+        if item < 0:
+            item += self.width
+        if not 0 <= item < self.width:
+            raise IndexError('BitVector index out of range')
+        return Bit(self.value >> (self.width - 1 - item) & 1)
+
+    def __setitem__(self, item: int or slice, value: Bit or List[Bit]):
+        """
+        Bit List 와 같은 index, slice 대입 지원
+        길이가 고정되어 있으므로 slice 에는 같은 개수의 Bit 만 대입 가능
+        """
+        if isinstance(item, slice):
+            indices = range(*item.indices(self.width))
+            value = list(value)
+            if len(value) != len(indices):
+                raise ValueError('BitVector slice assignment must keep the width')
+            for i, bit in zip(indices, value):
+                self[i] = bit
+            return
+
+        if item < 0:
+            item += self.width
+        if not 0 <= item < self.width:
+            raise IndexError('BitVector assignment index out of range')
+        shift = self.width - 1 - item
+        if value:
+            self.value |= 1 << shift
+        else:
+            self.value &= ~(1 << shift)
+
+    def __eq__(self, other: "BitVector" or List[Bit]) -> bool:
+        if isinstance(other, list):
+            other = BitVector.from_bits(other)
+        if not isinstance(other, BitVector):
+            return NotImplemented
+        return self.width == other.width and self.value == other.value
+
+    def __hash__(self):
+        return hash((self.value, self.width))
+
+    def __str__(self) -> str:
+        if not self.width:
+            return ''
+        return format(self.value, '0{}b'.format(self.width))
+
+    def __repr__(self) -> str:
+        return 'BitVector({})'.format(self.__str__())
+
+    def fit(self, length: int) -> "BitVector":
+        """
+        BitVector를 length 길이로 만듦
+        BitOperation.fit_bits 와 같이 length 보다 길 경우 하위 비트만 남기고
+        length 보다 짧을 경우 0을 앞에 추가함
+        :param length: 원하는 길이
+        :return: length 길이의 BitVector
+        """
+        if length == self.width:
+            return self
+        return BitVector(self.value, length)
+
+    def __invert__(self) -> "BitVector":
+        """
+        invert ( ~ ) 연산
+        :return: 새로운 BitVector 객체로 return
+        """
+        return BitVector(self.value ^ self.mask(), self.width)
+
+    def __and__(self, other: "BitVector" or List[Bit]) -> "BitVector":
+        """
+        And ( & ) 연산
+        :param other: 같은 길이의 BitVector 또는 Bit List
+        :return: 새로운 BitVector 객체로 return
+        """
+        return BitVector(self.value & BitVector.from_bits(other).value, self.width)
+
+    def __or__(self, other: "BitVector" or List[Bit]) -> "BitVector":
+        """
+        Or ( | ) 연산
+        :param other: 같은 길이의 BitVector 또는 Bit List
+        :return: 새로운 BitVector 객체로 return
+        """
+        return BitVector(self.value | BitVector.from_bits(other).value, self.width)
+
+    def __xor__(self, other: "BitVector" or List[Bit]) -> "BitVector":
+        """
+        Xor ( ^ ) 연산
+        :param other: 같은 길이의 BitVector 또는 Bit List
+        :return: 새로운 BitVector 객체로 return
+        """
+        return BitVector(self.value ^ BitVector.from_bits(other).value, self.width)
+
+    def __lshift__(self, index: int) -> "BitVector":
+        """
+        left-shift ( << ) 연산, 넘치는 상위 비트는 버림
+        :param index: left-shift 할 크기
+        :return: 새로운 BitVector 객체로 return
+        """
+        return BitVector(self.value << index, self.width)
+
+    def __rshift__(self, index: int) -> "BitVector":
+        """
+        right-shift ( >> ) 연산, 상위 비트는 0으로 채움
+        :param index: right-shift 할 크기
+        :return: 새로운 BitVector 객체로 return
+        """
+        return BitVector(self.value >> index, self.width)
+
+    def is_empty(self) -> bool:
+        """
+        모든 Bit 가 0인지 확인
+        :return: 모든 Bit 가 0인지 여부
+        """
+        return not self.value
+
+    def first_bit_index(self) -> int:
+        """
+        첫 1의 위치 (MSB 기준)
+        없을 경우 길이 값을 return
+        :return: 첫 1의 위치
+        """
+        return self.width - self.value.bit_length()
@@ -0,0 +1,61 @@
+from itertools import islice, repeat, chain
+from typing import Iterator, List
+
+from bit.bit import Bit
+
+
+class BitView:
+    """
+    Bit List 를 복사하지 않고 length 길이로 보여주는 view
+
+    BitOperation.fit_bits 와 같이 length 보다 길 경우 뒤에서부터 length 길이만 보이고
+    length 보다 짧을 경우 앞에 0이 있는 것처럼 보임
+    원래 Bit List 를 그대로 참조하므로 원래 Bit List 가 바뀌면 view 의 값도 바뀜
+    Bit List 와 같은 len, indexing, slicing, iteration 을 지원하므로 BitOperation, Arithmetic 의 raw_* 함수에 그대로 사용 가능
+    slicing 은 새로운 Bit List 로 return
+    """
+    __slots__ = ('bits', 'length', 'offset')
+
+    def __init__(self, bits: List[Bit], length: int):
+        if isinstance(bits, BitView) and (length <= bits.length or bits.offset >= 0):
+            bits = bits.bits
+        self.bits = bits
+        self.length = length
+        self.offset = length - len(bits)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, item: int or slice) -> Bit or List[Bit]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(self.length))]
+        if item < 0:
+            item += self.length
+        if not 0 <= item < self.length:
+            raise IndexError('BitView index out of range')
+        index = item - self.offset
+        return self.bits[index] if index >= 0 else Bit.ZERO
+
+    def __iter__(self) -> Iterator[Bit]:
+        if self.offset >= 0:
+            return chain(repeat(Bit.ZERO, self.offset), self.bits)
+        return islice(self.bits, -self.offset, None)
+
+    def __reversed__(self) -> Iterator[Bit]:
+        bits = reversed(self.bits)
+        if self.offset >= 0:
+            return chain(bits, repeat(Bit.ZERO, self.offset))
+        return islice(bits, self.length)
+
+    def __eq__(self, other: List[Bit] or "BitView") -> bool:
+        if not isinstance(other, (list, BitView)):
+            return NotImplemented
+        return len(other) == self.length and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return ''.join(str(bit) for bit in self)
+
+    def __repr__(self) -> str:
+        return 'BitView({})'.format(self.__str__())
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from bit.bit import Bit
+from nums.arithmetic import Arithmetic
+from nums.bit_operation import BitOperation
+from nums.bit_vector import BitVector
+
+
+def test_raw_add_bits():
+    rand = random.Random(7)
+    for length in (1, 8, 31, 64, 257):
+        mask = (1 << length) - 1
+        for a, b in [(0, 0), (mask, 1), (mask, mask), (1, mask)] + \
+                [(rand.getrandbits(length), rand.getrandbits(length)) for _ in range(20)]:
+            res, overflow = Arithmetic.raw_add_bits(BitOperation.decimal_to_binary(a, length),
+                                                    BitOperation.decimal_to_binary(b, length))
+            assert type(res) == list and len(res) == length
+            assert BitOperation.binary_to_decimal(res) == (a + b) & mask
+            assert overflow == Bit((a + b) >> length)
+
+
+def test_raw_add_bits_wide():
+    length = 65536
+    a = BitOperation.decimal_to_binary((1 << length) - 1, length)
+    b = BitOperation.decimal_to_binary(1, length)
+    res, overflow = Arithmetic.raw_add_bits(a, b)
+    assert BitOperation.is_empty(res) and overflow == Bit(True)
+    assert a == BitOperation.decimal_to_binary((1 << length) - 1, length)
+
+    res, overflow = Arithmetic.raw_add_bits(BitVector(3 << (length - 2), length), BitVector(1 << (length - 2), length))
+    assert res == BitVector(0, length) and overflow == Bit(True)
+
+
+def test_divmod_bits(monkeypatch):
+    rand = random.Random(25)
+    for threshold in (Arithmetic.newton_threshold, 8):
+        # 낮은 threshold 로 Newton-Raphson 나눗셈도 확인
+        monkeypatch.setattr(Arithmetic, 'newton_threshold', threshold)
+        for length in (1, 8, 32, 100, 300):
+            for _ in range(20):
+                a, b = rand.getrandbits(length), rand.getrandbits(rand.randint(1, length)) or 1
+                quotient, remain = Arithmetic.divmod_bits(BitOperation.decimal_to_binary(a, length),
+                                                          BitOperation.decimal_to_binary(b, length), length)
+                assert len(quotient) == len(remain) == length
+                assert BitOperation.binary_to_decimal(quotient) == a // b
+                assert BitOperation.binary_to_decimal(remain) == a % b
+    assert Arithmetic.raw_divmod_bits(BitVector(20, 32), BitVector(6, 32)) == (BitVector(3, 32), BitVector(2, 32))
+    with pytest.raises(ZeroDivisionError):
+        Arithmetic.divmod_bits(BitOperation.num_map['1'], [], 8)
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+from bit.bit import Bit
+from nums.bit_operation import BitOperation
+
+np = pytest.importorskip('numpy')
+from nums.bit_plane import BitPlane  # noqa: E402
+
+
+def random_bit_lists(count: int, length: int) -> list:
+    rand = random.Random(length)
+    return [[Bit(rand.random() < 0.5) for _ in range(length)] for _ in range(count)]
+
+
+def test_bit_plane_convert():
+    bit_lists = random_bit_lists(20, 16)
+    plane = BitPlane.from_bit_lists(bit_lists)
+    assert plane.shape == (20, 16)
+    assert BitPlane.to_bit_lists(plane) == bit_lists
+
+
+def test_bit_plane_decimal():
+    plane = BitPlane.decimal_to_binary([0, 5, 2**31 + 1], 32)
+    assert BitPlane.binary_to_decimal(plane).tolist() == [0, 5, 2**31 + 1]
+    wide = BitPlane.fit_bits(plane, 80)
+    assert BitPlane.binary_to_decimal(wide) == [0, 5, 2**31 + 1]
+
+
+def test_bit_plane_logic():
+    a_lists, b_lists = random_bit_lists(30, 12), random_bit_lists(30, 13)[::-1]
+    b_lists = [bits[1:] for bits in b_lists]
+    a, b = BitPlane.from_bit_lists(a_lists), BitPlane.from_bit_lists(b_lists)
+    for batch, raw in ((BitPlane.raw_and_bits, BitOperation.raw_and_bits),
+                       (BitPlane.raw_xor_bits, BitOperation.raw_xor_bits),
+                       (BitPlane.raw_or_bits, BitOperation.raw_or_bits)):
+        expected = [raw(x, y) for x, y in zip(a_lists, b_lists)]
+        assert BitPlane.to_bit_lists(batch(a, b)) == expected
+    assert BitPlane.to_bit_lists(BitPlane.invert_bits(a)) == [BitOperation.invert_bits(x) for x in a_lists]
+
+
+def test_bit_plane_shift():
+    a_lists = random_bit_lists(10, 8)
+    a = BitPlane.from_bit_lists(a_lists)
+    for i in (0, 1, 3, 8):
+        assert BitPlane.to_bit_lists(BitPlane.raw_lshift_bits(a, i)) == \
+            [BitOperation.raw_lshift_bits(x, i) for x in a_lists]
+        assert BitPlane.to_bit_lists(BitPlane.raw_rshift_bits(a, i)) == \
+            [BitOperation.raw_rshift_bits(x, i) for x in a_lists]
+
+
+def test_bit_plane_compare():
+    a_lists, b_lists = random_bit_lists(40, 4), random_bit_lists(40, 5)
+    b_lists = [bits[1:] for bits in b_lists]
+    a, b = BitPlane.from_bit_lists(a_lists), BitPlane.from_bit_lists(b_lists)
+    assert BitPlane.raw_le_bits(a, b).tolist() == [BitOperation.raw_le_bits(x, y) for x, y in zip(a_lists, b_lists)]
+    assert BitPlane.raw_ge_bits(a, b).tolist() == [BitOperation.raw_ge_bits(x, y) for x, y in zip(a_lists, b_lists)]
+    assert BitPlane.raw_eq_bits(a, a).all()
+
+
+def test_bit_plane_scan():
+    a_lists = random_bit_lists(30, 3)
+    a = BitPlane.from_bit_lists(a_lists)
+    assert BitPlane.first_bit_index(a).tolist() == [BitOperation.first_bit_index(x) for x in a_lists]
+    assert BitPlane.is_empty(a).tolist() == [BitOperation.is_empty(x) for x in a_lists]
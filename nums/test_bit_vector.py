@@ -0,0 +1,119 @@
+import pytest
+
+from bit.bit import Bit
+from nums.arithmetic import Arithmetic
+from nums.bit_operation import BitOperation
+from nums.bit_vector import BitVector
+
+
+def bits(val: str) -> list:
+    return [Bit(c == '1') for c in val]
+
+
+def test_bit_vector_from_bits():
+    vector = BitVector.from_bits(bits('1011'))
+    assert vector.value == 11
+    assert len(vector) == 4
+    assert vector.to_bits() == bits('1011')
+
+
+def test_bit_vector_index():
+    vector = BitVector(0b1011, 4)
+    assert vector[0] == Bit(True)
+    assert vector[1] == Bit()
+    assert vector[-1] == Bit(True)
+    assert list(vector) == bits('1011')
+
+
+def test_bit_vector_slice():
+    vector = BitVector(0b101100, 6)
+    assert vector[1:4] == BitVector(0b011, 3)
+    assert vector[-2:] == BitVector(0b00, 2)
+    assert vector[::-1] == bits('001101')
+
+
+def test_bit_vector_fit_bits():
+    assert BitOperation.fit_bits(BitVector(0b1011, 4), 6) == BitVector(0b001011, 6)
+    assert BitOperation.fit_bits(BitVector(0b1011, 4), 2) == BitVector(0b11, 2)
+
+
+def test_bit_vector_logic():
+    a = BitVector(0b1100, 4)
+    b = BitVector(0b1010, 4)
+    assert BitOperation.raw_and_bits(a, b) == BitVector(0b1000, 4)
+    assert BitOperation.raw_or_bits(a, b) == BitVector(0b1110, 4)
+    assert BitOperation.raw_xor_bits(a, b) == BitVector(0b0110, 4)
+    assert BitOperation.raw_xor_bits(a, bits('1010')) == BitVector(0b0110, 4)
+    assert BitOperation.invert_bits(a) == BitVector(0b0011, 4)
+
+
+def test_bit_vector_shift():
+    a = BitVector(0b1011, 4)
+    assert BitOperation.raw_lshift_bits(a, 1) == BitVector(0b0110, 4)
+    assert BitOperation.raw_rshift_bits(a, 2) == BitVector(0b0010, 4)
+
+
+def test_bit_vector_scan():
+    assert BitOperation.first_bit_index(BitVector(0b0010, 4)) == 2
+    assert BitOperation.first_bit_index(BitVector(0, 4)) == 4
+    assert BitOperation.is_empty(BitVector(0, 4))
+    assert BitOperation.binary_to_decimal(BitVector(1234, 32)) == 1234
+
+
+def test_bit_vector_arithmetic():
+    res, overflow = Arithmetic.add_bits(BitVector(200, 8), BitVector(100, 8), 8)
+    assert res == BitVector(44, 8)
+    assert overflow == Bit(True)
+    assert Arithmetic.mul_bits(BitVector(107, 32), BitVector(97, 32), 32) == BitVector(10379, 32)
+    assert Arithmetic.div_bits(BitVector(20, 32), BitVector(4, 32), 32) == BitVector(5, 32)
+
+
+def test_bit_conversion():
+    import sys
+    from array import array
+
+    assert BitOperation.decimal_to_binary(0b1011, 6) == bits('001011')
+    assert BitOperation.decimal_to_binary(0b1011, 2) == bits('11')
+    assert BitOperation.binary_to_decimal(bits('1011')) == 11
+    assert BitOperation.binary_to_decimal([]) == 0
+    assert BitOperation.bits_to_bytes(bits('100000001')) == b'\x01\x01'
+    assert BitOperation.bits_to_bytes(bits('100000001'), 'little') == b'\x01\x01'
+    assert BitOperation.bytes_to_bits(b'\x01\x80') == bits('0000000110000000')
+    assert BitOperation.bytes_to_bits(b'\x01\x80', 12, 'little') == bits('000000000001')
+
+    lists = [bits('0001'), bits('1010'), bits('1111')]
+    data = BitOperation.bit_lists_to_bytes(lists, 12, 'little')
+    assert data == b'\x01\x00\x0a\x00\x0f\x00'
+    assert BitOperation.bytes_to_bit_lists(data, 12, 'little') == [BitOperation.fit_bits(b, 12) for b in lists]
+    wide = [BitOperation.fit_bits(b, 16) for b in lists]
+    assert BitOperation.bit_lists_to_bytes(wide, 16, 'little') == b'\x01\x00\x0a\x00\x0f\x00'
+    assert BitOperation.bit_lists_to_bytes(wide, 16) == b'\x00\x01\x00\x0a\x00\x0f'
+    values = BitOperation.bit_lists_to_array(lists, 'H')
+    assert values == array('H', [1, 10, 15])
+    assert BitOperation.array_to_bit_lists(values, 4) == lists
+    assert BitOperation.bytes_to_bit_lists(values, 16, sys.byteorder)[1] == BitOperation.fit_bits(bits('1010'), 16)
+
+
+def test_bit_count():
+    assert BitOperation.clz_bits(bits('0001010')) == 3
+    assert BitOperation.clz_bits(bits('0000')) == 4
+    assert BitOperation.ctz_bits(bits('0101000')) == 3
+    assert BitOperation.ctz_bits(bits('000')) == 3
+    assert BitOperation.popcount_bits(bits('1011001110')) == 6
+    assert BitOperation.popcount_bits([]) == 0
+    assert BitOperation.parity_bits(bits('1011')) == Bit(True)
+    assert BitOperation.parity_bits(bits('1001')) == Bit()
+    assert BitOperation.first_bit_index(bits('0010')) == 2
+    assert BitOperation.ctz_bits(BitVector(0b1000, 6)) == 3
+
+
+def test_bit_vector_setitem():
+    vector = BitVector(0b1000, 4)
+    vector[-1] = Bit(True)
+    vector[0] = Bit()
+    vector[1:3] = [Bit(True), Bit(True)]
+    assert vector == BitVector(0b0111, 4)
+    with pytest.raises(ValueError):
+        vector[1:3] = [Bit(True)]
+    with pytest.raises(IndexError):
+        vector[4] = Bit(True)
@@ -0,0 +1,42 @@
+from bit.bit import Bit
+from nums.arithmetic import Arithmetic
+from nums.bit_operation import BitOperation
+from nums.bit_view import BitView
+
+
+def bits(val: str) -> list:
+    return [Bit(c == '1') for c in val]
+
+
+def test_bit_view_extend():
+    origin = bits('101')
+    view = BitView(origin, 6)
+    assert len(view) == 6
+    assert view == bits('000101')
+    assert view[0] == Bit() and view[3] == Bit(True) and view[-1] == Bit(True)
+    assert view[2:5] == bits('010')
+    assert list(reversed(view)) == bits('101000')
+    origin[1] = Bit(True)
+    assert view == bits('000111')
+
+
+def test_bit_view_truncate():
+    view = BitView(bits('110101'), 4)
+    assert view == bits('0101')
+    assert view[0] == Bit() and view[-4] == Bit()
+    assert list(reversed(view)) == bits('1010')
+    assert BitView(view, 2) == bits('01')
+    assert BitView(view, 6) == bits('000101')
+    assert BitView(BitView(bits('11'), 4), 8).bits == bits('11')
+
+
+def test_bit_view_operation():
+    a, b = BitOperation.equalize_bit_length(bits('11'), bits('1'), 4)
+    assert isinstance(a, BitView) and isinstance(b, BitView)
+    assert BitOperation.raw_and_bits(a, b) == bits('0001')
+    assert BitOperation.raw_lshift_bits(a, 1) == bits('0110')
+    assert BitOperation.raw_le_bits(b, a)
+    assert BitOperation.fit_bits(BitView(bits('101'), 5), 3) == bits('101')
+    res, overflow = Arithmetic.add_bits(bits('11'), bits('0'), 4)
+    assert type(res) == list and res == bits('0011') and not overflow
+    assert Arithmetic.complement_bits(bits('1'), 4)[0] == bits('1111')
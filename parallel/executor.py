@@ -0,0 +1,199 @@
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict
+
+from alu.adder import adders
+from alu.alu import ALU
+from alu.control_signal import ControlSignal
+from nums.arithmetic import Arithmetic
+from nums.bit_operation import BitOperation
+from nums.bit_vector import BitVector
+from word.word import Word
+from word.word_array import WordArray
+
+# worker process 마다 한 번만 만들어 재사용하는 ALU ( (compiled, cell, adder 이름) 별 )
+_alus: Dict[tuple, ALU] = {}
+
+
+def _alu(options: tuple) -> ALU:
+    if options not in _alus:
+        compiled, cell, adder = options
+        _alus[options] = ALU(compiled=compiled, cell=cell, adder=adders[adder] if adder else None)
+    return _alus[options]
+
+
+def _primitive(name: str) -> Callable:
+    """
+    Arithmetic, BitOperation 의 (a, b, length) 를 받는 함수
+    """
+    for owner in (Arithmetic, BitOperation):
+        func = getattr(owner, name, None)
+        if func is not None:
+            return func
+    raise ValueError('Arithmetic, BitOperation 에 {} 함수가 없음'.format(name))
+
+
+def _alu_shard(options: tuple, code: int, length: int, xs: bytes, ys: bytes) -> bytes:
+    """
+    worker process 에서 packed 값 하나의 shard 를 ALU.func_batch 로 연산
+    compiled 가 아닌 ALU 는 Kernel 대신 Gate 를 통해 연산 ( 'gates' backend )
+    """
+    fmt = WordArray.formats[length]
+    xs, ys = array(fmt, xs), array(fmt, ys)
+    backend = None if options[0] else 'gates'
+    return _alu(options).func_batch(xs, ys, ControlSignal.from_code(code), length, backend).tobytes()
+
+
+def _primitive_shard(name: str, length: int, xs: bytes, ys: bytes) -> bytes:
+    """
+    worker process 에서 packed 값 하나의 shard 를 Bit List 로 바꾸어 Arithmetic, BitOperation 함수로 연산
+    결과가 (Bit List, overflow) 인 경우 Bit List, bool 인 경우 0 또는 1
+    shift 함수 ( lshift_bits, rshift_bits ) 의 ys 는 shift 할 칸 수
+    """
+    fmt = WordArray.formats[length]
+    func = _primitive(name)
+    shift = name.endswith('shift_bits')
+    res = array(fmt)
+    for x, y in zip(array(fmt, xs), array(fmt, ys)):
+        a = BitVector(x, length).to_bits()
+        value = func(a, y if shift else BitVector(y, length).to_bits(), length)
+        if isinstance(value, tuple):
+            value = value[0]
+        if isinstance(value, bool):
+            res.append(value)
+        else:
+            res.append(BitOperation.binary_to_decimal(BitOperation.fit_bits(value, length)))
+    return res.tobytes()
+
+
+class ParallelExecutor:
+    """
+    많은 값의 ALU 연산, Arithmetic / BitOperation 연산을 여러 process 로 나누어 수행
+
+    값들을 chunk 개씩 shard 로 나누어 ProcessPoolExecutor 의 worker 들에 보내고 결과를 원래 순서대로 모음
+    process 사이에는 Bit List 가 아닌 packed 값 ( array 의 bytes ) 만 주고받으므로 pickle 비용이 값의 byte 수에 비례
+    worker 는 ALU 를 한 번만 만들어 재사용하므로 컴파일된 Kernel 도 worker 마다 한 번만 만듦
+    workers 가 1 일 경우 process 를 만들지 않고 현재 process 에서 연산
+    """
+
+    def __init__(self, workers: int = None, chunk: int = None, compiled: bool = True, cell: int = 1,
+                 adder: str = None):
+        """
+        :param workers: worker process 수, 없을 경우 CPU 수
+        :param chunk: shard 하나의 값의 개수, 없을 경우 연산마다 tune 으로 결정
+        :param compiled: worker ALU 의 compiled 여부
+        :param cell: worker ALU 의 cell
+        :param adder: worker ALU 의 덧셈기 이름 ( alu.adder.adders 의 key )
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk = chunk
+        self.options = (compiled, cell, adder)
+        self.target = 0.05
+        self._pool: ProcessPoolExecutor = None
+        self._chunks: Dict[tuple, int] = {}
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        return self._pool
+
+    def tune(self, shard: Callable, args: tuple, count: int, length: int, key: tuple) -> int:
+        """
+        shard 하나의 연산 시간이 target 초 정도가 되는 chunk 크기
+        작은 표본 ( 0이 아닌 고정 seed 의 난수 ) 을 현재 process 에서 연산하여 값 하나의 연산 시간을 측정하고
+        worker 마다 최소 4개의 shard 가 돌아가도록 chunk 크기를 제한 ( 부하 분산 )
+        결과는 연산 ( key ) 별로 저장하여 재사용
+        """
+        if self.chunk:
+            return self.chunk
+        if key not in self._chunks:
+            sample = 64
+            xs, ys = _probe(sample, length, 0), _probe(sample, length, 1)
+            shard(*args, xs, ys)
+            start = time.perf_counter()
+            shard(*args, xs, ys)
+            per_value = max((time.perf_counter() - start) / sample, 1e-9)
+            self._chunks[key] = max(sample, int(self.target / per_value))
+        return max(64, min(self._chunks[key], -(-count // (self.workers * 4))))
+
+    def _run(self, shard: Callable, args: tuple, xs, ys, length: int, key: tuple):
+        if length not in WordArray.formats:
+            raise ValueError('ParallelExecutor 는 {} bit 길이만 지원'.format(sorted(WordArray.formats)))
+        fmt = WordArray.formats[length]
+        xs = _packed(xs, fmt)
+        ys = _packed(ys, fmt) if ys is not None else bytes(len(xs))
+        size = length // 8
+        count = len(xs) // size
+        chunk = self.tune(shard, args, count, length, key) * size
+        shards = [(xs[start:start + chunk], ys[start:start + chunk]) for start in range(0, len(xs), chunk)]
+        if self.workers == 1:
+            results = [shard(*args, x, y) for x, y in shards]
+        else:
+            futures = [self.pool.submit(shard, *args, x, y) for x, y in shards]
+            results = [future.result() for future in futures]
+        return array(fmt, b''.join(results))
+
+    def func(self, xs, ys, control: ControlSignal, length: int = Word.length) -> array:
+        """
+        ALU.func_batch 와 같은 연산을 여러 process 에서 수행
+        :param xs: 연산할 값들 1 (array, numpy 배열, bytes, list 등)
+        :param ys: 연산할 값들 2 (사용하지 않는 연산의 경우 None 가능)
+        :param control: 수행할 연산의 ControlSignal
+        :param length: 연산할 값의 비트 길이
+        :return: 연산 결과 array
+        """
+        args = (self.options, control.code, length)
+        return self._run(_alu_shard, args, xs, ys, length, ('alu', control, length))
+
+    def primitive(self, name: str, xs, ys, length: int = Word.length) -> array:
+        """
+        Arithmetic, BitOperation 의 name 함수 ( add_bits, mul_bits, xor_bits, eq_bits 등 ) 를
+        값마다 Bit List 로 바꾸어 여러 process 에서 수행
+        :param name: Arithmetic, BitOperation 의 (a, b, length) 를 받는 함수 이름
+        :param xs: 연산할 값들 1
+        :param ys: 연산할 값들 2 ( shift 함수의 경우 shift 할 칸 수 )
+        :param length: 연산할 값의 비트 길이
+        :return: 연산 결과 array
+        """
+        _primitive(name)
+        return self._run(_primitive_shard, (name, length), xs, ys, length, ('primitive', name, length))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _probe(count: int, length: int, seed: int) -> bytes:
+    """
+    chunk 크기 측정에 사용할 length bit 값 count 개
+    0 으로 나누거나 덧셈이 일찍 끝나지 않도록 최하위 비트가 1인 난수
+    """
+    rand = random.Random(seed)
+    return _packed([rand.getrandbits(length) | 1 for _ in range(count)], WordArray.formats[length])
+
+
+def _packed(values, fmt: str) -> bytes:
+    """
+    값들을 fmt 형식의 native byte order bytes 로 변환
+    같은 형식의 array, numpy 배열, bytes 는 값마다 변환하지 않고 buffer 를 그대로 복사
+    """
+    if isinstance(values, (bytes, bytearray)):
+        return bytes(values)
+    if isinstance(values, array) and values.typecode == fmt:
+        return values.tobytes()
+    if hasattr(values, 'dtype') and hasattr(values, 'tobytes'):
+        if values.dtype.itemsize == array(fmt).itemsize and values.dtype.kind == 'u':
+            return values.tobytes()
+        values = values.tolist()
+    return array(fmt, values).tobytes()
@@ -0,0 +1,51 @@
+import random
+from array import array
+
+import pytest
+from alu.control_signal import ControlSignal
+from parallel.executor import ParallelExecutor
+
+MASK = 0xffffffff
+
+
+def test_executor_func():
+    rand = random.Random(3)
+    xs = array('I', [rand.getrandbits(32) for _ in range(1000)])
+    ys = array('I', [rand.getrandbits(32) for _ in range(1000)])
+    with ParallelExecutor(workers=2, chunk=150) as executor:
+        assert executor.func(xs, ys, ControlSignal.ADD).tolist() == [(x + y) & MASK for x, y in zip(xs, ys)]
+        assert executor.func(xs, None, ControlSignal.NOT).tolist() == [~x & MASK for x in xs]
+        assert executor.func([250, 7], [10, 3], ControlSignal.MUL, length=8).tolist() == [196, 21]
+    with ParallelExecutor(workers=1, compiled=False) as executor:
+        assert executor.func(xs[:20], ys[:20], ControlSignal.XOR).tolist() == [x ^ y for x, y in zip(xs[:20], ys[:20])]
+    with pytest.raises(ValueError):
+        ParallelExecutor(workers=1).func([1], [2], ControlSignal.ADD, length=12)
+
+
+def test_executor_primitive():
+    rand = random.Random(5)
+    xs = [rand.getrandbits(16) for _ in range(300)]
+    ys = [rand.getrandbits(16) for _ in range(300)]
+    with ParallelExecutor(workers=2) as executor:
+        assert executor.primitive('add_bits', xs, ys, 16).tolist() == [(x + y) & 0xffff for x, y in zip(xs, ys)]
+        assert executor.primitive('xor_bits', xs, ys, 16).tolist() == [x ^ y for x, y in zip(xs, ys)]
+        assert executor.primitive('le_bits', xs, ys, 16).tolist() == [int(x <= y) for x, y in zip(xs, ys)]
+        assert executor.primitive('lshift_bits', xs, [3] * 300, 16).tolist() == [x << 3 & 0xffff for x in xs]
+        with pytest.raises(ValueError):
+            executor.primitive('missing_bits', xs, ys, 16)
+    # chunk 크기를 측정하는 표본도 0으로 나누지 않음
+    assert ParallelExecutor(workers=1).primitive('div_bits', [100, 7], [3, 2], 16).tolist() == [33, 3]
+
+
+def test_executor_tune():
+    executor = ParallelExecutor(workers=4)
+    executor.target = 1.0
+    xs = list(range(100000))
+    chunk = executor.tune(*_alu_args(executor, ControlSignal.ADD), count=len(xs), length=32, key=('alu', 'ADD'))
+    assert chunk == 100000 // 16
+    assert executor.tune(*_alu_args(executor, ControlSignal.ADD), count=100, length=32, key=('alu', 'ADD')) == 64
+
+
+def _alu_args(executor: ParallelExecutor, control: ControlSignal) -> tuple:
+    from parallel.executor import _alu_shard
+    return _alu_shard, (executor.options, control.code, 32)
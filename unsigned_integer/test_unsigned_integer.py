@@ -93,3 +93,18 @@ def test_unsigned_integer_min_value2():
     bits = UnsignedInteger.min_value().bits
     for bit in bits:
         assert bit == Bit(False)
+
+
+def test_unsigned_integer_bytes():
+    assert UnsignedInteger('4294967295').to_bytes() == b'\xff\xff\xff\xff'
+    assert UnsignedInteger('258').to_bytes('little') == b'\x02\x01\x00\x00'
+    assert UnsignedInteger.from_bytes(b'\x00\x00\x01\x02').val() == 258
+
+
+def test_unsigned_integer_divmod():
+    quotient, remain = divmod(UnsignedInteger.max_value(), UnsignedInteger('7'))
+    assert (quotient.val(), remain.val()) == divmod(4294967295, 7)
+    assert UnsignedInteger('20') // UnsignedInteger('6') == UnsignedInteger('3')
+    assert UnsignedInteger('20') % UnsignedInteger('6') == UnsignedInteger('2')
+    with pytest.raises(ZeroDivisionError):
+        UnsignedInteger('6') // UnsignedInteger('0')
@@ -1,6 +1,7 @@
 from bit.bit import Bit
 from nums.arithmetic import Arithmetic
 from nums.bit_operation import BitOperation
+from nums.bit_vector import BitVector
 
 
 class UnsignedInteger:
@@ -24,7 +25,7 @@ class UnsignedInteger:
         if type(bits) == str:
             res = self.str_to_unsigned_int(bits)
             self.bits = res.bits
-        elif type(bits) == list:
+        elif isinstance(bits, (list, BitVector)):
             self.bits = bits
         else:
             self.bits = BitOperation.empty_bits(self.field_len)
@@ -91,6 +92,24 @@ class UnsignedInteger:
         """
         return BitOperation.binary_to_decimal(self.bits)
 
+    def to_bytes(self, byteorder: str = 'big') -> bytes:
+        """
+        field 를 bit_len 비트의 bytes 로 변환
+        :param byteorder: 'big' 또는 'little'
+        :return: bit_len // 8 byte 의 bytes
+        """
+        return BitOperation.bits_to_bytes(self.bits, byteorder)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, byteorder: str = 'big') -> "UnsignedInteger":
+        """
+        to_bytes 로 변환한 bytes 를 UnsignedInteger 로 읽음
+        :param data: bit_len // 8 byte 의 bytes
+        :param byteorder: 'big' 또는 'little'
+        :return: UnsignedInteger 객체
+        """
+        return UnsignedInteger(BitOperation.bytes_to_bits(data, cls.field_len, byteorder))
+
     def __str__(self) -> str:
         return str(self.val())
 
@@ -148,6 +167,34 @@ class UnsignedInteger:
         """
         return UnsignedInteger(Arithmetic.div_bits(self.bits, other.bits, self.field_len))
 
+    def __divmod__(self, other: "UnsignedInteger") -> ("UnsignedInteger", "UnsignedInteger"):
+        """
+        divmod 연산을 위한 operator overloading
+        Arithmetic.divmod_bits 로 몫과 나머지를 한 번의 나눗셈으로 구함
+        :param other: UnsignedInteger 타입 가정
+        :return: 새로운 UnsignedInteger 객체의 몫, 나머지
+        """
+        quotient, remain = Arithmetic.divmod_bits(self.bits, other.bits, self.field_len)
+        return UnsignedInteger(quotient), UnsignedInteger(remain)
+
+    def __floordiv__(self, other: "UnsignedInteger") -> "UnsignedInteger":
+        """
+        Floor Div 연산 ( // )을 위한 operator overloading
+        :param other: UnsignedInteger 타입 가정
+        :return: 새로운 UnsignedInteger 객체로 return
+        """
+        quotient, _ = divmod(self, other)
+        return quotient
+
+    def __mod__(self, other: "UnsignedInteger") -> "UnsignedInteger":
+        """
+        Mod 연산 ( % )을 위한 operator overloading
+        :param other: UnsignedInteger 타입 가정
+        :return: 새로운 UnsignedInteger 객체로 return
+        """
+        _, remain = divmod(self, other)
+        return remain
+
     def __le__(self, other: "UnsignedInteger") -> bool:
         """
         Low Equal 연산 ( <= )을 위한 operator overloading
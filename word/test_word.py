@@ -0,0 +1,64 @@
+import pytest
+
+from bit.bit import Bit
+from word.word import Word, BitWord, Word8, Word128
+
+
+def test_word_init():
+    word = Word(5)
+    assert word.value == 5
+    assert word.lsb() == Bit(True)
+    assert word.msb() == Bit()
+    assert Word([Bit(True), Bit(), Bit(True)]).value == 5
+
+
+def test_word_setitem():
+    word = Word()
+    word[0] = Bit(True)
+    word[-1] = Bit(True)
+    assert word.value == 2**31 + 1
+    word[0] = Bit()
+    assert word.value == 1
+
+
+def test_word_width():
+    assert Word.of_width(8) is Word8
+    assert Word8(0x1ff).value == 0xff
+    assert len(Word128().bit_list) == 128
+    assert Word128(-1).msb() == Bit(True)
+
+
+def test_bit_word():
+    word = BitWord(Word(6).bit_list)
+    assert word.length == 32
+    assert word.value == 6
+    assert word == Word(6)
+    assert word.new(3).value == 3
+
+
+def test_word_array():
+    from array import array
+    from word.word_array import WordArray
+
+    buffer = array('I', [1, 2, 0xffffffff])
+    words = WordArray(buffer)
+    assert len(words) == 3
+    assert words[2].value == 0xffffffff
+    assert words[-1].lsb() == Bit(True)
+    words[0][0] = Bit(True)
+    assert buffer[0] == 2**31 + 1
+    assert [word.value for word in words[1:]] == [2, 0xffffffff]
+    assert [word.value for word in words[1::1]] == [2, 0xffffffff]
+    with pytest.raises(ValueError):
+        words[::2]
+
+
+def test_word_array_bytes():
+    from word.word_array import WordArray
+
+    buffer = bytearray(8)
+    words = WordArray(buffer, 16)
+    words[3] = Word.of_width(16)(0xabcd)
+    assert len(words) == 4
+    assert words[3].value == 0xabcd
+    assert buffer != bytearray(8)
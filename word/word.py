@@ -1,23 +1,173 @@
-from typing import List
+from typing import Dict, List
+
 from bit.bit import Bit
 
+_BITS = (Bit.ZERO, Bit.ONE)
+
 
 class Word:
+    """
+    Word의 메모리 구조
+    +-------------------------------------------------------------------------------------+
+    |                                  bits (length bit)                                  |
+    +-------------------------------------------------------------------------------------+
+
+    ALU 의 연산 단위인 length bit 의 값
+    Bit 객체 length 개 대신 int 하나에 비트를 저장하고 index 0 이 MSB, index -1 이 LSB
+
+    길이는 class 의 length 값으로 정해지며 기본 Word 는 32 bit
+    다른 길이의 Word 는 Word.of_width 를 통해 생성 (Word8, Word16, Word64, Word128)
+    """
+    __slots__ = ('value',)
+
     length = 32
+    packed = True
+    _widths: Dict[int, type] = {}
+
+    def __init__(self, bit_list: List[Bit] or int = None):
+        if type(bit_list) == int:
+            self.value = bit_list & ((1 << self.length) - 1)
+        elif bit_list:
+            value = 0
+            for bit in bit_list[-self.length:]:
+                value <<= 1
+                if bit:
+                    value |= 1
+            self.value = value
+        else:
+            self.value = 0
+
+    @classmethod
+    def of_width(cls, length: int) -> type:
+        """
+        length bit 길이의 Word class
+        같은 길이에 대해서는 같은 class 를 return
+        :param length: Word 의 비트 길이
+        :return: length bit 길이의 Word class
+        """
+        if length == Word.length:
+            return Word
+        if length not in Word._widths:
+            Word._widths[length] = type('Word{}'.format(length), (Word,), {'__slots__': (), 'length': length})
+        return Word._widths[length]
+
+    def new(self, bit_list: List[Bit] or int = None) -> "Word":
+        """
+        같은 종류, 같은 길이의 새로운 Word
+        연산 결과를 입력과 같은 종류의 Word 로 만들기 위해 사용
+        :param bit_list: 새 Word 의 Bit List 또는 int 값, 없을 경우 0
+        :return: 새로운 Word 객체
+        """
+        return self.__class__(bit_list)
+
+    def mask(self) -> int:
+        """
+        length 길이의 모든 비트가 1인 int 값
+        """
+        return (1 << self.length) - 1
+
+    @property
+    def bit_list(self) -> List[Bit]:
+        value = self.value
+        return [_BITS[value >> i & 1] for i in range(self.length - 1, -1, -1)]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __getitem__(self, item: int or slice) -> Bit or List[Bit]:
+        if isinstance(item, slice):
+            return self.bit_list[item]
+        if item < 0:
+            item += self.length
+        if not 0 <= item < self.length:
+            raise IndexError('Word index out of range')
+        return _BITS[self.value >> (self.length - 1 - item) & 1]
+
+    def __setitem__(self, key: int, value: Bit):
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError('Word index out of range')
+        frame = 1 << (self.length - 1 - key)
+        if value is Bit.ONE:
+            self.value |= frame
+        elif value is Bit.ZERO:
+            self.value &= ~frame
+        else:
+            raise TypeError('Word 에는 Bit 만 저장할 수 있음, 다른 비트 객체는 BitWord 를 사용')
+
+    def __eq__(self, other: "Word") -> bool:
+        if not isinstance(other, Word):
+            return NotImplemented
+        if self.length != other.length:
+            return False
+        if self.packed and other.packed:
+            return self.value == other.value
+        return self.bit_list == other.bit_list
+
+    __hash__ = None
 
-    def __init__(self, bit_list: List[Bit] = None):
+    def __str__(self) -> str:
+        return ''.join(str(bit) for bit in self.bit_list)
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(self.__class__.__name__, self.__str__())
+
+    def msb(self):
+        return self[0]
+
+    def lsb(self):
+        return self[-1]
+
+
+class BitWord(Word):
+    """
+    비트를 객체 List 로 저장하는 Word
+
+    Bit 뿐만 아니라 BitSlice 등 Gate 에 전달할 수 있는 모든 비트 객체를 저장할 수 있음
+    Gate 수준의 연산을 그대로 수행해야 하는 경우 ( bit-slicing 등 ) 사용
+    """
+    __slots__ = ('bit_list', 'length')
+
+    packed = False
+
+    def __init__(self, bit_list: list = None, length: int = Word.length):
         if not bit_list:
-            bit_list = [Bit() for _ in range(self.length)]
+            bit_list = [Bit() for _ in range(length)]
         self.bit_list = bit_list
+        self.length = len(bit_list)
+
+    def new(self, bit_list: list or int = None) -> "BitWord":
+        if type(bit_list) == int:
+            bit_list = Word.of_width(self.length)(bit_list).bit_list
+        return BitWord(bit_list, self.length)
+
+    @property
+    def value(self) -> int:
+        value = 0
+        for bit in self.bit_list:
+            value = value << 1 | bool(bit)
+        return value
 
-    def __getitem__(self, item: int) -> "Bit":
+    @value.setter
+    def value(self, value: int):
+        """
+        int 값의 하위 length bit 로 bit_list 를 다시 씀 ( 같은 List 객체를 유지 )
+        """
+        self.bit_list[:] = [_BITS[value >> i & 1] for i in range(self.length - 1, -1, -1)]
+
+    def __getitem__(self, item: int or slice):
         return self.bit_list[item]
 
-    def __setitem__(self, key: int, value: Bit):
+    def __setitem__(self, key: int, value):
         self.bit_list[key] = value
 
-    def msb(self):
-        return self.bit_list[0]
 
-    def lsb(self):
-        return self.bit_list[-1]
+Word8 = Word.of_width(8)
+Word16 = Word.of_width(16)
+Word32 = Word
+Word64 = Word.of_width(64)
+Word128 = Word.of_width(128)
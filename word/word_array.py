@@ -0,0 +1,99 @@
+from typing import Iterator
+
+from word.word import Word
+
+
+class WordView(Word):
+    """
+    WordArray 의 한 원소를 가리키는 Word
+
+    값을 복사하지 않고 buffer 를 직접 읽고 쓰므로
+    Word 와 같이 사용하면서 값을 변경하면 buffer 의 값이 바로 변경됨
+    연산 결과 ( new ) 는 buffer 와 관계 없는 일반 Word 로 만듦
+    """
+    __slots__ = ('items', 'index', 'length')
+
+    def __init__(self, items: memoryview, index: int, length: int):
+        self.items = items
+        self.index = index
+        self.length = length
+
+    @property
+    def value(self) -> int:
+        return self.items[self.index]
+
+    @value.setter
+    def value(self, val: int):
+        self.items[self.index] = val & ((1 << self.length) - 1)
+
+    def new(self, bit_list: list or int = None) -> Word:
+        return Word.of_width(self.length)(bit_list)
+
+
+class WordArray:
+    """
+    연속된 메모리 ( bytearray, memoryview, mmap 등 ) 에 저장된 Word 값들의 배열
+
+    length bit 의 값이 native byte order 로 빈틈없이 저장된 buffer 를 복사하지 않고 사용
+    각 원소는 buffer 를 직접 가리키는 WordView 로 접근
+    """
+    formats = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
+
+    def __init__(self, buffer, length: int = Word.length):
+        if length not in self.formats:
+            raise ValueError('WordArray 는 {} bit 길이만 지원'.format(sorted(self.formats)))
+        items = memoryview(buffer)
+        if items.format != self.formats[length]:
+            if items.format != 'B' or items.ndim != 1:
+                items = items.cast('B')
+            items = items.cast(self.formats[length])
+        self.items: memoryview = items
+        self.length = length
+
+    @classmethod
+    def zeros(cls, count: int, length: int = Word.length) -> "WordArray":
+        """
+        모든 값이 0인 count 개의 Word 를 저장하는 WordArray
+        :param count: Word 의 개수
+        :param length: Word 의 비트 길이
+        :return: 새로운 bytearray 를 사용하는 WordArray
+        """
+        return cls(bytearray(count * length // 8), length)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, item: int or slice) -> WordView or "WordArray":
+        """
+        int index 는 해당 원소의 WordView, slice 는 같은 buffer 를 가리키는 WordArray 로 return
+        연속된 buffer 만 가리킬 수 있으므로 step 이 1 이 아닌 slice 는 ValueError
+        """
+        if isinstance(item, slice):
+            if item.step not in (None, 1):
+                raise ValueError('WordArray slice 는 step 을 지원하지 않음')
+            return WordArray(self.items[item], self.length)
+        if item < 0:
+            item += len(self.items)
+        if not 0 <= item < len(self.items):
+            raise IndexError('WordArray index out of range')
+        return WordView(self.items, item, self.length)
+
+    def __setitem__(self, key: int, value: Word or int):
+        self.items[key] = int(value) & ((1 << self.length) - 1)
+
+    def __iter__(self) -> Iterator[WordView]:
+        for i in range(len(self.items)):
+            yield WordView(self.items, i, self.length)
+
+    def release(self):
+        """
+        buffer 의 참조를 해제
+        mmap 을 닫기 전에 호출해야 함
+        """
+        self.items.release()
+
+    def __enter__(self) -> "WordArray":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()